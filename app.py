@@ -3,10 +3,30 @@ Application
 ===========
 """
 
+from __future__ import annotations
+
+import hashlib
 import os
+import pkgutil
+import re
+import typing
 
 import dash
-from flask import Flask
+from dash.fingerprint import build_fingerprint, check_fingerprint
+from flask import Flask, g, make_response, request
+
+from apps.assets import (
+    compress_asset,
+    immutable_response,
+    localise_assets,
+    read_manifest,
+    split_assets,
+)
+from apps.tracing import SPAN_KIND_SERVER, TRACER, traced
+
+if typing.TYPE_CHECKING:
+    from colour.hints import Any, Callable, Dict, List, Mapping
+    from flask import Response
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2018 Colour Developers"
@@ -22,7 +42,16 @@ __minor_version__ = "2"
 __change_version__ = "8"
 __version__ = f"{__major_version__}.{__minor_version__}.{__change_version__}"
 
-__all__ = ["SERVER", "SERVER_URL", "APP"]
+__all__ = [
+    "SERVER",
+    "SERVER_URL",
+    "MAX_CONTENT_LENGTH",
+    "PRERENDER",
+    "PRERENDERERS",
+    "ASSETS_MANIFEST",
+    "Dash",
+    "APP",
+]
 
 SERVER: Flask = Flask(__name__)
 """
@@ -34,10 +63,239 @@ SERVER_URL: str | None = os.environ.get("COLOUR_DASH_SERVER")
 Server url used to construct permanent links for the individual apps.
 """
 
-APP: dash.Dash = dash.Dash(
+MAX_CONTENT_LENGTH: int = int(
+    os.environ.get("COLOUR_DASH_MAX_CONTENT_LENGTH", str(256 * 1024**2))
+)
+"""
+Maximum size in bytes of a request body, e.g., an image posted to the image
+conversion endpoint, the larger requests are rejected with a *413* status.
+"""
+
+SERVER.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH
+
+PRERENDER: bool = os.environ.get("COLOUR_DASH_PRERENDER", "1") != "0"
+"""
+Whether to pre-render the permanent links of the apps so that their output is
+painted before the *Dash* renderer loads.
+"""
+
+PRERENDERERS: Dict[str, Callable[[Mapping[str, str]], str | None]] = {}
+"""
+Pre-renderers of the apps keyed by app path, they return the *HTML* of the app
+for given URL query or *None* if it cannot be pre-rendered.
+"""
+
+ASSETS_MANIFEST: Dict[str, str] = read_manifest()
+"""
+Manifest of the bundled stylesheets and scripts, i.e., their fingerprinted
+filenames keyed by url, they are served from their url if not bundled.
+"""
+
+_PATTERN_PRELOAD: re.Pattern = re.compile(
+    r'<(?:script src|link rel="stylesheet" href)="(/[^"]+)"'
+)
+"""
+Pattern matching the local scripts and stylesheets of the index *HTML*.
+"""
+
+
+class Dash(dash.Dash):
+    """
+    Define a :class:`dash.Dash` class sub-class pre-rendering the permanent
+    links of the apps registered in :attr:`app.PRERENDERERS` attribute.
+
+    The pre-rendered *HTML* is inserted into the *React* entry point and is
+    replaced by the app layout once the *Dash* renderer has loaded.
+
+    The server-side callbacks are traced as spans when the tracing is enabled
+    with the *COLOUR_DASH_TRACING* environment variable.
+
+    The component suites are fingerprinted with the hash of their content
+    rather than their modification time so that their urls are stable across
+    the deployments and the hosts, and are served compressed and immutable.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._fingerprints: Dict[str, str] = {}
+        self._compressed: Dict[str, bytes | None] = {}
+
+    def callback(self, *args: Any, **kwargs: Any) -> Callable:
+        """
+        Return the decorator registering a server-side callback, tracing its
+        calls as spans.
+
+        Other Parameters
+        ----------------
+        args
+            Arguments for :meth:`dash.Dash.callback` method.
+        kwargs
+            Keywords arguments for :meth:`dash.Dash.callback` method.
+
+        Returns
+        -------
+        Callable
+            Decorator.
+        """
+
+        decorator = super().callback(*args, **kwargs)
+
+        def wrapper(function: Callable) -> Callable:
+            """Register given callback."""
+
+            return decorator(traced()(function))
+
+        return wrapper
+
+    def interpolate_index(self, **kwargs: Any) -> str:
+        """
+        Interpolate the index *HTML* with the pre-rendered app if any.
+
+        Other Parameters
+        ----------------
+        kwargs
+            Keywords arguments for :meth:`dash.Dash.interpolate_index` method.
+
+        Returns
+        -------
+        :class:`str`
+            Index *HTML*.
+        """
+
+        prerenderer = PRERENDERERS.get(request.path) if PRERENDER else None
+
+        if prerenderer is not None:
+            html = prerenderer(request.args.to_dict())
+
+            if html is not None:
+                kwargs["app_entry"] = f'<div id="react-entry-point">{html}</div>'
+
+        return super().interpolate_index(**kwargs)
+
+    def index(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Return the index response, with the preload hints of its local scripts
+        and stylesheets so that they can be fetched before the *HTML* is
+        parsed, e.g., with *103 Early Hints*.
+
+        Other Parameters
+        ----------------
+        args
+            Arguments for :meth:`dash.Dash.index` method.
+        kwargs
+            Keywords arguments for :meth:`dash.Dash.index` method.
+
+        Returns
+        -------
+        :class:`flask.Response`
+            Index response.
+        """
+
+        html = super().index(*args, **kwargs)
+        response = make_response(html)
+
+        links = [
+            f"<{url}>; rel=preload; as={'style' if url.endswith('.css') else 'script'}"
+            for url in dict.fromkeys(_PATTERN_PRELOAD.findall(html))
+        ]
+        if links:
+            response.headers["Link"] = ", ".join(links)
+
+        return response
+
+    def _fingerprint_content(self, src: str) -> str:
+        """
+        Fingerprint given component suite url with the hash of its content.
+        """
+
+        fingerprint = self._fingerprints.get(src)
+        if fingerprint is not None:
+            return fingerprint
+
+        prefix = f"{self.config.requests_pathname_prefix}_dash-component-suites/"
+        namespace, _separator, fingerprinted_path = src[len(prefix) :].partition("/")
+        path, has_fingerprint = check_fingerprint(fingerprinted_path)
+        data = pkgutil.get_data(namespace, path) if has_fingerprint else None
+
+        if data is None:
+            fingerprint = src
+        else:
+            version = fingerprinted_path.split("/")[-1].split(".")[1]
+            fingerprint = prefix + "/".join(
+                [
+                    namespace,
+                    build_fingerprint(
+                        path,
+                        version[1:].rsplit("m", 1)[0],
+                        hashlib.blake2b(data, digest_size=8).hexdigest(),
+                    ),
+                ]
+            )
+
+        self._fingerprints[src] = fingerprint
+
+        return fingerprint
+
+    def _collect_and_register_resources(
+        self, resources: List[dict], include_async: bool = True
+    ) -> List[str | dict]:
+        """
+        Collect and register given resources, fingerprinting the component
+        suites with the hash of their content.
+        """
+
+        prefix = f"{self.config.requests_pathname_prefix}_dash-component-suites/"
+
+        return [
+            self._fingerprint_content(src)
+            if isinstance(src, str) and src.startswith(prefix)
+            else src
+            for src in super()._collect_and_register_resources(
+                resources, include_async
+            )
+        ]
+
+    def serve_component_suites(
+        self, package_name: str, fingerprinted_path: str
+    ) -> Response:
+        """
+        Serve given component suite, the fingerprinted ones are served
+        compressed and immutable.
+
+        Parameters
+        ----------
+        package_name
+            Package name of the component suite.
+        fingerprinted_path
+            Path of the component suite in the package.
+
+        Returns
+        -------
+        :class:`flask.Response`
+            Component suite response.
+        """
+
+        response = super().serve_component_suites(package_name, fingerprinted_path)
+
+        if not check_fingerprint(fingerprinted_path)[1]:
+            return response
+
+        key = f"{package_name}/{fingerprinted_path}"
+        if key not in self._compressed:
+            self._compressed[key] = compress_asset(response.get_data())
+
+        return immutable_response(response, self._compressed[key])
+
+
+APP: Dash = Dash(
     __application_name__,
-    external_scripts=os.environ.get("COLOUR_DASH_JS", "").split(","),  # pyright: ignore
-    external_stylesheets=os.environ.get("COLOUR_DASH_CSS", "").split(","),  # pyright: ignore
+    external_scripts=localise_assets(
+        split_assets(os.environ.get("COLOUR_DASH_JS")), ASSETS_MANIFEST
+    ),
+    external_stylesheets=localise_assets(
+        split_assets(os.environ.get("COLOUR_DASH_CSS")), ASSETS_MANIFEST
+    ),
     server=SERVER,
 )
 """
@@ -45,3 +303,44 @@ APP: dash.Dash = dash.Dash(
 """
 
 APP.config["suppress_callback_exceptions"] = True
+
+if TRACER is not None:
+
+    @SERVER.before_request
+    def _start_request_span() -> None:
+        """
+        Start the root span of the request, e.g., the *Dash* dispatch.
+        """
+
+        span = TRACER.span(  # pyright: ignore
+            f"{request.method} {request.path}",
+            root=True,
+            traceparent=request.headers.get("traceparent"),
+            kind=SPAN_KIND_SERVER,
+            **{"http.request.method": request.method, "url.path": request.path},
+        )
+        g.span = span.__enter__()
+
+    @SERVER.after_request
+    def _set_response_span_attributes(response: Response) -> Response:
+        """
+        Set the response attributes of the root span of the request.
+        """
+
+        span = g.get("span")
+
+        if span is not None:
+            span.set_attribute("http.response.status_code", response.status_code)
+
+        return response
+
+    @SERVER.teardown_request
+    def _end_request_span(error: BaseException | None) -> None:
+        """
+        End the root span of the request.
+        """
+
+        span = g.pop("span", None)
+
+        if span is not None:
+            span.__exit__(type(error) if error else None, error, None)
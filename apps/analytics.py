@@ -0,0 +1,471 @@
+"""
+Analytics
+=========
+
+Records the states requested to the apps into fixed-memory streaming sketches
+so that the popular states can drive the cache sizing and precomputation:
+
+-   :class:`apps.analytics.SketchSpaceSaving`
+-   :class:`apps.analytics.Analytics`
+
+The sketches of each process are periodically merged into the file given by
+the *COLOUR_DASH_ANALYTICS_PATH* environment variable, shared by the
+*gunicorn* workers and surviving the restarts.
+"""
+
+from __future__ import annotations
+
+import atexit
+import fcntl
+import heapq
+import json
+import os
+import tempfile
+import threading
+import time
+import typing
+from contextlib import suppress
+
+if typing.TYPE_CHECKING:
+    from colour.hints import Dict, List, Mapping
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "ANALYTICS_PATH",
+    "ANALYTICS_CAPACITY",
+    "ANALYTICS_INTERVAL",
+    "SketchSpaceSaving",
+    "Analytics",
+    "ANALYTICS",
+]
+
+ANALYTICS_PATH: str | None = os.environ.get("COLOUR_DASH_ANALYTICS_PATH")
+"""
+Path of the file the sketches are saved into, the sketches are only kept in
+memory if *None*.
+"""
+
+ANALYTICS_CAPACITY: int = int(os.environ.get("COLOUR_DASH_ANALYTICS_CAPACITY", "1024"))
+"""
+Number of counters of the sketches, i.e., the number of distinct states
+tracked by each app.
+"""
+
+ANALYTICS_INTERVAL: float = 60
+"""
+Interval in seconds between the merges of the sketches of a process into the
+analytics file.
+"""
+
+
+class SketchSpaceSaving:
+    """
+    Define a *Space-Saving* sketch, as described by *Metwally et al. (2005)*,
+    estimating the most frequent keys of a stream with a fixed number of
+    counters.
+
+    When all the counters are used, the key with the minimum count is replaced
+    by the new key whose count starts from that minimum, which is kept as its
+    maximum overestimation. Any key whose frequency is greater than the total
+    count divided by the capacity is guaranteed to be tracked.
+
+    The key with the minimum count is found with a min-heap of the counters
+    whose entries are updated lazily, i.e., an entry is only updated when it
+    reaches the top of the heap, the cost of adding a key is thus logarithmic
+    in the capacity, amortised.
+
+    Parameters
+    ----------
+    capacity
+        Number of counters.
+
+    Attributes
+    ----------
+    -   :attr:`~apps.analytics.SketchSpaceSaving.capacity`
+    -   :attr:`~apps.analytics.SketchSpaceSaving.total`
+
+    Methods
+    -------
+    -   :meth:`~apps.analytics.SketchSpaceSaving.add`
+    -   :meth:`~apps.analytics.SketchSpaceSaving.merge`
+    -   :meth:`~apps.analytics.SketchSpaceSaving.top`
+    -   :meth:`~apps.analytics.SketchSpaceSaving.to_dict`
+    -   :meth:`~apps.analytics.SketchSpaceSaving.from_dict`
+    """
+
+    def __init__(self, capacity: int = ANALYTICS_CAPACITY) -> None:
+        self._capacity = capacity
+        self._total = 0
+        self._counters: Dict[str, List[int]] = {}
+        self._heap: List[tuple] = []
+
+    @property
+    def capacity(self) -> int:
+        """
+        Getter property for the number of counters.
+
+        Returns
+        -------
+        :class:`int`
+            Number of counters.
+        """
+
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """
+        Getter property for the total count of the stream.
+
+        Returns
+        -------
+        :class:`int`
+            Total count.
+        """
+
+        return self._total
+
+    def __len__(self) -> int:
+        """
+        Return the number of tracked keys.
+
+        Returns
+        -------
+        :class:`int`
+            Number of tracked keys.
+        """
+
+        return len(self._counters)
+
+    def add(self, key: str, count: int = 1) -> None:
+        """
+        Add given key occurrences to the sketch.
+
+        Parameters
+        ----------
+        key
+            Key to add.
+        count
+            Number of occurrences.
+        """
+
+        self._total += count
+
+        counter = self._counters.get(key)
+        if counter is not None:
+            counter[0] += count
+
+            return
+
+        if len(self._counters) < self._capacity:
+            self._counters[key] = [count, 0]
+            heapq.heappush(self._heap, (count, key))
+
+            return
+
+        # The counts only increase, an entry whose count is lower than the
+        # count of its key is pushed back until the top of the heap is exact.
+        minimum, key_minimum = self._heap[0]
+        while minimum != self._counters[key_minimum][0]:
+            heapq.heapreplace(self._heap, (self._counters[key_minimum][0], key_minimum))
+            minimum, key_minimum = self._heap[0]
+
+        del self._counters[key_minimum]
+        self._counters[key] = [minimum + count, minimum]
+        heapq.heapreplace(self._heap, (minimum + count, key))
+
+    def _heapify(self) -> None:
+        """
+        Rebuild the min-heap of the counters.
+        """
+
+        self._heap = [(count, key) for key, (count, _error) in self._counters.items()]
+        heapq.heapify(self._heap)
+
+    def _minimum(self) -> int:
+        """
+        Return the count bounding the counts of the untracked keys.
+        """
+
+        if len(self._counters) < self._capacity:
+            return 0
+
+        return min(count for count, _error in self._counters.values())
+
+    def merge(self, other: SketchSpaceSaving) -> None:
+        """
+        Merge given sketch into the sketch.
+
+        The counts of the keys are summed, a key missing from a full sketch is
+        counted with the minimum count of that sketch, and the keys with the
+        greatest counts are kept, as described by *Agarwal et al. (2013)*.
+
+        Parameters
+        ----------
+        other
+            Sketch to merge.
+        """
+
+        minimum_self, minimum_other = self._minimum(), other._minimum()
+
+        counters = {}
+        for key in self._counters.keys() | other._counters.keys():
+            count_self, error_self = self._counters.get(
+                key, [minimum_self, minimum_self]
+            )
+            count_other, error_other = other._counters.get(
+                key, [minimum_other, minimum_other]
+            )
+            counters[key] = [count_self + count_other, error_self + error_other]
+
+        self._total += other.total
+        self._counters = dict(
+            sorted(counters.items(), key=lambda item: item[1][0], reverse=True)[
+                : self._capacity
+            ]
+        )
+        self._heapify()
+
+    def top(self, k: int | None = None) -> List[tuple]:
+        """
+        Return the given number of most frequent keys.
+
+        Parameters
+        ----------
+        k
+            Number of keys, every tracked key is returned if *None*.
+
+        Returns
+        -------
+        :class:`list`
+            Keys, estimated counts and maximum overestimations of the counts,
+            sorted by decreasing count.
+        """
+
+        return [
+            (key, count, error)
+            for key, (count, error) in sorted(
+                self._counters.items(), key=lambda item: item[1][0], reverse=True
+            )[:k]
+        ]
+
+    def to_dict(self) -> Dict:
+        """
+        Return the sketch as a *JSON* serialisable :class:`dict` class
+        instance.
+
+        Returns
+        -------
+        :class:`dict`
+            Sketch.
+        """
+
+        return {
+            "capacity": self._capacity,
+            "total": self._total,
+            "counters": self._counters,
+        }
+
+    @staticmethod
+    def from_dict(data: Mapping) -> SketchSpaceSaving:
+        """
+        Return the sketch from given :class:`dict` class instance.
+
+        Parameters
+        ----------
+        data
+            Sketch as returned by the
+            :meth:`apps.analytics.SketchSpaceSaving.to_dict` method.
+
+        Returns
+        -------
+        :class:`apps.analytics.SketchSpaceSaving`
+            Sketch.
+        """
+
+        sketch = SketchSpaceSaving(data["capacity"])
+        sketch._total = data["total"]
+        sketch._counters = {
+            key: list(counter) for key, counter in data["counters"].items()
+        }
+        sketch._heapify()
+
+        return sketch
+
+
+class Analytics:
+    """
+    Record the states requested to the apps into a sketch per app.
+
+    The sketches record the states of the current process since their last
+    merge into the analytics file, which happens at most every given interval
+    when recording a state, without waiting if another process is merging,
+    and when the process exits.
+
+    Parameters
+    ----------
+    path
+        Path of the analytics file, the sketches are only kept in memory if
+        *None*.
+    capacity
+        Number of counters of the sketches.
+    interval
+        Interval in seconds between the merges into the analytics file.
+
+    Methods
+    -------
+    -   :meth:`~apps.analytics.Analytics.record`
+    -   :meth:`~apps.analytics.Analytics.save`
+    -   :meth:`~apps.analytics.Analytics.sketches`
+    """
+
+    def __init__(
+        self,
+        path: str | None = ANALYTICS_PATH,
+        capacity: int = ANALYTICS_CAPACITY,
+        interval: float = ANALYTICS_INTERVAL,
+    ) -> None:
+        self._path = path
+        self._capacity = capacity
+        self._interval = interval
+        self._sketches: Dict[str, SketchSpaceSaving] = {}
+        self._saved = time.monotonic()
+        self._lock = threading.Lock()
+
+        if path is not None:
+            atexit.register(self.save)
+
+    def record(self, app: str, state: Mapping) -> None:
+        """
+        Record given app state.
+
+        Parameters
+        ----------
+        app
+            App name, e.g., the computation name.
+        state
+            Canonical app state.
+        """
+
+        key = json.dumps(state, separators=(",", ":"))
+
+        with self._lock:
+            sketch = self._sketches.get(app)
+            if sketch is None:
+                sketch = self._sketches[app] = SketchSpaceSaving(self._capacity)
+
+            sketch.add(key)
+
+        if (
+            self._path is not None
+            and time.monotonic() - self._saved > self._interval
+        ):
+            self.save(blocking=False)
+
+    def _load(self) -> Dict[str, SketchSpaceSaving]:
+        """
+        Load the sketches from the analytics file.
+        """
+
+        try:
+            with open(self._path) as analytics_file:  # pyright: ignore
+                data = json.load(analytics_file)
+        except (OSError, ValueError):
+            return {}
+
+        return {
+            app: SketchSpaceSaving.from_dict(sketch) for app, sketch in data.items()
+        }
+
+    def save(self, blocking: bool = True) -> bool:
+        """
+        Merge the sketches of the process into the analytics file.
+
+        Parameters
+        ----------
+        blocking
+            Whether to wait if another process is merging its sketches.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the sketches were merged, the sketches are merged back into
+            the sketches of the process otherwise.
+        """
+
+        if self._path is None:
+            return False
+
+        sketches: Dict[str, SketchSpaceSaving] = {}
+        path_temporary = None
+        try:
+            with open(f"{self._path}.lock", "a") as lock_file:
+                fcntl.flock(
+                    lock_file, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB)
+                )
+
+                with self._lock:
+                    sketches, self._sketches = self._sketches, {}
+                    self._saved = time.monotonic()
+
+                merged = self._load()
+                for app, sketch in sketches.items():
+                    merged.setdefault(app, SketchSpaceSaving(self._capacity)).merge(
+                        sketch
+                    )
+
+                directory = os.path.dirname(os.path.abspath(self._path))
+                file_descriptor, path_temporary = tempfile.mkstemp(dir=directory)
+                with os.fdopen(file_descriptor, "w") as analytics_file:
+                    json.dump(
+                        {app: sketch.to_dict() for app, sketch in merged.items()},
+                        analytics_file,
+                    )
+                os.replace(path_temporary, self._path)
+        except OSError:
+            if path_temporary is not None:
+                with suppress(OSError):
+                    os.remove(path_temporary)
+
+            # The sketches swapped out before the failure are merged back so
+            # that their counts are saved on the next merge.
+            with self._lock:
+                for app, sketch in sketches.items():
+                    self._sketches.setdefault(
+                        app, SketchSpaceSaving(self._capacity)
+                    ).merge(sketch)
+
+            return False
+
+        return True
+
+    def sketches(self) -> Dict[str, SketchSpaceSaving]:
+        """
+        Return the sketches of the analytics file merged with the sketches of
+        the process.
+
+        Returns
+        -------
+        :class:`dict`
+            Sketches of the apps.
+        """
+
+        merged = self._load() if self._path is not None else {}
+
+        with self._lock:
+            for app, sketch in self._sketches.items():
+                merged.setdefault(app, SketchSpaceSaving(self._capacity)).merge(sketch)
+
+        return merged
+
+
+ANALYTICS: Analytics = Analytics()
+"""
+Analytics of the states requested to the apps.
+"""
@@ -0,0 +1,416 @@
+"""
+Assets
+======
+
+Bundles the stylesheets and scripts of the apps so that they are served by the
+*Flask* server rather than by third-party hosts, with content fingerprinted
+filenames, immutable cache headers and pre-compressed *gzip* variants:
+
+-   :func:`apps.assets.split_assets`
+-   :func:`apps.assets.fingerprint_asset`
+-   :func:`apps.assets.compress_asset`
+-   :func:`apps.assets.bundle_assets`
+-   :func:`apps.assets.localise_assets`
+-   :func:`apps.assets.immutable_response`
+-   :func:`apps.assets.serve_asset`
+
+The stylesheets and scripts given by the *COLOUR_DASH_CSS* and *COLOUR_DASH_JS*
+environment variables are bundled once into the *COLOUR_DASH_ASSETS_PATH*
+directory, e.g., by the *gunicorn* master process, and the workers then serve
+them from the manifest of the bundle.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import tempfile
+import typing
+from urllib.parse import urljoin, urlparse
+from urllib.request import urlopen
+
+from colour.utilities import usage_warning
+from flask import Response, abort, request
+from werkzeug.security import safe_join
+
+if typing.TYPE_CHECKING:
+    from colour.hints import Dict, List, Sequence
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "ASSETS_PATH",
+    "ASSETS_BUNDLE",
+    "ASSETS_URL_PATH",
+    "ASSETS_MAX_AGE",
+    "ASSETS_TIMEOUT",
+    "split_assets",
+    "fingerprint_asset",
+    "compress_asset",
+    "read_manifest",
+    "bundle_assets",
+    "localise_assets",
+    "immutable_response",
+    "serve_asset",
+    "main",
+]
+
+ASSETS_PATH: str = os.environ.get(
+    "COLOUR_DASH_ASSETS_PATH",
+    os.path.join(tempfile.gettempdir(), "colour-dash-assets"),
+)
+"""
+Path of the directory the assets are bundled into.
+"""
+
+ASSETS_BUNDLE: bool = os.environ.get("COLOUR_DASH_ASSETS_BUNDLE", "1") != "0"
+"""
+Whether the *gunicorn* master process bundles the configured stylesheets and
+scripts before the workers are forked.
+"""
+
+ASSETS_URL_PATH: str = "/_colour-dash-assets/"
+"""
+Url path the bundled assets are served from.
+"""
+
+ASSETS_MAX_AGE: int = 31536000
+"""
+Maximum age in seconds of the fingerprinted assets, i.e., one year.
+"""
+
+ASSETS_TIMEOUT: float = 10
+"""
+Timeout in seconds of the download of an asset.
+"""
+
+_NAME_MANIFEST: str = "manifest.json"
+"""
+Name of the manifest file mapping the urls of the bundled assets to their
+fingerprinted filenames.
+"""
+
+_PATTERN_CSS_URL: re.Pattern = re.compile(
+    r"""url\(\s*(['"]?)(?!data:|#)([^'")]+)\1\s*\)"""
+)
+"""
+Pattern matching the ``url()`` references of a stylesheet.
+"""
+
+
+def split_assets(value: str | None) -> List[str]:
+    """
+    Split given comma separated assets urls, ignoring the empty ones.
+
+    Parameters
+    ----------
+    value
+        Comma separated assets urls, e.g., from an environment variable.
+
+    Returns
+    -------
+    :class:`list`
+        Assets urls.
+    """
+
+    return [url.strip() for url in (value or "").split(",") if url.strip()]
+
+
+def fingerprint_asset(name: str, data: bytes) -> str:
+    """
+    Return given asset filename fingerprinted with the hash of its content.
+
+    Parameters
+    ----------
+    name
+        Asset filename.
+    data
+        Asset content.
+
+    Returns
+    -------
+    :class:`str`
+        Fingerprinted filename.
+    """
+
+    stem, _separator, extension = name.partition(".")
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    return f"{stem}.{digest}.{extension}" if extension else f"{stem}.{digest}"
+
+
+def compress_asset(data: bytes) -> bytes | None:
+    """
+    Compress given asset content with *gzip*, deterministically.
+
+    Parameters
+    ----------
+    data
+        Asset content.
+
+    Returns
+    -------
+    :class:`bytes` or :py:data:`None`
+        Compressed content or *None* if compressing does not reduce its size.
+    """
+
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+
+    return compressed if len(compressed) < len(data) else None
+
+
+def _write(path: str, data: bytes) -> None:
+    """
+    Write given data atomically to given path.
+    """
+
+    file_descriptor, path_temporary = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(file_descriptor, "wb") as asset_file:
+        asset_file.write(data)
+    os.replace(path_temporary, path)
+
+
+def _read_asset(url: str) -> bytes:
+    """
+    Read the asset at given url, either a local path or an *http(s)* url.
+    """
+
+    parse_result = urlparse(url)
+
+    if parse_result.scheme in ("", "file"):
+        with open(parse_result.path, "rb") as asset_file:
+            return asset_file.read()
+
+    if parse_result.scheme not in ("http", "https"):
+        error = f'"{url}" asset url is not supported!'
+
+        raise ValueError(error)
+
+    with urlopen(url, timeout=ASSETS_TIMEOUT) as response:  # noqa: S310
+        return response.read()
+
+
+def read_manifest(path: str = ASSETS_PATH) -> Dict[str, str]:
+    """
+    Read the manifest of the assets bundled into given directory.
+
+    Parameters
+    ----------
+    path
+        Path of the bundle directory.
+
+    Returns
+    -------
+    :class:`dict`
+        Fingerprinted filenames keyed by asset url, empty if the assets were
+        not bundled.
+    """
+
+    try:
+        with open(os.path.join(path, _NAME_MANIFEST)) as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def bundle_assets(urls: Sequence[str], path: str = ASSETS_PATH) -> Dict[str, str]:
+    """
+    Bundle the assets at given urls into given directory, with fingerprinted
+    filenames and their *gzip* variants.
+
+    The relative ``url()`` references of the remote stylesheets are made
+    absolute so that they still resolve once the stylesheets are served
+    locally. The
+    assets that cannot be read are not bundled and keep being served from
+    their url.
+
+    Parameters
+    ----------
+    urls
+        Assets urls or local paths.
+    path
+        Path of the bundle directory.
+
+    Returns
+    -------
+    :class:`dict`
+        Manifest of the bundle, i.e., the fingerprinted filenames keyed by
+        asset url.
+    """
+
+    os.makedirs(path, exist_ok=True)
+
+    manifest = read_manifest(path)
+    for url in urls:
+        try:
+            data = _read_asset(url)
+        except (OSError, ValueError) as error:
+            usage_warning(f'"{url}" asset cannot be bundled: {error}')
+
+            continue
+
+        parse_result = urlparse(url)
+        name = os.path.basename(parse_result.path) or "asset"
+        if name.endswith(".css") and parse_result.scheme in ("http", "https"):
+            data = _PATTERN_CSS_URL.sub(
+                lambda match, url=url: f'url("{urljoin(url, match.group(2))}")',
+                data.decode("utf-8"),
+            ).encode("utf-8")
+
+        filename = fingerprint_asset(name, data)
+        path_asset = os.path.join(path, filename)
+        if not os.path.exists(path_asset):
+            compressed = compress_asset(data)
+            if compressed is not None:
+                _write(f"{path_asset}.gz", compressed)
+
+            _write(path_asset, data)
+
+        manifest[url] = filename
+
+    _write(
+        os.path.join(path, _NAME_MANIFEST),
+        json.dumps(manifest, indent=4).encode("utf-8"),
+    )
+
+    return manifest
+
+
+def localise_assets(urls: Sequence[str], manifest: Dict[str, str]) -> List[str]:
+    """
+    Return given assets urls with the bundled assets replaced by their local
+    url.
+
+    Parameters
+    ----------
+    urls
+        Assets urls.
+    manifest
+        Manifest of the bundle.
+
+    Returns
+    -------
+    :class:`list`
+        Localised assets urls.
+    """
+
+    return [
+        f"{ASSETS_URL_PATH}{manifest[url]}" if url in manifest else url
+        for url in urls
+    ]
+
+
+def immutable_response(response: Response, compressed: bytes | None) -> Response:
+    """
+    Make given response of a fingerprinted asset cacheable forever and send
+    its compressed variant if the client accepts it.
+
+    Parameters
+    ----------
+    response
+        Response of a fingerprinted asset.
+    compressed
+        *Gzip* compressed content of the asset.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Immutable response.
+    """
+
+    response.cache_control.public = True
+    response.cache_control.max_age = ASSETS_MAX_AGE
+    response.cache_control.immutable = True
+    response.vary.add("Accept-Encoding")
+
+    if compressed is not None and "gzip" in request.accept_encodings:
+        response.set_data(compressed)
+        response.content_encoding = "gzip"
+
+    return response
+
+
+def serve_asset(filename: str, path: str = ASSETS_PATH) -> Response:
+    """
+    Serve given bundled asset.
+
+    Parameters
+    ----------
+    filename
+        Fingerprinted filename of the asset.
+    path
+        Path of the bundle directory.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Asset response.
+    """
+
+    path_asset = safe_join(path, filename)
+    if path_asset is None or filename == _NAME_MANIFEST:
+        abort(404)
+
+    try:
+        with open(path_asset, "rb") as asset_file:  # pyright: ignore
+            data = asset_file.read()
+    except OSError:
+        abort(404)
+
+    compressed = None
+    if "gzip" in request.accept_encodings:
+        try:
+            with open(f"{path_asset}.gz", "rb") as asset_file:
+                compressed = asset_file.read()
+        except OSError:
+            pass
+
+    response = Response(
+        data, mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    )
+
+    return immutable_response(response, compressed)
+
+
+def main(arguments: Sequence[str] | None = None) -> None:
+    """
+    Bundle the configured assets from the command line.
+
+    Parameters
+    ----------
+    arguments
+        Command line arguments, :attr:`sys.argv` attribute is used if *None*.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m apps.assets",
+        description="Bundle the stylesheets and scripts served by the apps.",
+    )
+    parser.add_argument(
+        "urls",
+        nargs="*",
+        help="Assets urls, the COLOUR_DASH_CSS and COLOUR_DASH_JS ones if empty.",
+    )
+    parser.add_argument("--path", default=ASSETS_PATH, help="Bundle directory.")
+
+    namespace = parser.parse_args(arguments)
+
+    urls = namespace.urls or split_assets(os.environ.get("COLOUR_DASH_CSS")) + (
+        split_assets(os.environ.get("COLOUR_DASH_JS"))
+    )
+
+    bundle_assets(urls, namespace.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Batch
+=====
+
+Run the computations of the apps headlessly on *JSONL* records, e.g., in
+render farm scripts, without importing *Dash* nor running a web server.
+
+Each input line is a record with the same keys as the state of the
+corresponding app, missing keys are taken from the default state. Each output
+line is a record with the canonical state and the formatted output, exactly as
+the app would display it, or an error message, in the input order.
+
+Usage::
+
+    python -m apps.batch matrix_RGB_to_RGB states.jsonl -o outputs.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import typing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import islice
+
+if typing.TYPE_CHECKING:
+    from colour.hints import Callable, Dict, Iterable, List, Sequence, TextIO, Tuple
+
+from apps.common import (
+    SCHEMA_STATE_CHROMATICALLY_ADAPTED_PRIMARIES,
+    SCHEMA_STATE_MATRIX_RGB_TO_RGB,
+    STATE_DEFAULT_CHROMATICALLY_ADAPTED_PRIMARIES,
+    STATE_DEFAULT_MATRIX_RGB_TO_RGB,
+    canonical_state,
+    format_chromatically_adapted_primaries,
+    format_matrix_RGB_to_RGB,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "COMPUTATIONS_BATCH",
+    "CHUNK_SIZE_BATCH",
+    "compute_record",
+    "compute_records",
+    "run_batch",
+    "main",
+]
+
+COMPUTATIONS_BATCH: Dict[str, Tuple[Dict, Dict, Callable]] = {
+    "matrix_RGB_to_RGB": (
+        SCHEMA_STATE_MATRIX_RGB_TO_RGB,
+        STATE_DEFAULT_MATRIX_RGB_TO_RGB,
+        format_matrix_RGB_to_RGB,
+    ),
+    "chromatically_adapted_primaries": (
+        SCHEMA_STATE_CHROMATICALLY_ADAPTED_PRIMARIES,
+        STATE_DEFAULT_CHROMATICALLY_ADAPTED_PRIMARIES,
+        format_chromatically_adapted_primaries,
+    ),
+}
+"""
+Batch computations: state schema, default state and formatting definition.
+"""
+
+CHUNK_SIZE_BATCH: int = 256
+"""
+Default number of records per chunk sent to a pool process.
+"""
+
+
+def compute_record(computation: str, line: str) -> str:
+    """
+    Compute given *JSONL* record with given computation.
+
+    Parameters
+    ----------
+    computation
+        Computation, see :attr:`apps.batch.COMPUTATIONS_BATCH` attribute.
+    line
+        *JSONL* record.
+
+    Returns
+    -------
+    :class:`str`
+        *JSONL* output record, i.e., the canonical state and the formatted
+        output, or the error message if the record is not valid.
+    """
+
+    schema, default, function = COMPUTATIONS_BATCH[computation]
+
+    try:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            error = "Record is not a JSON object!"
+
+            raise ValueError(error)  # noqa: TRY301
+
+        state = canonical_state(record, schema, default)
+        output = {"state": state, "output": function(*state.values())}
+    except ValueError as error:
+        output = {"error": str(error)}
+
+    return json.dumps(output)
+
+
+def compute_records(computation: str, lines: List[str]) -> str:
+    """
+    Compute given chunk of *JSONL* records with given computation.
+
+    Parameters
+    ----------
+    computation
+        Computation, see :attr:`apps.batch.COMPUTATIONS_BATCH` attribute.
+    lines
+        *JSONL* records.
+
+    Returns
+    -------
+    :class:`str`
+        *JSONL* output records.
+    """
+
+    return "".join(f"{compute_record(computation, line)}\n" for line in lines)
+
+
+def _chunks(lines: Iterable[str], chunk_size: int) -> Iterable[List[str]]:
+    """Generate chunks of given lines, the trailing line breaks are removed."""
+
+    iterator = iter(lines)
+    while chunk := [line.rstrip("\r\n") for line in islice(iterator, chunk_size)]:
+        yield chunk
+
+
+def run_batch(
+    computation: str,
+    input_file: TextIO,
+    output_file: TextIO,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE_BATCH,
+) -> None:
+    """
+    Compute the *JSONL* records of given input file with given computation and
+    write the output records into given output file in the input order.
+
+    The records are read lazily and at most a few chunks per process are in
+    flight at any time so that the memory usage is constant whatever the
+    input size.
+
+    Parameters
+    ----------
+    computation
+        Computation, see :attr:`apps.batch.COMPUTATIONS_BATCH` attribute.
+    input_file
+        Input file of *JSONL* records.
+    output_file
+        Output file of *JSONL* records.
+    workers
+        Number of processes, the records are computed in the current process
+        if 1, :func:`os.cpu_count` definition is used if *None*.
+    chunk_size
+        Number of records per chunk sent to a pool process.
+
+    Raises
+    ------
+    ValueError
+        If the computation is unknown.
+    """
+
+    if computation not in COMPUTATIONS_BATCH:
+        error = f'"{computation}" computation is not supported!'
+
+        raise ValueError(error)
+
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        for chunk in _chunks(input_file, chunk_size):
+            output_file.write(compute_records(computation, chunk))
+
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for chunk in _chunks(input_file, chunk_size):
+            pending.append(executor.submit(compute_records, computation, chunk))
+
+            if len(pending) >= workers * 2:
+                output_file.write(pending.popleft().result())
+
+        while pending:
+            output_file.write(pending.popleft().result())
+
+
+def main(arguments: Sequence[str] | None = None) -> None:
+    """
+    Run the computations of the apps from the command line.
+
+    Parameters
+    ----------
+    arguments
+        Command line arguments, :attr:`sys.argv` attribute is used if *None*.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m apps.batch",
+        description="Compute the outputs of the apps for JSONL state records.",
+    )
+    parser.add_argument(
+        "computation", choices=list(COMPUTATIONS_BATCH), help="Computation."
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help='Input JSONL file, "-" for the standard input.',
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help='Output JSONL file, "-" for the standard output.',
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of processes, defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=CHUNK_SIZE_BATCH,
+        help="Number of records per chunk sent to a process.",
+    )
+
+    namespace = parser.parse_args(arguments)
+
+    with ExitStack() as stack:
+        run_batch(
+            namespace.computation,
+            (
+                sys.stdin
+                if namespace.input == "-"
+                else stack.enter_context(open(namespace.input))
+            ),
+            (
+                sys.stdout
+                if namespace.output == "-"
+                else stack.enter_context(open(namespace.output, "w"))
+            ),
+            namespace.workers,
+            max(namespace.chunk_size, 1),
+        )
+
+
+if __name__ == "__main__":
+    main()
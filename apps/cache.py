@@ -0,0 +1,1323 @@
+"""
+Cache
+=====
+
+Defines the cache shared by the apps to store their computed outputs:
+
+-   :class:`apps.cache.AbstractCache`
+-   :class:`apps.cache.CacheLRU`
+-   :class:`apps.cache.CacheFilesystem`
+-   :class:`apps.cache.CacheRedis`
+-   :class:`apps.cache.CacheSharedMemory`
+-   :class:`apps.cache.SingleFlight`
+
+The cache backend is selected with the *COLOUR_DASH_CACHE* environment
+variable, e.g., *memory://?maxsize=4096*, *file:///var/cache/colour-dash*,
+*redis://localhost:6379/0* or *shared-memory://*, the default.
+
+The concurrent cache misses of a same key are coalesced so that the value is
+computed once, within a process and across the processes sharing the lock file
+given by the *COLOUR_DASH_LOCK_PATH* environment variable.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import functools
+import mmap
+import os
+import socket
+import struct
+import tempfile
+import threading
+import typing
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from hashlib import blake2b
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from apps.tracing import span
+
+if typing.TYPE_CHECKING:
+    from colour.hints import (
+        Any,
+        Callable,
+        Dict,
+        Generator,
+        List,
+        Mapping,
+        NDArray,
+        Sequence,
+        Tuple,
+    )
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "encode_array",
+    "decode_array",
+    "AbstractCache",
+    "CacheLRU",
+    "CACHE_FILESYSTEM_MAXBYTES",
+    "CacheFilesystem",
+    "CacheRedis",
+    "CACHE_SIZE_CLASSES",
+    "CacheSharedMemory",
+    "cache_from_url",
+    "CACHE_URL",
+    "CACHE",
+    "LOCKS",
+    "LOCK_TIMEOUT",
+    "SingleFlight",
+    "LOCK_PATH",
+    "SINGLE_FLIGHT",
+    "CACHE_KEY_VERSIONS",
+    "set_cache_key_versions",
+    "cached_output",
+    "cached_array",
+]
+
+_ARRAY_HEADER: struct.Struct = struct.Struct("<4scB")
+"""
+Array payload header: magic number, *dtype* character code and number of
+dimensions, followed by the shape as unsigned 32-bit integers and the raw
+little-endian data.
+"""
+
+_ARRAY_MAGIC: bytes = b"CDA1"
+"""
+Array payload magic number.
+"""
+
+
+def encode_array(a: NDArray) -> bytes:
+    """
+    Encode given array into a compact binary payload.
+
+    Parameters
+    ----------
+    a
+        Array to encode.
+
+    Returns
+    -------
+    :class:`bytes`
+        Binary payload.
+    """
+
+    a = np.asarray(a)
+    a = a.astype(a.dtype.newbyteorder("<"), copy=False)
+
+    return b"".join(
+        [
+            _ARRAY_HEADER.pack(_ARRAY_MAGIC, a.dtype.char.encode("ascii"), a.ndim),
+            struct.pack(f"<{a.ndim}I", *a.shape),
+            a.tobytes(),
+        ]
+    )
+
+
+def decode_array(payload: bytes) -> NDArray:
+    """
+    Decode given binary payload into an array.
+
+    Parameters
+    ----------
+    payload
+        Binary payload to decode.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Decoded read-only array.
+    """
+
+    magic, char, ndim = _ARRAY_HEADER.unpack_from(payload, 0)
+
+    if magic != _ARRAY_MAGIC:
+        error = "Payload is not a valid array payload!"
+
+        raise ValueError(error)
+
+    offset = _ARRAY_HEADER.size
+    shape = struct.unpack_from(f"<{ndim}I", payload, offset)
+    offset += 4 * ndim
+
+    return np.frombuffer(
+        payload, dtype=np.dtype(char.decode("ascii")).newbyteorder("<"), offset=offset
+    ).reshape(shape)
+
+
+class AbstractCache(ABC):
+    """
+    Define the base class for the cache backends storing binary values.
+
+    Methods
+    -------
+    -   :meth:`~apps.cache.AbstractCache.get`
+    -   :meth:`~apps.cache.AbstractCache.set`
+    -   :meth:`~apps.cache.AbstractCache.statistics`
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """
+        Return the value of given key.
+
+        Parameters
+        ----------
+        key
+            Key to return the value of.
+
+        Returns
+        -------
+        :class:`bytes` or :py:data:`None`
+            Value or *None* if the key is not cached.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Set given key to given value.
+
+        Parameters
+        ----------
+        key
+            Key to set.
+        value
+            Value to set.
+        """
+
+    def statistics(self) -> Dict:
+        """
+        Return the statistics of the cache.
+
+        Returns
+        -------
+        :class:`dict`
+            Cache backend.
+        """
+
+        return {"backend": self.__class__.__name__}
+
+
+class CacheLRU(AbstractCache):
+    """
+    Define an in-process *Least Recently Used* (LRU) cache.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of cached values.
+
+    Methods
+    -------
+    -   :meth:`~apps.cache.CacheLRU.get`
+    -   :meth:`~apps.cache.CacheLRU.set`
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self._maxsize = maxsize
+        self._values: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Return the value of given key.
+
+        Parameters
+        ----------
+        key
+            Key to return the value of.
+
+        Returns
+        -------
+        :class:`bytes` or :py:data:`None`
+            Value or *None* if the key is not cached.
+        """
+
+        with self._lock:
+            value = self._values.get(key)
+
+            if value is not None:
+                self._values.move_to_end(key)
+
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Set given key to given value, evicting the least recently used value
+        if the cache is full.
+
+        Parameters
+        ----------
+        key
+            Key to set.
+        value
+            Value to set.
+        """
+
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+
+            if len(self._values) > self._maxsize:
+                self._values.popitem(last=False)
+
+
+CACHE_FILESYSTEM_MAXBYTES: int = 1073741824
+"""
+Default maximum size in bytes of a :class:`CacheFilesystem` class instance,
+i.e., 1GiB.
+"""
+
+
+class CacheFilesystem(AbstractCache):
+    """
+    Define a filesystem cache storing each value in a file named after the
+    key digest, e.g., on a volume shared by multiple nodes.
+
+    The cache size is bounded: the modification time of a file is updated
+    whenever its value is read and, once the size of the values written
+    exceeds the maximum size, the least recently used files are removed
+    until the cache size is below 90% of the maximum size.
+
+    Parameters
+    ----------
+    directory
+        Cache directory.
+    maxbytes
+        Maximum size in bytes of the cache.
+
+    Methods
+    -------
+    -   :meth:`~apps.cache.CacheFilesystem.get`
+    -   :meth:`~apps.cache.CacheFilesystem.set`
+    -   :meth:`~apps.cache.CacheFilesystem.evict`
+    """
+
+    def __init__(
+        self, directory: str, maxbytes: int = CACHE_FILESYSTEM_MAXBYTES
+    ) -> None:
+        self._directory = directory
+        self._maxbytes = maxbytes
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        """
+        Return the path of the file storing the value of given key.
+        """
+
+        digest = blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+        return os.path.join(self._directory, digest[:2], digest)
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Return the value of given key.
+
+        Parameters
+        ----------
+        key
+            Key to return the value of.
+
+        Returns
+        -------
+        :class:`bytes` or :py:data:`None`
+            Value or *None* if the key is not cached.
+        """
+
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as cache_file:
+                value = cache_file.read()
+        except OSError:
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(path)
+
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Set given key to given value, the file is written atomically and the
+        least recently used files are evicted if the cache is full.
+
+        Parameters
+        ----------
+        key
+            Key to set.
+        value
+            Value to set.
+        """
+
+        # The size is tracked per process from the last scan of the cache
+        # directory, the scan of the eviction accounts for the other
+        # processes writing to the same directory.
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _path, size, _mtime in self._files())
+
+        path = self._path(key)
+        directory = os.path.dirname(path)
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            file_descriptor, path_temporary = tempfile.mkstemp(
+                prefix=".", dir=directory
+            )
+            with os.fdopen(file_descriptor, "wb") as cache_file:
+                cache_file.write(value)
+            os.replace(path_temporary, path)
+        except OSError:
+            return
+
+        with self._lock:
+            self._size += len(value)
+            evict = self._size > self._maxbytes
+
+        if evict:
+            self.evict()
+
+    def _files(self) -> List[Tuple[str, int, float]]:
+        """
+        Return the path, size and modification time of the cached files.
+        """
+
+        files = []
+        with contextlib.suppress(OSError), os.scandir(self._directory) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+
+                with contextlib.suppress(OSError), os.scandir(entry.path) as subentries:
+                    for subentry in subentries:
+                        if subentry.name.startswith("."):
+                            continue
+
+                        with contextlib.suppress(OSError):
+                            stat = subentry.stat()
+                            files.append((subentry.path, stat.st_size, stat.st_mtime))
+
+        return files
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used files until the cache size is below
+        90% of the maximum size.
+        """
+
+        files = sorted(self._files(), key=lambda file: file[2])
+        size = sum(size for _path, size, _mtime in files)
+
+        for path, size_file, _mtime in files:
+            if size <= self._maxbytes * 0.9:
+                break
+
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+            size -= size_file
+
+        with self._lock:
+            self._size = size
+
+
+class CacheRedis(AbstractCache):
+    """
+    Define a cache speaking the *Redis* serialisation protocol (RESP) to a
+    *Redis* compatible server.
+
+    Connection errors are not raised but treated as cache misses so that the
+    apps keep working when the server is unavailable.
+
+    Parameters
+    ----------
+    host
+        Server host.
+    port
+        Server port.
+    database
+        Server database index.
+    prefix
+        Prefix of the keys.
+    ttl
+        Time to live in seconds of the values, *None* for no expiration.
+    timeout
+        Socket timeout in seconds.
+
+    Methods
+    -------
+    -   :meth:`~apps.cache.CacheRedis.get`
+    -   :meth:`~apps.cache.CacheRedis.set`
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        database: int = 0,
+        prefix: str = "colour-dash:",
+        ttl: int | None = None,
+        timeout: float = 0.5,
+    ) -> None:
+        self._address = (host, port)
+        self._database = database
+        self._prefix = prefix
+        self._ttl = ttl
+        self._timeout = timeout
+        self._socket: socket.socket | None = None
+        self._file: typing.BinaryIO | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        """
+        Connect to the server and select the database.
+        """
+
+        self._socket = socket.create_connection(self._address, self._timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self._socket.makefile("rb")
+
+        if self._database:
+            self._send("SELECT", str(self._database))
+
+    def _disconnect(self) -> None:
+        """
+        Disconnect from the server.
+        """
+
+        if self._socket is not None:
+            self._socket.close()
+
+        self._socket = self._file = None
+
+    def _read(self) -> Any:
+        """
+        Read a reply from the server.
+        """
+
+        line = self._file.readline()  # pyright: ignore
+
+        if not line.endswith(b"\r\n"):
+            error = "Connection closed by the server!"
+
+            raise ConnectionError(error)
+
+        prefix, data = line[:1], line[1:-2]
+
+        if prefix == b"+":
+            return data
+        if prefix == b"-":
+            raise ConnectionError(data.decode("utf-8"))
+        if prefix == b":":
+            return int(data)
+        if prefix == b"$":
+            length = int(data)
+            if length == -1:
+                return None
+
+            return self._file.read(length + 2)[:-2]  # pyright: ignore
+        if prefix == b"*":
+            length = int(data)
+
+            return None if length == -1 else [self._read() for _ in range(length)]
+
+        error = f'Unexpected "{prefix!r}" reply prefix!'
+
+        raise ConnectionError(error)
+
+    def _send(self, *arguments: str | bytes) -> Any:
+        """
+        Send given command to the server and return its reply.
+        """
+
+        encoded = [
+            argument if isinstance(argument, bytes) else argument.encode("utf-8")
+            for argument in arguments
+        ]
+        self._socket.sendall(  # pyright: ignore
+            b"".join(
+                [
+                    b"*%d\r\n" % len(encoded),
+                    *[b"$%d\r\n%s\r\n" % (len(data), data) for data in encoded],
+                ]
+            )
+        )
+
+        return self._read()
+
+    def _command(self, *arguments: str | bytes) -> Any:
+        """
+        Send given command to the server, connecting if required, and return
+        its reply or *None* on connection error.
+        """
+
+        with self._lock:
+            try:
+                if self._socket is None:
+                    self._connect()
+
+                return self._send(*arguments)
+            except OSError:
+                self._disconnect()
+
+                return None
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Return the value of given key.
+
+        Parameters
+        ----------
+        key
+            Key to return the value of.
+
+        Returns
+        -------
+        :class:`bytes` or :py:data:`None`
+            Value or *None* if the key is not cached.
+        """
+
+        return self._command("GET", f"{self._prefix}{key}")
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Set given key to given value.
+
+        Parameters
+        ----------
+        key
+            Key to set.
+        value
+            Value to set.
+        """
+
+        if self._ttl is None:
+            self._command("SET", f"{self._prefix}{key}", value)
+        else:
+            self._command("SET", f"{self._prefix}{key}", value, "EX", str(self._ttl))
+
+
+CACHE_SIZE_CLASSES: Tuple = ((8192, 2048), (1024, 16384), (64, 262144))
+"""
+Default size classes of a :class:`CacheSharedMemory` class instance, i.e.,
+the number of slots and the slot size in bytes of each class, 16MiB per
+class. They are sized after the measured cached values: the matrices and
+most formatted outputs are smaller than 2KiB, the comparisons of the
+*chromatic adaptation transforms* and the short correlated colour temperature
+sweeps smaller than 16KiB while the long sweeps and the gamut intersection
+areas of all the *RGB* colourspaces are smaller than 256KiB.
+"""
+
+_HEADER: struct.Struct = struct.Struct("<8sIQ")
+"""
+Cache header: magic number, number of size classes and number of skipped
+values, followed by the size classes.
+"""
+
+_SIZE_CLASS: struct.Struct = struct.Struct("<II")
+"""
+Size class: number of slots and slot size.
+"""
+
+_SLOT_HEADER: struct.Struct = struct.Struct("<Q16sI")
+"""
+Slot header: sequence number, key digest and value length.
+"""
+
+_SEQUENCE: struct.Struct = struct.Struct("<Q")
+"""
+Slot sequence number.
+"""
+
+_SKIPPED: struct.Struct = struct.Struct("<Q")
+"""
+Number of values too large to be cached.
+"""
+
+_OFFSET_SKIPPED: int = 12
+"""
+Offset of the number of skipped values in the cache header.
+"""
+
+_MAGIC: bytes = b"CDCACHE2"
+"""
+Cache magic number.
+"""
+
+
+class CacheSharedMemory(AbstractCache):
+    """
+    Define a bounded cache stored in a memory mapped file that can be shared
+    by multiple processes, e.g., the *gunicorn* workers.
+
+    The cache is made of size classes, each one being a direct-mapped hash
+    table of fixed size slots, a value is stored in the smallest class whose
+    slots fit it. Each slot is guarded by a sequence number following the
+    *seqlock* pattern: writers take a thread lock and a per-slot file lock and
+    make the sequence number odd while writing, readers never lock and discard
+    any slot whose sequence number is odd or changed while reading.
+
+    Parameters
+    ----------
+    path
+        Path of the memory mapped file, if *None*, an anonymous memory map is
+        used which is only shared with the processes forked afterwards.
+    size_classes
+        Number of slots and slot size in bytes of each size class, only used
+        when creating the cache.
+
+    Attributes
+    ----------
+    -   :attr:`~apps.cache.CacheSharedMemory.path`
+    -   :attr:`~apps.cache.CacheSharedMemory.skipped`
+
+    Methods
+    -------
+    -   :meth:`~apps.cache.CacheSharedMemory.create`
+    -   :meth:`~apps.cache.CacheSharedMemory.get`
+    -   :meth:`~apps.cache.CacheSharedMemory.set`
+    -   :meth:`~apps.cache.CacheSharedMemory.statistics`
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        size_classes: Sequence[Tuple[int, int]] = CACHE_SIZE_CLASSES,
+    ) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+
+        if path is None:
+            self._fd = None
+            self._mmap = mmap.mmap(-1, CacheSharedMemory._size(size_classes))
+            CacheSharedMemory._pack_header(self._mmap, size_classes)
+        else:
+            if not os.path.exists(path) or os.path.getsize(path) == 0:
+                CacheSharedMemory.create(path, size_classes)
+
+            self._fd = os.open(path, os.O_RDWR)
+            self._mmap = mmap.mmap(self._fd, 0)
+
+        magic, count, _skipped = _HEADER.unpack_from(self._mmap, 0)
+
+        if magic != _MAGIC:
+            error = f'"{path}" is not a valid cache file!'
+
+            raise ValueError(error)
+
+        # Each size class is stored as its number of slots, slot size and
+        # offset, sorted by increasing slot size.
+        self._size_classes = []
+        offset = _HEADER.size + count * _SIZE_CLASS.size
+        for i in range(count):
+            slots, slot_size = _SIZE_CLASS.unpack_from(
+                self._mmap, _HEADER.size + i * _SIZE_CLASS.size
+            )
+            self._size_classes.append((slots, slot_size, offset))
+            offset += slots * slot_size
+
+    @property
+    def path(self) -> str | None:
+        """
+        Getter property for the path of the memory mapped file.
+
+        Returns
+        -------
+        :class:`str` or :py:data:`None`
+            Path of the memory mapped file.
+        """
+
+        return self._path
+
+    @property
+    def skipped(self) -> int:
+        """
+        Getter property for the number of values that were too large to be
+        cached, across the processes sharing the cache.
+
+        Returns
+        -------
+        :class:`int`
+            Number of skipped values.
+        """
+
+        return _SKIPPED.unpack_from(self._mmap, _OFFSET_SKIPPED)[0]
+
+    @staticmethod
+    def _size(size_classes: Sequence[Tuple[int, int]]) -> int:
+        """
+        Return the size in bytes of a cache with given size classes.
+        """
+
+        return (
+            _HEADER.size
+            + len(size_classes) * _SIZE_CLASS.size
+            + sum(slots * slot_size for slots, slot_size in size_classes)
+        )
+
+    @staticmethod
+    def _pack_header(
+        buffer: typing.Any, size_classes: Sequence[Tuple[int, int]]
+    ) -> None:
+        """
+        Pack the header of a cache with given size classes into given buffer.
+        """
+
+        size_classes = sorted(size_classes, key=lambda size_class: size_class[1])
+
+        _HEADER.pack_into(buffer, 0, _MAGIC, len(size_classes), 0)
+        for i, (slots, slot_size) in enumerate(size_classes):
+            _SIZE_CLASS.pack_into(
+                buffer, _HEADER.size + i * _SIZE_CLASS.size, slots, slot_size
+            )
+
+    @staticmethod
+    def create(
+        path: str, size_classes: Sequence[Tuple[int, int]] = CACHE_SIZE_CLASSES
+    ) -> None:
+        """
+        Create an empty cache file at given path, e.g., from the *gunicorn*
+        master process before forking the workers.
+
+        Parameters
+        ----------
+        path
+            Path of the memory mapped file.
+        size_classes
+            Number of slots and slot size in bytes of each size class.
+        """
+
+        header = bytearray(_HEADER.size + len(size_classes) * _SIZE_CLASS.size)
+        CacheSharedMemory._pack_header(header, size_classes)
+
+        with open(path, "wb") as cache_file:
+            cache_file.write(header)
+            cache_file.truncate(CacheSharedMemory._size(size_classes))
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Return the value of given key without locking.
+
+        Parameters
+        ----------
+        key
+            Key to return the value of.
+
+        Returns
+        -------
+        :class:`bytes` or :py:data:`None`
+            Value or *None* if the key is not cached.
+        """
+
+        digest = blake2b(key.encode("utf-8"), digest_size=16).digest()
+        index = int.from_bytes(digest[:8], "little")
+
+        for slots, slot_size, offset_class in self._size_classes:
+            offset = offset_class + index % slots * slot_size
+
+            sequence, slot_digest, length = _SLOT_HEADER.unpack_from(self._mmap, offset)
+            if sequence % 2 or slot_digest != digest:
+                continue
+
+            start = offset + _SLOT_HEADER.size
+            value = self._mmap[start : start + length]
+
+            if _SEQUENCE.unpack_from(self._mmap, offset)[0] != sequence:
+                return None
+
+            return value
+
+        return None
+
+    @contextlib.contextmanager
+    def _locked(self, offset: int, length: int) -> Generator:
+        """
+        Hold the thread lock and the file lock of given byte range.
+        """
+
+        with self._lock:
+            if self._fd is not None:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX, length, offset)
+
+            try:
+                yield
+            finally:
+                if self._fd is not None:
+                    fcntl.lockf(self._fd, fcntl.LOCK_UN, length, offset)
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Set given key to given value in the smallest size class fitting it,
+        the values larger than the largest slot size are not cached but
+        counted.
+
+        Parameters
+        ----------
+        key
+            Key to set.
+        value
+            Value to set.
+        """
+
+        size_class = next(
+            (
+                size_class
+                for size_class in self._size_classes
+                if len(value) <= size_class[1] - _SLOT_HEADER.size
+            ),
+            None,
+        )
+        if size_class is None:
+            with self._locked(_OFFSET_SKIPPED, _SKIPPED.size):
+                _SKIPPED.pack_into(self._mmap, _OFFSET_SKIPPED, self.skipped + 1)
+
+            return
+
+        slots, slot_size, offset_class = size_class
+
+        digest = blake2b(key.encode("utf-8"), digest_size=16).digest()
+        offset = offset_class + int.from_bytes(digest[:8], "little") % slots * slot_size
+
+        with self._locked(offset, slot_size):
+            sequence = _SEQUENCE.unpack_from(self._mmap, offset)[0] | 1
+            _SEQUENCE.pack_into(self._mmap, offset, sequence)
+            _SLOT_HEADER.pack_into(self._mmap, offset, sequence, digest, len(value))
+            start = offset + _SLOT_HEADER.size
+            self._mmap[start : start + len(value)] = value
+            _SEQUENCE.pack_into(self._mmap, offset, sequence + 1)
+
+    def statistics(self) -> Dict:
+        """
+        Return the statistics of the cache.
+
+        Returns
+        -------
+        :class:`dict`
+            Cache backend, size classes and number of skipped values.
+        """
+
+        return {
+            **super().statistics(),
+            "size_classes": [
+                {"slots": slots, "slot_size": slot_size}
+                for slots, slot_size, _offset in self._size_classes
+            ],
+            "skipped": self.skipped,
+        }
+
+
+def cache_from_url(url: str | None) -> AbstractCache:
+    """
+    Return the cache backend for given url.
+
+    Parameters
+    ----------
+    url
+        Cache url, e.g., *memory://?maxsize=4096*,
+        *file:///var/cache/colour-dash?maxbytes=1073741824*,
+        *redis://localhost:6379/0* or
+        *shared-memory://*. The *shared-memory* backend uses the memory mapped
+        file given by the url path or the *COLOUR_DASH_CACHE_PATH* environment
+        variable, which the *gunicorn* master process sets in the
+        *gunicorn.conf.py* file.
+
+    Returns
+    -------
+    :class:`apps.cache.AbstractCache`
+        Cache backend.
+    """
+
+    parse_result = urlparse(url or "shared-memory://")
+    query = {key: value[0] for key, value in parse_qs(parse_result.query).items()}
+
+    if parse_result.scheme == "memory":
+        return CacheLRU(int(query.get("maxsize", 4096)))
+
+    if parse_result.scheme == "file":
+        return CacheFilesystem(
+            parse_result.path,
+            int(query.get("maxbytes", CACHE_FILESYSTEM_MAXBYTES)),
+        )
+
+    if parse_result.scheme == "redis":
+        return CacheRedis(
+            parse_result.hostname or "localhost",
+            parse_result.port or 6379,
+            int(parse_result.path.strip("/") or 0),
+            ttl=int(query["ttl"]) if "ttl" in query else None,
+        )
+
+    if parse_result.scheme == "shared-memory":
+        return CacheSharedMemory(
+            parse_result.path or os.environ.get("COLOUR_DASH_CACHE_PATH")
+        )
+
+    error = f'"{url}" cache url is not supported!'
+
+    raise ValueError(error)
+
+
+CACHE_URL: str | None = os.environ.get("COLOUR_DASH_CACHE")
+"""
+Cache url used to select the cache backend.
+"""
+
+CACHE: AbstractCache = cache_from_url(CACHE_URL)
+"""
+Cache shared by the apps.
+"""
+
+LOCKS: int = 4096
+"""
+Default number of byte-range locks of the lock file of a
+:class:`SingleFlight` class instance.
+"""
+
+LOCK_TIMEOUT: float = 30
+"""
+Maximum duration in seconds a thread waits for another thread of the process
+holding a byte-range lock before running its computation unlocked.
+"""
+
+
+class _Flight:
+    """
+    Define an in-flight computation awaited by the concurrent callers.
+    """
+
+    __slots__ = ("error", "event", "value")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Define a single-flight coalescer: the concurrent calls for a same key run
+    the computation once, the first caller computes the value while the
+    duplicate callers wait for it.
+
+    Within a process, the duplicate callers wait on the in-flight computation.
+    Across processes, e.g., the *gunicorn* workers, the computations are
+    serialised with the byte-range locks of a lock file, the keys being hashed
+    onto them, and the callers acquiring a lock after another process look
+    the value up, e.g., in the shared cache, before computing it. The
+    byte-range locks being owned by the process, the threads of the process
+    are serialised by an in-process lock per byte-range lock.
+
+    Parameters
+    ----------
+    path
+        Path of the lock file, if *None*, the computations are only coalesced
+        within the process.
+    locks
+        Number of byte-range locks.
+
+    Methods
+    -------
+    -   :meth:`~apps.cache.SingleFlight.run`
+    """
+
+    def __init__(self, path: str | None = None, locks: int = LOCKS) -> None:
+        self._path = path
+        self._locks = locks
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self._fd: int | None = None
+        self._thread_locks: dict[int, threading.Lock] = {}
+        self._local = threading.local()
+
+    def _file_descriptor(self) -> int | None:
+        """
+        Return the file descriptor of the lock file, opening it if required,
+        or *None* if the computations are only coalesced within the process.
+        """
+
+        with self._lock:
+            if self._fd is None and self._path is not None:
+                try:
+                    self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+                except OSError:
+                    self._path = None
+
+            return self._fd
+
+    def _run_locked(
+        self, key: str, compute: Callable[[], Any], lookup: Callable[[], Any]
+    ) -> Any:
+        """
+        Run given computation holding the lock file byte-range lock of given
+        key, unless given lookup returns a value computed by another process.
+        """
+
+        file_descriptor = self._file_descriptor()
+        if file_descriptor is None:
+            return compute()
+
+        digest = blake2b(key.encode("utf-8"), digest_size=8).digest()
+        offset = int.from_bytes(digest, "little") % self._locks
+
+        # A nested computation whose key collides with a byte-range lock held
+        # by the thread runs unlocked, relocking would release it early.
+        offsets = self._local.__dict__.setdefault("offsets", set())
+        if offset in offsets:
+            return compute()
+
+        with self._lock:
+            thread_lock = self._thread_locks.setdefault(offset, threading.Lock())
+
+        # The nested computations of two threads may deadlock when their keys
+        # collide, the timeout breaks it and the computation then runs
+        # unlocked.
+        if not thread_lock.acquire(timeout=LOCK_TIMEOUT):
+            return compute()
+
+        offsets.add(offset)
+        try:
+            # The nested computations, e.g., a formatted output of a cached
+            # matrix, may deadlock across processes when their keys collide,
+            # the kernel detects it and the computation then runs unlocked.
+            try:
+                fcntl.lockf(file_descriptor, fcntl.LOCK_EX, 1, offset)
+            except OSError:
+                return compute()
+
+            try:
+                value = lookup()
+
+                return compute() if value is None else value
+            finally:
+                fcntl.lockf(file_descriptor, fcntl.LOCK_UN, 1, offset)
+        finally:
+            offsets.discard(offset)
+            thread_lock.release()
+
+    def run(
+        self, key: str, compute: Callable[[], Any], lookup: Callable[[], Any]
+    ) -> Any:
+        """
+        Run given computation for given key once across the concurrent
+        callers.
+
+        Parameters
+        ----------
+        key
+            Key of the computation.
+        compute
+            Computation returning the value, it is expected to store it where
+            given lookup finds it.
+        lookup
+            Lookup returning the value computed by another process or *None*.
+
+        Returns
+        -------
+        :class:`object`
+            Value, shared by the concurrent callers.
+
+        Raises
+        ------
+        Exception
+            The exception raised by the computation, re-raised for the
+            concurrent callers.
+        """
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.event.wait()  # pyright: ignore
+
+            if flight.error is not None:  # pyright: ignore
+                raise flight.error  # pyright: ignore
+
+            return flight.value  # pyright: ignore
+
+        try:
+            flight.value = self._run_locked(key, compute, lookup)  # pyright: ignore
+        except BaseException as error:
+            flight.error = error  # pyright: ignore
+
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+            flight.event.set()  # pyright: ignore
+
+        return flight.value  # pyright: ignore
+
+
+LOCK_PATH: str = os.environ.get(
+    "COLOUR_DASH_LOCK_PATH", os.path.join(tempfile.gettempdir(), "colour-dash.lock")
+)
+"""
+Path of the lock file coalescing the computations across the processes.
+"""
+
+SINGLE_FLIGHT: SingleFlight = SingleFlight(
+    None if isinstance(CACHE, CacheLRU) else LOCK_PATH
+)
+"""
+Single-flight coalescer of the computations cached in the
+:attr:`apps.cache.CACHE` attribute, the in-process cache is not shared thus
+the computations are only coalesced within the process.
+"""
+
+
+CACHE_KEY_VERSIONS: Dict[str, str] = {}
+"""
+Versions of the cache key parts whose definition can change at runtime, e.g.,
+the names of the in-house *RGB* colourspaces, they are appended to those parts
+in the cache keys so that the cache entries of a redefined part are not
+reused.
+"""
+
+
+def set_cache_key_versions(versions: Mapping[str, str]) -> None:
+    """
+    Set the versions of the cache key parts.
+
+    Parameters
+    ----------
+    versions
+        Versions of the cache key parts, see
+        :attr:`apps.cache.CACHE_KEY_VERSIONS` attribute.
+    """
+
+    global CACHE_KEY_VERSIONS  # noqa: PLW0603
+
+    CACHE_KEY_VERSIONS = dict(versions)
+
+
+def _cache_key(namespace: str, args: tuple) -> str:
+    """
+    Return the cache key of given namespace and arguments.
+    """
+
+    parts = map(str, (namespace, *args))
+    versions = CACHE_KEY_VERSIONS
+
+    if not versions:
+        return "|".join(parts)
+
+    return "|".join(
+        f"{part}@{versions[part]}" if part in versions else part for part in parts
+    )
+
+
+def _cached(key: str, compute: Callable[[], bytes]) -> bytes:
+    """
+    Return the value of given key from the :attr:`apps.cache.CACHE`
+    attribute, computing and caching it once across the concurrent callers on
+    a cache miss.
+    """
+
+    with span("cache", **{"cache.key": key}) as current:
+        value = CACHE.get(key)
+        current.set_attribute("cache.hit", value is not None)
+        if value is not None:
+            return value
+
+        def compute_and_set() -> bytes:
+            """Compute and cache the value."""
+
+            value = compute()
+            CACHE.set(key, value)
+
+            return value
+
+        return SINGLE_FLIGHT.run(
+            key, compute_and_set, functools.partial(CACHE.get, key)
+        )
+
+
+def cached_output(namespace: str) -> Callable:
+    """
+    Decorate given callback so that its string output is cached in the
+    :attr:`apps.cache.CACHE` attribute, keyed by given namespace and the
+    callback arguments. The concurrent calls with the same arguments are
+    coalesced by the :attr:`apps.cache.SINGLE_FLIGHT` attribute.
+
+    Parameters
+    ----------
+    namespace
+        Namespace of the cache keys, e.g., the app name.
+
+    Returns
+    -------
+    Callable
+        Decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        """Decorate given callback."""
+
+        @functools.wraps(function)
+        def wrapper(*args: Any) -> str:
+            """Wrap given callback."""
+
+            key = _cache_key(namespace, args)
+
+            return _cached(key, lambda: function(*args).encode("utf-8")).decode(
+                "utf-8"
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def cached_array(namespace: str) -> Callable:
+    """
+    Decorate given function so that its array output is cached in the
+    :attr:`apps.cache.CACHE` attribute as a binary payload, keyed by given
+    namespace and the function arguments. The concurrent calls with the same
+    arguments are coalesced by the :attr:`apps.cache.SINGLE_FLIGHT`
+    attribute.
+
+    Parameters
+    ----------
+    namespace
+        Namespace of the cache keys, e.g., the function name.
+
+    Returns
+    -------
+    Callable
+        Decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        """Decorate given function."""
+
+        @functools.wraps(function)
+        def wrapper(*args: Any) -> NDArray:
+            """Wrap given function."""
+
+            key = _cache_key(namespace, args)
+
+            return decode_array(_cached(key, lambda: encode_array(function(*args))))
+
+        return wrapper
+
+    return decorator
@@ -5,63 +5,2165 @@ Common
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
 import typing
+from bisect import bisect_left
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from html import escape
 from io import StringIO
 
+import numpy as np
+
 from colour.adaptation import CHROMATIC_ADAPTATION_TRANSFORMS
-from colour.colorimetry import CCS_ILLUMINANTS
+from colour.algebra import vecmul
+from colour.colorimetry import (
+    CCS_ILLUMINANTS,
+    MSDS_CMFS,
+    SDS_ILLUMINANTS,
+    SPECTRAL_SHAPE_DEFAULT,
+    sd_to_XYZ,
+)
+
+if typing.TYPE_CHECKING:
+    from colour.hints import (
+        ArrayLike,
+        Callable,
+        Dict,
+        Generator,
+        Iterable,
+        List,
+        Mapping,
+        NDArrayFloat,
+        NDArrayInt,
+        Tuple,
+    )
+
+    from dash.development.base_component import Component
+
+from colour.io import LUTOperatorMatrix, write_LUT_SonySPImtx
+from colour.models import (
+    RGB_COLOURSPACES,
+    RGB_Colourspace,
+    XYZ_to_xy,
+    chromatically_adapted_primaries,
+    linear_function,
+    UCS_uv_to_xy,
+    matrix_RGB_to_RGB,
+    xy_to_Luv_uv,
+    xy_to_XYZ,
+)
+from colour.temperature import CCT_to_uv_Ohno2013
+from colour.utilities import as_float_array, row_as_diagonal, tstack, usage_warning
+
+from apps.cache import cached_array, cached_output, set_cache_key_versions
+from apps.tracing import traced
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "RGB_COLOURSPACES_IN_HOUSE",
+    "OPTIONS_RGB_COLOURSPACE",
+    "OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM",
+    "OBSERVERS",
+    "OPTIONS_OBSERVER",
+    "ILLUMINANTS",
+    "CCS_ILLUMINANTS_OBSERVERS",
+    "OPTIONS_ILLUMINANTS_OBSERVERS",
+    "OPTIONS_ILLUMINANTS",
+    "FORMATTERS_MATRIX_RGB_TO_RGB",
+    "FORMATTERS_CHROMATICALLY_ADAPTED_PRIMARIES",
+    "DECIMALS_RANGE",
+    "INDEX_RGB_COLOURSPACE",
+    "INDEX_CHROMATIC_ADAPTATION_TRANSFORM",
+    "INDEX_OBSERVER",
+    "INDEX_ILLUMINANT",
+    "PREFIXES_WHITEPOINT_TARGET",
+    "RANGE_CCT",
+    "RANGE_D_UV",
+    "SAMPLES_CCT_SWEEP",
+    "is_whitepoint_target",
+    "canonical_whitepoint_target",
+    "whitepoint_target",
+    "label_illuminant",
+    "PREFIX_CUSTOM_RGB_COLOURSPACE",
+    "DECIMALS_CUSTOM_RGB_COLOURSPACE",
+    "is_custom_RGB_colourspace",
+    "canonical_custom_RGB_colourspace",
+    "RGB_colourspace",
+    "label_RGB_colourspace",
+    "canonical_RGB_colourspace",
+    "canonical_chromatic_adaptation_transform",
+    "canonical_observer",
+    "canonical_illuminant",
+    "canonical_formatter",
+    "canonical_decimals",
+    "SCHEMA_STATE_MATRIX_RGB_TO_RGB",
+    "SCHEMA_STATE_CHROMATICALLY_ADAPTED_PRIMARIES",
+    "STATE_DEFAULT_MATRIX_RGB_TO_RGB",
+    "STATE_DEFAULT_CHROMATICALLY_ADAPTED_PRIMARIES",
+    "canonical_state",
+    "SEARCH_LIMIT",
+    "SearchIndex",
+    "SEARCH_INDEX_RGB_COLOURSPACE",
+    "options_RGB_colourspace",
+    "options_illuminant",
+    "refresh_layout_options",
+    "CATALOGUE_PATH",
+    "CATALOGUE_INTERVAL",
+    "HOOKS_RELOAD_CATALOGUE",
+    "reload_catalogue",
+    "request_reload_catalogue",
+    "refresh_catalogue",
+    "catalogue_state",
+    "compute_matrix_RGB_to_RGB",
+    "CHROMATIC_ADAPTATION_TRANSFORMS_COMPARISON",
+    "compute_matrices_RGB_to_RGB_comparison",
+    "compute_chromatically_adapted_primaries",
+    "area_polygons",
+    "intersection_area_triangles",
+    "compute_gamuts_intersection_areas",
+    "format_array",
+    "TEMPLATE_NUKE_NODE_COLORMATRIX",
+    "nuke_format_matrix",
+    "spimtx_format_matrix",
+    "TEMPLATE_OCIO_COLORSPACE",
+    "matrix_3x3_to_4x4",
+    "format_matrix",
+    "format_matrix_RGB_to_RGB",
+    "format_matrices_RGB_to_RGB_comparison",
+    "format_CCT_sweep",
+    "format_chromatically_adapted_primaries",
+    "TEMPLATE_PRERENDER",
+    "prerender_app",
+    "TILE_SIZE",
+    "TILE_WORKERS",
+    "RGB_to_RGB_tiled",
+    "name_LUT3D_RGB_to_RGB",
+    "LUT3D_table_RGB_to_RGB",
+    "format_LUT3D_table",
+]
+
+RGB_COLOURSPACES_IN_HOUSE: Dict[str, RGB_Colourspace] = {}
+"""
+In-house *RGB* colourspaces of the catalogue file, see
+:func:`apps.common.reload_catalogue` definition.
+"""
+
+OPTIONS_RGB_COLOURSPACE: List[Dict] = [
+    {"label": key, "value": key}
+    for key in sorted(RGB_COLOURSPACES.keys())
+    if key not in ("aces", "adobe1998", "prophoto")
+]
+"""
+*RGB* colourspace options for a :class:`Dropdown` class instance.
+"""
+
+OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM: List[Dict] = [
+    {"label": key, "value": key}
+    for key in sorted(CHROMATIC_ADAPTATION_TRANSFORMS.keys())
+]
+"""
+*Chromatic adaptation transform* options for a :class:`Dropdown` class
+instance.
+"""
+
+OBSERVERS: tuple = (
+    "CIE 1931 2 Degree Standard Observer",
+    "CIE 1964 10 Degree Standard Observer",
+    "CIE 2015 2 Degree Standard Observer",
+    "CIE 2015 10 Degree Standard Observer",
+)
+"""
+Standard observers, the first one is the default observer.
+"""
+
+OPTIONS_OBSERVER: List[Dict] = [{"label": key, "value": key} for key in OBSERVERS]
+"""
+Standard observer options for a :class:`Dropdown` class instance.
+"""
+
+_CMFS_OBSERVERS: tuple = tuple(
+    MSDS_CMFS[observer].copy().align(SPECTRAL_SHAPE_DEFAULT) for observer in OBSERVERS
+)
+"""
+Colour matching functions of the standard observers aligned to the default
+spectral shape, as used by the correlated colour temperature computations.
+"""
+
+
+def _CCS_illuminants_observers() -> Tuple[tuple, NDArrayFloat]:
+    """
+    Tabulate the *CIE xy* chromaticity coordinates of the illuminants for
+    every standard observer.
+
+    The published chromaticity coordinates are used when they exist, they are
+    otherwise computed from the illuminants spectral distributions.
+    """
+
+    illuminants = set(SDS_ILLUMINANTS.keys())
+    for observer in OBSERVERS:
+        if observer in CCS_ILLUMINANTS:
+            illuminants.update(CCS_ILLUMINANTS[observer].keys())
+
+    illuminants = sorted(illuminants)
+
+    xy = np.full((len(OBSERVERS), len(illuminants), 2), np.nan)
+    for i, observer in enumerate(OBSERVERS):
+        for j, illuminant in enumerate(illuminants):
+            if observer in CCS_ILLUMINANTS:
+                if illuminant in CCS_ILLUMINANTS[observer]:
+                    xy[i, j] = CCS_ILLUMINANTS[observer][illuminant]
+            elif illuminant in SDS_ILLUMINANTS:
+                xy[i, j] = XYZ_to_xy(
+                    sd_to_XYZ(SDS_ILLUMINANTS[illuminant], MSDS_CMFS[observer])
+                )
+
+    xy.setflags(write=False)
+
+    return tuple(illuminants), xy
+
+
+ILLUMINANTS, CCS_ILLUMINANTS_OBSERVERS = _CCS_illuminants_observers()
+"""
+Illuminants defined for at least one standard observer and their *CIE xy*
+chromaticity coordinates of shape (observers, illuminants, 2) indexed as
+:attr:`apps.common.OBSERVERS` and :attr:`apps.common.ILLUMINANTS` attributes,
+the undefined chromaticity coordinates are *NaN*. The in-house illuminants of
+the catalogue file are sorted last.
+"""
+
+_ILLUMINANTS_BUILT_IN, _CCS_ILLUMINANTS_OBSERVERS_BUILT_IN = (
+    ILLUMINANTS,
+    CCS_ILLUMINANTS_OBSERVERS,
+)
+"""
+Built-in illuminants and their *CIE xy* chromaticity coordinates, i.e.,
+without the in-house illuminants of the catalogue file.
+"""
+
+_INDEXES_OBSERVER: Dict[str, int] = {
+    observer: i for i, observer in enumerate(OBSERVERS)
+}
+"""
+Standard observer indexes in :attr:`apps.common.CCS_ILLUMINANTS_OBSERVERS`
+attribute.
+"""
+
+_INDEXES_ILLUMINANT: Dict[str, int] = {
+    illuminant: i for i, illuminant in enumerate(ILLUMINANTS)
+}
+"""
+Illuminant indexes in :attr:`apps.common.CCS_ILLUMINANTS_OBSERVERS` attribute.
+"""
+
+
+
+def _options_illuminants_observers(
+    illuminants: Iterable[str], xy: NDArrayFloat
+) -> Dict[str, List[Dict]]:
+    """
+    Return the options of the illuminants defined for each standard observer
+    from given illuminants and *CIE xy* chromaticity coordinates.
+    """
+
+    return {
+        observer: [
+            {"label": illuminant, "value": illuminant}
+            for illuminant, xy_i in zip(illuminants, xy[i], strict=True)
+            if not np.isnan(xy_i[0])
+        ]
+        for i, observer in enumerate(OBSERVERS)
+    }
+
+
+OPTIONS_ILLUMINANTS_OBSERVERS: Dict[str, List[Dict]] = _options_illuminants_observers(
+    ILLUMINANTS, CCS_ILLUMINANTS_OBSERVERS
+)
+"""
+Illuminant options of each standard observer for a :class:`Dropdown` class
+instance.
+"""
+
+OPTIONS_ILLUMINANTS: List[Dict] = OPTIONS_ILLUMINANTS_OBSERVERS[OBSERVERS[0]]
+"""
+*CIE 1931 2 Degree Standard Observer* illuminant options for a
+:class:`Dropdown`class instance.
+"""
+
+FORMATTERS_MATRIX_RGB_TO_RGB: tuple = ("str", "repr", "nuke", "opencolorio", "spimtx")
+"""
+Formatters of the colour transformation matrix.
+"""
+
+FORMATTERS_CHROMATICALLY_ADAPTED_PRIMARIES: tuple = ("str", "repr")
+"""
+Formatters of the chromatically adapted *primaries*.
+"""
+
+DECIMALS_RANGE: tuple = (1, 15)
+"""
+Range of the decimals used when formatting the outputs.
+"""
+
+
+def _normalise_name(name: str) -> str:
+    """
+    Normalise given name for lookup in an alias index, i.e., lower case it and
+    remove any character that is not alphanumeric or a "+" sign.
+    """
+
+    return re.sub(r"[^a-z0-9+]", "", str(name).lower())
+
+
+def _alias_index(aliases: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Build an alias index mapping the normalised aliases to their canonical
+    value, the first alias wins on collision.
+    """
+
+    index = {}
+    for alias, value in aliases.items():
+        index.setdefault(alias, value)
+        index.setdefault(alias.lower(), value)
+        index.setdefault(_normalise_name(alias), value)
+
+    return index
+
+
+_ALIASES_RGB_COLOURSPACE_BUILT_IN: Dict[str, str] = {
+    **{option["value"]: option["value"] for option in OPTIONS_RGB_COLOURSPACE},
+    **{key: RGB_COLOURSPACES[key].name for key in RGB_COLOURSPACES},
+}
+"""
+Built-in *RGB* colourspace aliases, i.e., without the in-house *RGB*
+colourspaces of the catalogue file.
+"""
+
+_OPTIONS_RGB_COLOURSPACE_BUILT_IN: List[Dict] = OPTIONS_RGB_COLOURSPACE
+"""
+Built-in *RGB* colourspace options, the in-house *RGB* colourspaces of the
+catalogue file are sorted after them.
+"""
+
+INDEX_RGB_COLOURSPACE: Dict[str, str] = _alias_index(
+    _ALIASES_RGB_COLOURSPACE_BUILT_IN
+)
+"""
+*RGB* colourspace alias index, e.g., *aces* and *prophoto* aliases map to
+*ACES2065-1* and *ProPhoto RGB* respectively.
+"""
+
+INDEX_CHROMATIC_ADAPTATION_TRANSFORM: Dict[str, str] = _alias_index(
+    {
+        **{
+            option["value"]: option["value"]
+            for option in OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM
+        },
+        "None": "None",
+    }
+)
+"""
+*Chromatic adaptation transform* alias index.
+"""
+
+INDEX_OBSERVER: Dict[str, str] = _alias_index(
+    {
+        **{observer: observer for observer in OBSERVERS},
+        "cie_2_1931": "CIE 1931 2 Degree Standard Observer",
+        "cie_10_1964": "CIE 1964 10 Degree Standard Observer",
+        "cie_2_2015": "CIE 2015 2 Degree Standard Observer",
+        "cie_10_2015": "CIE 2015 10 Degree Standard Observer",
+    }
+)
+"""
+Standard observer alias index, e.g., *cie_10_1964* alias maps to
+*CIE 1964 10 Degree Standard Observer*.
+"""
+
+INDEX_ILLUMINANT: Dict[str, str] = _alias_index(
+    {illuminant: illuminant for illuminant in ILLUMINANTS}
+)
+"""
+Illuminant alias index of all the standard observers.
+"""
+
+
+def _format_quantised(value: float, decimals: int) -> str:
+    """Format given value quantised to given decimals without trailing zeros."""
+
+    return f"{round(value, decimals) + 0:.{decimals}f}".rstrip("0").rstrip(".")
+
+
+PREFIX_CUSTOM_RGB_COLOURSPACE: str = "custom:"
+"""
+Prefix of the custom *RGB* colourspace definitions, e.g.,
+``custom:0.64,0.33,0.3,0.6,0.15,0.06,0.3127,0.329`` where the values are the
+*CIE xy* chromaticity coordinates of the red, green and blue *primaries* and
+of the whitepoint.
+"""
+
+DECIMALS_CUSTOM_RGB_COLOURSPACE: int = 8
+"""
+Decimals the custom *RGB* colourspace chromaticity coordinates are quantised
+to, equivalent definitions share the same canonical definition and thus the
+same cache entries.
+"""
+
+
+def is_custom_RGB_colourspace(value: str) -> bool:
+    """
+    Return whether given *RGB* colourspace is a custom definition.
+
+    Parameters
+    ----------
+    value
+        *RGB* colourspace name or custom definition.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the *RGB* colourspace is a custom definition.
+    """
+
+    return str(value).lower().startswith(PREFIX_CUSTOM_RGB_COLOURSPACE)
+
+
+def canonical_custom_RGB_colourspace(value: str) -> str:
+    """
+    Return the canonical definition of given custom *RGB* colourspace.
+
+    The chromaticity coordinates can be separated with commas, semicolons or
+    spaces, the prefix is optional. They are quantised to
+    :attr:`apps.common.DECIMALS_CUSTOM_RGB_COLOURSPACE` attribute decimals.
+
+    Parameters
+    ----------
+    value
+        Custom *RGB* colourspace definition, e.g.,
+        ``custom:0.640,0.330,0.300,0.600,0.150,0.060,0.3127,0.3290``.
+
+    Returns
+    -------
+    :class:`str`
+        Canonical custom *RGB* colourspace definition.
+
+    Raises
+    ------
+    ValueError
+        If the custom *RGB* colourspace definition is not valid.
+    """
+
+    definition = str(value).strip()
+    if is_custom_RGB_colourspace(definition):
+        definition = definition[len(PREFIX_CUSTOM_RGB_COLOURSPACE) :]
+
+    try:
+        xy = np.array(
+            [float(token) for token in re.split(r"[,;\s]+", definition.strip())]
+        )
+    except ValueError:
+        xy = np.array([])
+
+    if xy.size != 8 or not np.all(np.isfinite(xy)) or xy[7] <= 0:
+        error = (
+            f'"{value}" is not a valid custom RGB colourspace, it must define '
+            f"the xy chromaticity coordinates of the primaries and whitepoint!"
+        )
+
+        raise ValueError(error)
+
+    canonical = PREFIX_CUSTOM_RGB_COLOURSPACE + ",".join(
+        _format_quantised(value, DECIMALS_CUSTOM_RGB_COLOURSPACE) for value in xy
+    )
+
+    _custom_RGB_colourspace(canonical)
+
+    return canonical
+
+
+@lru_cache(maxsize=256)
+def _custom_RGB_colourspace(definition: str) -> RGB_Colourspace:
+    """
+    Build the *RGB* colourspace of given canonical custom definition, it is
+    named after the digest of the definition.
+    """
+
+    xy = np.array(definition[len(PREFIX_CUSTOM_RGB_COLOURSPACE) :].split(","), float)
+
+    colourspace = RGB_Colourspace(
+        f"Custom {hashlib.blake2b(definition.encode(), digest_size=4).hexdigest()}",
+        np.reshape(xy[:6], (3, 2)),
+        xy[6:],
+        cctf_encoding=linear_function,
+        cctf_decoding=linear_function,
+        use_derived_matrix_RGB_to_XYZ=True,
+        use_derived_matrix_XYZ_to_RGB=True,
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        try:
+            valid = np.all(np.isfinite(colourspace.matrix_XYZ_to_RGB))
+        except np.linalg.LinAlgError:
+            valid = False
+
+    if not valid:
+        error = (
+            f'"{definition}" custom RGB colourspace primaries and whitepoint are '
+            f"degenerate!"
+        )
+
+        raise ValueError(error)
+
+    return colourspace
+
+
+@traced()
+def RGB_colourspace(value: str) -> RGB_Colourspace:
+    """
+    Return the *RGB* colourspace of given canonical name or custom definition.
+
+    Parameters
+    ----------
+    value
+        Canonical *RGB* colourspace name or custom definition, see
+        :func:`apps.common.canonical_RGB_colourspace` definition.
+
+    Returns
+    -------
+    :class:`colour.RGB_Colourspace`
+        *RGB* colourspace.
+    """
+
+    if is_custom_RGB_colourspace(value):
+        return _custom_RGB_colourspace(value)
+
+    colourspace = RGB_COLOURSPACES_IN_HOUSE.get(value)
+    if colourspace is not None:
+        return colourspace
+
+    return RGB_COLOURSPACES[value]
+
+
+def label_RGB_colourspace(value: str) -> str:
+    """
+    Return the label of given *RGB* colourspace, i.e., its name or the name of
+    the custom *RGB* colourspace, e.g., *Custom 5c1f0a2b*.
+
+    Parameters
+    ----------
+    value
+        Canonical *RGB* colourspace name or custom definition.
+
+    Returns
+    -------
+    :class:`str`
+        *RGB* colourspace label.
+    """
+
+    return RGB_colourspace(value).name if is_custom_RGB_colourspace(value) else value
+
+
+PREFIXES_WHITEPOINT_TARGET: Tuple = ("cct:", "xy:")
+"""
+Prefixes of the target whitepoint definitions, i.e., a correlated colour
+temperature *CCT* with optional *D_uv*, e.g.,
+``cct:6504`` or ``cct:6504,0.0032``, a correlated colour temperature sweep,
+e.g., ``cct:2000:10000:100`` or raw *CIE xy* chromaticity coordinates, e.g.,
+``xy:0.3127,0.329``.
+"""
+
+RANGE_CCT: Tuple = (1000, 100000)
+"""
+Range of the target correlated colour temperature *CCT*.
+"""
+
+RANGE_D_UV: Tuple = (-0.05, 0.05)
+"""
+Range of the target *D_uv*.
+"""
+
+SAMPLES_CCT_SWEEP: int = 1001
+"""
+Maximum number of samples of a correlated colour temperature sweep.
+"""
+
+
+def is_whitepoint_target(value: str) -> bool:
+    """
+    Return whether given illuminant is a target whitepoint definition.
+
+    Parameters
+    ----------
+    value
+        Illuminant name or target whitepoint definition.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the illuminant is a target whitepoint definition.
+    """
+
+    return str(value).lower().startswith(PREFIXES_WHITEPOINT_TARGET)
+
+
+def _CCT_sweep(start: float, end: float, step: float) -> NDArrayFloat:
+    """Return the correlated colour temperatures of given sweep."""
+
+    return start + np.arange(np.floor((end - start) / step + 1e-9) + 1) * step
+
+
+def _parse_whitepoint_target(value: str) -> Tuple[str, NDArrayFloat]:
+    """
+    Parse given target whitepoint definition into its prefix and values, i.e.,
+    the *CIE xy* chromaticity coordinates, or the correlated colour
+    temperature *CCT* or sweep start, end and step followed by
+    *D_uv*.
+    """
+
+    prefix, definition = str(value).strip().lower().split(":", 1)
+    tokens = re.split(r"[,;\s]+", definition.strip())
+
+    if prefix == "xy":
+        values = np.array([float(token) for token in tokens])
+        if len(values) != 2 or not np.all(np.isfinite(values)) or values[1] <= 0:
+            raise ValueError
+
+        return prefix, values
+
+    if len(tokens) not in (1, 2):
+        raise ValueError
+
+    CCT = [float(token) for token in tokens[0].split(":")]
+    values = np.array([*CCT, float(tokens[1]) if len(tokens) == 2 else 0])
+
+    if not np.all(np.isfinite(values)) or len(CCT) not in (1, 3):
+        raise ValueError
+
+    if len(CCT) == 3:
+        start, end, step = CCT
+        if not (step > 0 and start <= end):
+            raise ValueError
+
+        if len(_CCT_sweep(start, end, step)) > SAMPLES_CCT_SWEEP:
+            raise ValueError
+
+        CCT = [start, end]
+
+    if not (
+        RANGE_CCT[0] <= min(CCT)
+        and max(CCT) <= RANGE_CCT[1]
+        and RANGE_D_UV[0] <= values[-1] <= RANGE_D_UV[1]
+    ):
+        raise ValueError
+
+    return prefix, values
+
+
+def canonical_whitepoint_target(value: str) -> str:
+    """
+    Return the canonical definition of given target whitepoint.
+
+    The correlated colour temperatures are quantised to 2 decimals, the
+    *D_uv* and *CIE xy* chromaticity coordinates to 8 decimals.
+
+    Parameters
+    ----------
+    value
+        Target whitepoint definition, e.g., ``CCT:6504, 0.0032``.
+
+    Returns
+    -------
+    :class:`str`
+        Canonical target whitepoint definition, e.g., ``cct:6504,0.0032``.
+
+    Raises
+    ------
+    ValueError
+        If the target whitepoint definition is not valid.
+    """
+
+    try:
+        prefix, values = _parse_whitepoint_target(value)
+    except ValueError:
+        error = (
+            f'"{value}" is not a valid target whitepoint, it must be a '
+            f'correlated colour temperature "cct:T[,D_uv]", a sweep '
+            f'"cct:START:END:STEP[,D_uv]" with at most {SAMPLES_CCT_SWEEP} '
+            f'samples or chromaticity coordinates "xy:x,y"!'
+        )
+
+        raise ValueError(error) from None
+
+    if prefix == "xy":
+        return "xy:" + ",".join(_format_quantised(value, 8) for value in values)
+
+    CCT = ":".join(_format_quantised(value, 2) for value in values[:-1])
+    D_uv = _format_quantised(values[-1], 8)
+
+    return f"cct:{CCT}" if D_uv == "0" else f"cct:{CCT},{D_uv}"
+
+
+def whitepoint_target(
+    value: str, observer: str = OBSERVERS[0]
+) -> Tuple[NDArrayFloat, NDArrayFloat | None]:
+    """
+    Return the *CIE xy* chromaticity coordinates of given canonical illuminant
+    name or target whitepoint definition for given standard observer.
+
+    The illuminant chromaticity coordinates are looked up in the
+    :attr:`apps.common.CCS_ILLUMINANTS_OBSERVERS` attribute and the correlated
+    colour temperature sweeps are converted at once with *Ohno (2013)* method.
+
+    Parameters
+    ----------
+    value
+        Canonical illuminant name or target whitepoint definition.
+    observer
+        Canonical standard observer name.
+
+    Returns
+    -------
+    :class:`tuple`
+        *CIE xy* chromaticity coordinates of shape (2, ) or (samples, 2) for a
+        sweep, and correlated colour temperatures *CCT* and
+        *D_uv* of shape (samples, 2) for a sweep, *None*
+        otherwise.
+
+    Raises
+    ------
+    ValueError
+        If the illuminant is not defined for the standard observer.
+    """
+
+    i = _INDEXES_OBSERVER[observer]
+
+    if not is_whitepoint_target(value):
+        xy = CCS_ILLUMINANTS_OBSERVERS[i, _INDEXES_ILLUMINANT[value]]
+
+        if np.isnan(xy[0]):
+            error = f'"{value}" illuminant is not defined for the "{observer}"!'
+
+            raise ValueError(error)
+
+        return xy, None
+
+    prefix, values = _parse_whitepoint_target(value)
+
+    if prefix == "xy":
+        return values, None
+
+    if len(values) == 2:
+        return UCS_uv_to_xy(CCT_to_uv_Ohno2013(values, _CMFS_OBSERVERS[i])), None
+
+    CCT = _CCT_sweep(*values[:3])
+    CCT_D_uv = tstack([CCT, np.full(CCT.shape, values[3])])
+
+    return UCS_uv_to_xy(CCT_to_uv_Ohno2013(CCT_D_uv, _CMFS_OBSERVERS[i])), CCT_D_uv
+
+
+def label_illuminant(value: str) -> str:
+    """
+    Return the label of given canonical illuminant name or target whitepoint
+    definition, e.g., *CCT 6504K, Duv 0.0032*.
+
+    Parameters
+    ----------
+    value
+        Canonical illuminant name or target whitepoint definition.
+
+    Returns
+    -------
+    :class:`str`
+        Illuminant label.
+    """
+
+    if not is_whitepoint_target(value):
+        return value
+
+    prefix, definition = value.split(":", 1)
+    if prefix == "xy":
+        return f"xy {definition.replace(',', ', ')}"
+
+    CCT, _comma, D_uv = definition.partition(",")
+    CCT = CCT.split(":")
+    label = (
+        f"CCT {CCT[0]}K to {CCT[1]}K, {CCT[2]}K Steps"
+        if len(CCT) == 3
+        else f"CCT {CCT[0]}K"
+    )
+
+    return f"{label}, Duv {D_uv}" if D_uv else label
+
+
+def _canonical_value(index: Mapping[str, str], value: str, name: str) -> str:
+    """
+    Return the canonical value of given value from given alias index.
+    """
+
+    value = str(value)
+
+    canonical = index.get(value)
+    if canonical is None:
+        canonical = index.get(_normalise_name(value))
+
+    if canonical is None:
+        error = f'"{value}" is not a valid {name}!'
+
+        raise ValueError(error)
+
+    return canonical
+
+
+def canonical_RGB_colourspace(value: str) -> str:
+    """
+    Return the canonical name of given *RGB* colourspace name or alias, or the
+    canonical definition of given custom *RGB* colourspace.
+
+    Parameters
+    ----------
+    value
+        *RGB* colourspace name or alias, e.g., *aces* or *itu-r bt.709*, or
+        custom *RGB* colourspace definition, see
+        :func:`apps.common.canonical_custom_RGB_colourspace` definition.
+
+    Returns
+    -------
+    :class:`str`
+        Canonical *RGB* colourspace name or definition.
+
+    Raises
+    ------
+    ValueError
+        If the *RGB* colourspace is unknown or not valid.
+    """
+
+    if is_custom_RGB_colourspace(value):
+        return canonical_custom_RGB_colourspace(value)
+
+    return _canonical_value(INDEX_RGB_COLOURSPACE, value, "RGB colourspace")
+
+
+def canonical_chromatic_adaptation_transform(
+    value: str, allow_none: bool = True
+) -> str:
+    """
+    Return the canonical name of given *chromatic adaptation transform*.
+
+    Parameters
+    ----------
+    value
+        *Chromatic adaptation transform* name, e.g., *cat02*.
+    allow_none
+        Whether *None* is a valid *chromatic adaptation transform*.
+
+    Returns
+    -------
+    :class:`str`
+        Canonical *chromatic adaptation transform* name.
+
+    Raises
+    ------
+    ValueError
+        If the *chromatic adaptation transform* is unknown.
+    """
+
+    canonical = _canonical_value(
+        INDEX_CHROMATIC_ADAPTATION_TRANSFORM,
+        value,
+        "chromatic adaptation transform",
+    )
+
+    if canonical == "None" and not allow_none:
+        error = '"None" is not a valid chromatic adaptation transform!'
+
+        raise ValueError(error)
+
+    return canonical
+
+
+def canonical_observer(value: str) -> str:
+    """
+    Return the canonical name of given standard observer.
+
+    Parameters
+    ----------
+    value
+        Standard observer name or alias, e.g., *cie_10_1964*.
+
+    Returns
+    -------
+    :class:`str`
+        Canonical standard observer name.
+
+    Raises
+    ------
+    ValueError
+        If the standard observer is unknown.
+    """
+
+    return _canonical_value(INDEX_OBSERVER, value, "standard observer")
+
+
+def canonical_illuminant(value: str) -> str:
+    """
+    Return the canonical name of given illuminant or the canonical definition
+    of given target whitepoint.
+
+    Parameters
+    ----------
+    value
+        Illuminant name, e.g., *d65*, or target whitepoint definition, see
+        :func:`apps.common.canonical_whitepoint_target` definition.
+
+    Returns
+    -------
+    :class:`str`
+        Canonical illuminant name or target whitepoint definition.
+
+    Raises
+    ------
+    ValueError
+        If the illuminant is unknown or the target whitepoint is not valid.
+    """
+
+    if is_whitepoint_target(value):
+        return canonical_whitepoint_target(value)
+
+    return _canonical_value(INDEX_ILLUMINANT, value, "illuminant")
+
+
+def canonical_formatter(value: str, formatters: Iterable[str]) -> str:
+    """
+    Return the canonical name of given formatter.
+
+    Parameters
+    ----------
+    value
+        Formatter name, e.g., *Nuke*.
+    formatters
+        Valid formatters.
+
+    Returns
+    -------
+    :class:`str`
+        Canonical formatter name.
+
+    Raises
+    ------
+    ValueError
+        If the formatter is not valid.
+    """
+
+    canonical = str(value).lower()
+
+    if canonical not in formatters:
+        error = f'"{value}" is not a valid formatter!'
+
+        raise ValueError(error)
+
+    return canonical
+
+
+def canonical_decimals(value: str | int) -> int:
+    """
+    Return the canonical decimals of given value, i.e., clipped to the
+    :attr:`apps.common.DECIMALS_RANGE` attribute range.
+
+    Parameters
+    ----------
+    value
+        Decimals.
+
+    Returns
+    -------
+    :class:`int`
+        Canonical decimals.
+
+    Raises
+    ------
+    ValueError
+        If the decimals are not an integer.
+    """
+
+    try:
+        decimals = int(value)
+    except (TypeError, ValueError):
+        error = f'"{value}" is not a valid number of decimals!'
+
+        raise ValueError(error) from None
+
+    return min(max(decimals, DECIMALS_RANGE[0]), DECIMALS_RANGE[1])
+
+
+SCHEMA_STATE_MATRIX_RGB_TO_RGB: Dict[str, Callable] = {
+    "input_colourspace": canonical_RGB_colourspace,
+    "output_colourspace": canonical_RGB_colourspace,
+    "chromatic_adaptation_transform": canonical_chromatic_adaptation_transform,
+    "formatter": partial(canonical_formatter, formatters=FORMATTERS_MATRIX_RGB_TO_RGB),
+    "decimals": canonical_decimals,
+}
+"""
+State schema of the colour transformation matrix computation, i.e., the
+canonicalisation definition of each state key.
+"""
+
+SCHEMA_STATE_CHROMATICALLY_ADAPTED_PRIMARIES: Dict[str, Callable] = {
+    "colourspace": canonical_RGB_colourspace,
+    "illuminant": canonical_illuminant,
+    "observer": canonical_observer,
+    "chromatic_adaptation_transform": partial(
+        canonical_chromatic_adaptation_transform, allow_none=False
+    ),
+    "formatter": partial(
+        canonical_formatter, formatters=FORMATTERS_CHROMATICALLY_ADAPTED_PRIMARIES
+    ),
+    "decimals": canonical_decimals,
+}
+"""
+State schema of the chromatically adapted *primaries* computation, i.e., the
+canonicalisation definition of each state key.
+"""
+
+STATE_DEFAULT_MATRIX_RGB_TO_RGB: Dict = {
+    "input_colourspace": OPTIONS_RGB_COLOURSPACE[0]["value"],
+    "output_colourspace": OPTIONS_RGB_COLOURSPACE[0]["value"],
+    "chromatic_adaptation_transform": OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM[0][
+        "value"
+    ],
+    "formatter": "str",
+    "decimals": 10,
+}
+"""
+Default state of the colour transformation matrix computation.
+"""
+
+STATE_DEFAULT_CHROMATICALLY_ADAPTED_PRIMARIES: Dict = {
+    "colourspace": OPTIONS_RGB_COLOURSPACE[0]["value"],
+    "illuminant": OPTIONS_ILLUMINANTS[0]["value"],
+    "observer": OPTIONS_OBSERVER[0]["value"],
+    "chromatic_adaptation_transform": OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM[0][
+        "value"
+    ],
+    "formatter": "str",
+    "decimals": 10,
+}
+"""
+Default state of the chromatically adapted *primaries* computation.
+"""
+
+
+def canonical_state(
+    state: Mapping, schema: Mapping[str, Callable], default: Mapping
+) -> Dict:
+    """
+    Validate and canonicalise given state with given schema.
+
+    The state keys can use either underscores or hyphens, e.g., as in the
+    URL queries, missing keys are taken from given default state and unknown
+    keys are ignored. The canonical state is ordered as the schema so that
+    equivalent states produce the same cache keys.
+
+    Parameters
+    ----------
+    state
+        State to canonicalise, values can be lists as returned by
+        :func:`urllib.parse.parse_qs` definition.
+    schema
+        State schema, e.g.,
+        :attr:`apps.common.SCHEMA_STATE_MATRIX_RGB_TO_RGB` attribute.
+    default
+        Default state.
+
+    Returns
+    -------
+    :class:`dict`
+        Canonical state.
+
+    Raises
+    ------
+    ValueError
+        If any state value is not valid.
+    """
+
+    state = {str(key).lower().replace("-", "_"): value for key, value in state.items()}
+
+    canonical = {}
+    for key, canonicaliser in schema.items():
+        value = state.get(key, default[key])
+
+        if isinstance(value, (list, tuple)):
+            value = value[0] if value else default[key]
+
+        canonical[key] = canonicaliser(value)
+
+    return canonical
+
+
+SEARCH_LIMIT: int = 20
+"""
+Maximum number of options returned by the searchable dropdowns.
+"""
+
+
+class SearchIndex:
+    """
+    Define a search index over the names and aliases of a catalogue using
+    prefix and trigram matching.
+
+    Parameters
+    ----------
+    entries
+        Mapping of the names and aliases to their canonical value.
+    order
+        Canonical values in the order they are returned for an empty query and
+        on ties, the values not present in the order are sorted last.
+
+    Methods
+    -------
+    -   :meth:`~apps.common.SearchIndex.search`
+    """
+
+    def __init__(self, entries: Mapping[str, str], order: Iterable[str]) -> None:
+        self._rank = {value: i for i, value in enumerate(order)}
+        for value in sorted(set(entries.values()) - set(self._rank)):
+            self._rank[value] = len(self._rank)
+
+        self._values = sorted(self._rank, key=self._rank.__getitem__)
+
+        self._keys = sorted(
+            {(_normalise_name(name), value) for name, value in entries.items()}
+        )
+        self._names = [name for name, _value in self._keys]
+
+        self._trigrams = {}
+        for name, value in self._keys:
+            for trigram in self._trigrams_name(f"^{name}$"):
+                self._trigrams.setdefault(trigram, set()).add(value)
+
+    @staticmethod
+    def _trigrams_name(name: str) -> set:
+        """Return the trigrams of given name."""
+
+        return {name[i : i + 3] for i in range(len(name) - 2)}
+
+    def search(self, query: str | None, limit: int = SEARCH_LIMIT) -> List[str]:
+        """
+        Search the index for given query.
+
+        The exact and prefix matches are returned first, in canonical order,
+        followed by the values sharing at least half of the query trigrams,
+        ordered by decreasing similarity.
+
+        Parameters
+        ----------
+        query
+            Query to search the index for.
+        limit
+            Maximum number of values to return.
+
+        Returns
+        -------
+        :class:`list`
+            Matching canonical values.
+        """
+
+        query = _normalise_name(query or "")
+
+        if not query:
+            return self._values[:limit]
+
+        exact, prefix = set(), set()
+        for i in range(bisect_left(self._names, query), len(self._names)):
+            name, value = self._keys[i]
+            if not name.startswith(query):
+                break
+
+            (exact if name == query else prefix).add(value)
+
+        prefix -= exact
+        matches = sorted(exact, key=self._rank.__getitem__) + sorted(
+            prefix, key=self._rank.__getitem__
+        )
+
+        if len(matches) < limit:
+            trigrams = self._trigrams_name(f"^{query}") | self._trigrams_name(query)
+            if not trigrams:
+                trigrams = {query}
+
+            scores = {}
+            for trigram in trigrams:
+                for value in self._trigrams.get(trigram, ()):
+                    scores[value] = scores.get(value, 0) + 1
+
+            threshold = len(trigrams) / 2
+            matched = set(matches)
+            matches.extend(
+                sorted(
+                    (
+                        value
+                        for value, score in scores.items()
+                        if score >= threshold and value not in matched
+                    ),
+                    key=lambda value: (-scores[value], self._rank[value]),
+                )
+            )
+
+        return matches[:limit]
+
+
+SEARCH_INDEX_RGB_COLOURSPACE: SearchIndex = SearchIndex(
+    INDEX_RGB_COLOURSPACE, [option["value"] for option in OPTIONS_RGB_COLOURSPACE]
+)
+"""
+*RGB* colourspace search index over the names and aliases.
+"""
+
+
+def options_RGB_colourspace(
+    search_value: str | None = None,
+    value: str | List[str] | None = None,
+    limit: int = SEARCH_LIMIT,
+) -> List[Dict]:
+    """
+    Return the *RGB* colourspace options matching given search value for a
+    searchable :class:`Dropdown` class instance.
+
+    The currently selected values are always part of the options so that the
+    :class:`Dropdown` class instance does not discard them. A search value
+    that is a valid custom *RGB* colourspace definition is returned as the
+    first option.
+
+    Parameters
+    ----------
+    search_value
+        Search value, all the options up to the limit are returned if empty.
+    value
+        Currently selected value or values.
+    limit
+        Maximum number of matching options to return.
+
+    Returns
+    -------
+    :class:`list`
+        *RGB* colourspace options.
+    """
+
+    values = SEARCH_INDEX_RGB_COLOURSPACE.search(search_value, limit)
+
+    if search_value:
+        with suppress(ValueError):
+            values.insert(0, canonical_custom_RGB_colourspace(search_value))
+
+    # The "search" key matches the options on the client side, otherwise the
+    # fuzzy matches and custom definitions would be filtered out.
+    options = [
+        {
+            "label": label_RGB_colourspace(value),
+            "value": value,
+            **({"search": search_value} if search_value else {}),
+        }
+        for value in values
+    ]
+
+    if value is not None:
+        for selected in value if isinstance(value, list) else [value]:
+            if selected not in values:
+                options.append(
+                    {"label": label_RGB_colourspace(selected), "value": selected}
+                )
+
+    return options
+
+
+def options_illuminant(
+    search_value: str | None = None,
+    value: str | None = None,
+    observer: str = OBSERVERS[0],
+) -> List[Dict]:
+    """
+    Return the illuminant options of given standard observer for a searchable
+    :class:`Dropdown` class instance.
+
+    A search value that is a valid target whitepoint definition is returned as
+    the first option and the currently selected target whitepoint is always
+    part of the options.
+
+    Parameters
+    ----------
+    search_value
+        Search value.
+    value
+        Currently selected value.
+    observer
+        Canonical standard observer name.
+
+    Returns
+    -------
+    :class:`list`
+        Illuminant options.
+    """
+
+    options = list(OPTIONS_ILLUMINANTS_OBSERVERS[observer])
+
+    if search_value:
+        with suppress(ValueError):
+            target = canonical_whitepoint_target(search_value)
+            options.insert(
+                0,
+                {
+                    "label": label_illuminant(target),
+                    "value": target,
+                    "search": search_value,
+                },
+            )
+
+    if value is not None and value not in [option["value"] for option in options]:
+        options.append({"label": label_illuminant(value), "value": value})
+
+    return options
+
+
+def refresh_layout_options(
+    layout: Component,
+    identifiers_RGB_colourspace: Iterable[str] = (),
+    identifiers_illuminant: Iterable[str] = (),
+) -> None:
+    """
+    Regenerate the options of given *RGB* colourspace and illuminant
+    :class:`Dropdown` class instances of given app layout, e.g., once the
+    catalogue is reloaded, their selected values are kept.
+
+    Parameters
+    ----------
+    layout
+        App layout.
+    identifiers_RGB_colourspace
+        Ids of the *RGB* colourspace :class:`Dropdown` class instances.
+    identifiers_illuminant
+        Ids of the illuminant :class:`Dropdown` class instances.
+    """
+
+    for identifier in identifiers_RGB_colourspace:
+        dropdown = layout[identifier]
+        dropdown.options = options_RGB_colourspace(value=dropdown.value)
+
+    for identifier in identifiers_illuminant:
+        dropdown = layout[identifier]
+        dropdown.options = options_illuminant(value=dropdown.value)
+
+
+CATALOGUE_PATH: str | None = os.environ.get("COLOUR_DASH_CATALOGUE")
+"""
+Path of the *JSON* catalogue file defining the in-house *RGB* colourspaces, by
+the *CIE xy* chromaticity coordinates of their *primaries* and whitepoint, and
+the in-house illuminants, by their *CIE xy* chromaticity coordinates for some
+standard observers, e.g.,
+
+.. code-block:: json
+
+    {
+        "colourspaces": {
+            "Studio Wide Gamut": {
+                "primaries": [0.7347, 0.2653, 0.1596, 0.8404, 0.0366, 0.0001],
+                "whitepoint": [0.32168, 0.33767],
+                "aliases": ["swg"]
+            }
+        },
+        "illuminants": {
+            "Stage LED": {"cie_2_1931": [0.3457, 0.3585]}
+        }
+    }
+"""
+
+CATALOGUE_INTERVAL: float = 5
+"""
+Interval in seconds between the checks of the catalogue file modification by
+the :func:`apps.common.refresh_catalogue` definition.
+"""
+
+HOOKS_RELOAD_CATALOGUE: List[Callable[[], None]] = []
+"""
+Hooks called once the catalogue is reloaded with added, redefined or removed
+entries, e.g., clearing the caches keyed by the *RGB* colourspace or
+illuminant names or regenerating the options of the app layouts.
+"""
+
+_LOCK_CATALOGUE: threading.Lock = threading.Lock()
+"""
+Lock serialising the catalogue reloads.
+"""
+
+_CATALOGUE_SIGNATURE: tuple | None = None
+"""
+Modification time, size and inode of the loaded catalogue file.
+"""
+
+_CATALOGUE_VERSIONS: Dict[str, str] = {}
+"""
+Versions, i.e., definition digests, of the in-house *RGB* colourspaces and
+illuminants.
+"""
+
+_CATALOGUE_ERROR: str | None = None
+"""
+Error of the last catalogue reload if it failed.
+"""
+
+_CATALOGUE_CHECKED: float = 0
+"""
+Time of the last check of the catalogue file modification.
+"""
+
+_CATALOGUE_RELOAD_REQUESTED: bool = False
+"""
+Whether a catalogue reload was requested, e.g., by a signal.
+"""
+
+
+def _signature_catalogue(path: str | None) -> tuple | None:
+    """
+    Return the modification time, size and inode of given catalogue file.
+    """
+
+    if path is None:
+        return None
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _version(definition: object) -> str:
+    """
+    Return the version of given catalogue definition, i.e., its digest.
+    """
+
+    return hashlib.blake2b(
+        json.dumps(definition, sort_keys=True).encode("utf-8"), digest_size=4
+    ).hexdigest()
+
+
+def _read_catalogue(path: str) -> Tuple[Dict, Dict, Dict, Dict]:
+    """
+    Read given catalogue file and return its in-house *RGB* colourspaces,
+    their aliases, the in-house illuminants chromaticity coordinates per
+    standard observer and the versions of their definitions.
+    """
+
+    try:
+        with open(path) as catalogue_file:
+            catalogue = json.load(catalogue_file)
+    except (OSError, ValueError) as exception:
+        error = f'"{path}" catalogue file cannot be read: {exception}'
+
+        raise ValueError(error) from None
+
+    if not isinstance(catalogue, dict):
+        error = f'"{path}" catalogue file is not a JSON object!'
+
+        raise ValueError(error)
+
+    index_RGB_colourspace = _alias_index(_ALIASES_RGB_COLOURSPACE_BUILT_IN)
+    index_illuminant = _alias_index(
+        {illuminant: illuminant for illuminant in _ILLUMINANTS_BUILT_IN}
+    )
+
+    def is_built_in(index: Mapping[str, str], name: str) -> bool:
+        """Return whether given name is a built-in name or alias."""
+
+        return name in index or _normalise_name(name) in index
+
+    colourspaces, aliases, illuminants, versions = {}, {}, {}, {}
+    try:
+        for name, definition in catalogue.get("colourspaces", {}).items():
+            names = [name, *definition.get("aliases", [])]
+            for alias in names:
+                if is_built_in(index_RGB_colourspace, alias):
+                    error = f'"{alias}" is a built-in RGB colourspace!'
+
+                    raise ValueError(error)
+
+            colourspace = _custom_RGB_colourspace(
+                canonical_custom_RGB_colourspace(
+                    ",".join(
+                        map(str, [*definition["primaries"], *definition["whitepoint"]])
+                    )
+                )
+            ).copy()
+            colourspace.name = name
+
+            colourspaces[name] = colourspace
+            aliases.update({alias: name for alias in names})
+            versions[name] = _version(definition)
+
+        for name, definition in catalogue.get("illuminants", {}).items():
+            if is_built_in(index_illuminant, name):
+                error = f'"{name}" is a built-in illuminant!'
+
+                raise ValueError(error)
+
+            illuminants[name] = {}
+            for observer, values in definition.items():
+                xy = np.array(values, dtype=float)
+                if xy.shape != (2,) or not np.all(np.isfinite(xy)) or xy[1] <= 0:
+                    error = f'"{name}" illuminant xy coordinates are not valid!'
+
+                    raise ValueError(error)
+
+                illuminants[name][canonical_observer(observer)] = xy
+
+            versions[name] = _version([versions.get(name), definition])
+    except (AttributeError, KeyError, TypeError) as exception:
+        error = f'"{path}" catalogue file is not valid: {exception!r}'
+
+        raise ValueError(error) from None
+
+    return colourspaces, aliases, illuminants, versions
+
+
+def reload_catalogue(path: str | None = None) -> List[str]:
+    """
+    Reload the catalogue file and swap the *RGB* colourspace and illuminant
+    tables, i.e., the options, the alias and search indexes and the
+    chromaticity coordinates, at once without interrupting the requests.
+
+    The built-in entries are sorted first so that the default states and the
+    built-in indexes do not change. The cache keys of the in-house entries are
+    versioned with the digest of their definition so that only the cache
+    entries of the redefined or removed entries are invalidated, the
+    :attr:`apps.common.HOOKS_RELOAD_CATALOGUE` attribute hooks are then
+    called.
+
+    Parameters
+    ----------
+    path
+        Path of the catalogue file, :attr:`apps.common.CATALOGUE_PATH`
+        attribute is used if *None*.
+
+    Returns
+    -------
+    :class:`list`
+        Names of the in-house *RGB* colourspaces and illuminants that were
+        added, redefined or removed.
+
+    Raises
+    ------
+    ValueError
+        If the catalogue file is not valid, the current catalogue is kept.
+    """
+
+    global _CATALOGUE_SIGNATURE, _CATALOGUE_VERSIONS, _CATALOGUE_ERROR  # noqa: PLW0603
+
+    path = CATALOGUE_PATH if path is None else path
+
+    with _LOCK_CATALOGUE:
+        signature = _signature_catalogue(path)
+
+        try:
+            colourspaces, aliases, illuminants, versions = (
+                ({}, {}, {}, {}) if path is None else _read_catalogue(path)
+            )
+        except ValueError as error:
+            _CATALOGUE_SIGNATURE, _CATALOGUE_ERROR = signature, str(error)
+
+            raise
+
+        options_RGB_colourspace = [
+            *_OPTIONS_RGB_COLOURSPACE_BUILT_IN,
+            *({"label": name, "value": name} for name in sorted(colourspaces)),
+        ]
+        index_RGB_colourspace = _alias_index(
+            {**_ALIASES_RGB_COLOURSPACE_BUILT_IN, **aliases}
+        )
+
+        names = sorted(illuminants)
+        xy = np.full((len(OBSERVERS), len(names), 2), np.nan)
+        for j, name in enumerate(names):
+            for observer, xy_o in illuminants[name].items():
+                xy[_INDEXES_OBSERVER[observer], j] = xy_o
+
+        illuminants_all = (*_ILLUMINANTS_BUILT_IN, *names)
+        xy = np.concatenate([_CCS_ILLUMINANTS_OBSERVERS_BUILT_IN, xy], axis=1)
+        xy.setflags(write=False)
+        options_illuminants_observers = _options_illuminants_observers(
+            illuminants_all, xy
+        )
+
+        changed = sorted(
+            name
+            for name in versions.keys() | _CATALOGUE_VERSIONS.keys()
+            if versions.get(name) != _CATALOGUE_VERSIONS.get(name)
+        )
+
+        # A single update of the module namespace is atomic for the other
+        # threads, thus they never see a mix of old and new tables.
+        globals().update(
+            {
+                "RGB_COLOURSPACES_IN_HOUSE": colourspaces,
+                "OPTIONS_RGB_COLOURSPACE": options_RGB_colourspace,
+                "INDEX_RGB_COLOURSPACE": index_RGB_colourspace,
+                "SEARCH_INDEX_RGB_COLOURSPACE": SearchIndex(
+                    index_RGB_colourspace,
+                    [option["value"] for option in options_RGB_colourspace],
+                ),
+                "ILLUMINANTS": illuminants_all,
+                "CCS_ILLUMINANTS_OBSERVERS": xy,
+                "_INDEXES_ILLUMINANT": {
+                    illuminant: i for i, illuminant in enumerate(illuminants_all)
+                },
+                "OPTIONS_ILLUMINANTS_OBSERVERS": options_illuminants_observers,
+                "OPTIONS_ILLUMINANTS": options_illuminants_observers[OBSERVERS[0]],
+                "INDEX_ILLUMINANT": _alias_index(
+                    {illuminant: illuminant for illuminant in illuminants_all}
+                ),
+            }
+        )
+        set_cache_key_versions(versions)
+
+        _CATALOGUE_SIGNATURE, _CATALOGUE_VERSIONS = signature, versions
+        _CATALOGUE_ERROR = None
+
+        if changed:
+            for hook in HOOKS_RELOAD_CATALOGUE:
+                hook()
+
+    return changed
+
+
+def request_reload_catalogue() -> None:
+    """
+    Request a catalogue reload on the next call of the
+    :func:`apps.common.refresh_catalogue` definition, e.g., from a signal
+    handler.
+    """
+
+    global _CATALOGUE_RELOAD_REQUESTED  # noqa: PLW0603
+
+    _CATALOGUE_RELOAD_REQUESTED = True
+
+
+def refresh_catalogue(interval: float = CATALOGUE_INTERVAL) -> bool:
+    """
+    Reload the catalogue if a reload was requested or if the catalogue file
+    was modified, e.g., before each request so that all the processes follow
+    the catalogue file.
+
+    Parameters
+    ----------
+    interval
+        Minimum interval in seconds between the checks of the catalogue file
+        modification.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the catalogue was reloaded.
+    """
+
+    global _CATALOGUE_CHECKED, _CATALOGUE_RELOAD_REQUESTED  # noqa: PLW0603
+
+    now = time.monotonic()
+    if not _CATALOGUE_RELOAD_REQUESTED and now - _CATALOGUE_CHECKED < interval:
+        return False
+
+    _CATALOGUE_CHECKED = now
+
+    if (
+        not _CATALOGUE_RELOAD_REQUESTED
+        and _signature_catalogue(CATALOGUE_PATH) == _CATALOGUE_SIGNATURE
+    ):
+        return False
+
+    _CATALOGUE_RELOAD_REQUESTED = False
+
+    try:
+        reload_catalogue()
+    except ValueError:
+        return False
+
+    return True
+
+
+def catalogue_state() -> Dict:
+    """
+    Return the state of the catalogue.
+
+    Returns
+    -------
+    :class:`dict`
+        Catalogue file path, in-house *RGB* colourspaces and illuminants with
+        their versions and error of the last reload if it failed.
+    """
+
+    return {
+        "path": CATALOGUE_PATH,
+        "colourspaces": {
+            name: _CATALOGUE_VERSIONS[name] for name in RGB_COLOURSPACES_IN_HOUSE
+        },
+        "illuminants": {
+            name: _CATALOGUE_VERSIONS[name]
+            for name in ILLUMINANTS[len(_ILLUMINANTS_BUILT_IN) :]
+        },
+        "error": _CATALOGUE_ERROR,
+    }
+
+
+if CATALOGUE_PATH is not None:
+    try:
+        reload_catalogue()
+    except ValueError as error:
+        usage_warning(str(error))
+
+
+@cached_array("matrix_RGB_to_RGB")
+@traced()
+def compute_matrix_RGB_to_RGB(
+    input_colourspace: str,
+    output_colourspace: str,
+    chromatic_adaptation_transform: str | None,
+) -> NDArrayFloat:
+    """
+    Compute the colour transformation matrix from given input *RGB*
+    colourspace to the output *RGB* colourspace using given
+    *chromatic adaptation transform*, the matrix is cached in the
+    :attr:`apps.cache.CACHE` attribute.
+
+    Parameters
+    ----------
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+    chromatic_adaptation_transform
+        *Chromatic adaptation transform* to use.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Colour transformation matrix.
+    """
+
+    return matrix_RGB_to_RGB(
+        RGB_colourspace(input_colourspace),
+        RGB_colourspace(output_colourspace),
+        chromatic_adaptation_transform,
+    )
+
+
+CHROMATIC_ADAPTATION_TRANSFORMS_COMPARISON: tuple = (
+    *(option["value"] for option in OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM),
+    "None",
+)
+"""
+*Chromatic adaptation transforms* compared by the
+:func:`apps.common.compute_matrices_RGB_to_RGB_comparison` definition, *None*
+as a string disables the chromatic adaptation.
+"""
+
+_MATRICES_CHROMATIC_ADAPTATION_TRANSFORM: NDArrayFloat = np.array(
+    [
+        CHROMATIC_ADAPTATION_TRANSFORMS[transform]
+        for transform in CHROMATIC_ADAPTATION_TRANSFORMS_COMPARISON[:-1]
+    ]
+)
+"""
+Stacked *chromatic adaptation transform* matrices of shape (transforms, 3, 3).
+"""
+
+_MATRICES_CHROMATIC_ADAPTATION_TRANSFORM_INVERSE: NDArrayFloat = np.linalg.inv(
+    _MATRICES_CHROMATIC_ADAPTATION_TRANSFORM
+)
+"""
+Stacked inverse *chromatic adaptation transform* matrices of shape
+(transforms, 3, 3).
+"""
+
+
+@cached_array("matrices_RGB_to_RGB_comparison")
+@traced()
+def compute_matrices_RGB_to_RGB_comparison(
+    input_colourspace: str, output_colourspace: str
+) -> NDArrayFloat:
+    """
+    Compute the colour transformation matrices from given input *RGB*
+    colourspace to the output *RGB* colourspace for every
+    *chromatic adaptation transform* at once, the matrices are cached in the
+    :attr:`apps.cache.CACHE` attribute.
+
+    The *Von Kries* chromatic adaptation is broadcast over the stacked
+    *chromatic adaptation transform* matrices and returns the same values as
+    :func:`colour.matrix_RGB_to_RGB` definition.
+
+    Parameters
+    ----------
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Colour transformation matrices of shape (transforms, 3, 3) ordered as
+        the :attr:`apps.common.CHROMATIC_ADAPTATION_TRANSFORMS_COMPARISON`
+        attribute.
+    """
+
+    input_colourspace = RGB_colourspace(input_colourspace)
+    output_colourspace = RGB_colourspace(output_colourspace)
+
+    M = _MATRICES_CHROMATIC_ADAPTATION_TRANSFORM
+    RGB_w = vecmul(M, xy_to_XYZ(input_colourspace.whitepoint))
+    RGB_wr = vecmul(M, xy_to_XYZ(output_colourspace.whitepoint))
+
+    M_CAT = np.empty((len(CHROMATIC_ADAPTATION_TRANSFORMS_COMPARISON), 3, 3))
+    M_CAT[:-1] = np.matmul(
+        np.matmul(
+            _MATRICES_CHROMATIC_ADAPTATION_TRANSFORM_INVERSE,
+            row_as_diagonal(RGB_wr / RGB_w),
+        ),
+        M,
+    )
+    M_CAT[-1] = np.identity(3)
+
+    return np.matmul(
+        output_colourspace.matrix_XYZ_to_RGB,
+        np.matmul(M_CAT, input_colourspace.matrix_RGB_to_XYZ),
+    )
+
+
+@cached_array("chromatically_adapted_primaries")
+@traced()
+def compute_chromatically_adapted_primaries(
+    colourspace: str,
+    illuminant: str,
+    observer: str,
+    chromatic_adaptation_transform: str,
+) -> NDArrayFloat:
+    """
+    Compute the chromatically adapted *primaries* of given *RGB* colourspace
+    to given illuminant of given standard observer using given
+    *chromatic adaptation transform*, the *primaries* are cached in the
+    :attr:`apps.cache.CACHE` attribute.
+
+    Parameters
+    ----------
+    colourspace
+        *RGB* colourspace to chromatically adapt the *primaries*.
+    illuminant
+        Illuminant or target whitepoint to adapt the *primaries* to.
+    observer
+        Standard observer of the illuminant.
+    chromatic_adaptation_transform
+        *Chromatic adaptation transform* to use.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Chromatically adapted *primaries* of shape (3, 2) or (samples, 3, 2)
+        for a correlated colour temperature sweep, adapted at once.
+
+    Raises
+    ------
+    ValueError
+        If the illuminant is not defined for the standard observer.
+    """
+
+    xy, CCT_D_uv = whitepoint_target(illuminant, observer)
+
+    return chromatically_adapted_primaries(
+        RGB_colourspace(colourspace).primaries,
+        RGB_colourspace(colourspace).whitepoint,
+        xy if CCT_D_uv is None else xy[:, None],
+        chromatic_adaptation_transform,
+    )
+
+
+def _cross(a: NDArrayFloat, b: NDArrayFloat) -> NDArrayFloat:
+    """
+    Compute the cross product of given 2D vectors, i.e., the *z* component.
+    """
+
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+def _clip_polygons(
+    polygons: NDArrayFloat,
+    counts: NDArrayInt,
+    start: NDArrayFloat,
+    end: NDArrayFloat,
+) -> Tuple[NDArrayFloat, NDArrayInt]:
+    """
+    Clip given convex polygons, padded to the same number of vertices, by the
+    left half-planes of given edges, i.e., a *Sutherland-Hodgman* step for
+    every polygon at once.
+    """
+
+    batch, vertices = polygons.shape[:2]
+    indexes = np.arange(vertices)
+
+    valid = indexes < counts[:, None]
+    previous = np.take_along_axis(
+        polygons,
+        np.where(indexes == 0, counts[:, None] - 1, indexes - 1).clip(0)[..., None],
+        axis=1,
+    )
+
+    direction = (end - start)[:, None]
+    side_current = _cross(direction, polygons - start[:, None])
+    side_previous = _cross(direction, previous - start[:, None])
+
+    # The vertices on the edge line are inside, the intersections are only
+    # emitted when the polygon edge strictly crosses the line so that they
+    # are not duplicated.
+    inside = side_current >= 0
+    crossing = side_current * side_previous < 0
+
+    t = side_previous / np.where(crossing, side_previous - side_current, 1)
+    intersections = previous + t[..., None] * (polygons - previous)
+
+    # Each vertex emits the intersection of the edge ending at it, if any,
+    # followed by the vertex itself if it is inside.
+    clipped = np.stack([intersections, polygons], axis=2).reshape(
+        batch, 2 * vertices, 2
+    )
+    emitted = np.stack([valid & crossing, valid & inside], axis=2).reshape(
+        batch, 2 * vertices
+    )
+
+    order = np.argsort(~emitted, axis=1, kind="stable")[:, : vertices + 1]
+
+    return (
+        np.take_along_axis(clipped, order[..., None], axis=1),
+        np.minimum(emitted.sum(1), vertices + 1),
+    )
+
+
+def area_polygons(polygons: ArrayLike, counts: ArrayLike | None = None) -> NDArrayFloat:
+    """
+    Compute the area of given polygons, padded to the same number of vertices.
+
+    Parameters
+    ----------
+    polygons
+        Polygons vertices of shape (..., vertices, 2).
+    counts
+        Number of valid vertices of the polygons, all the vertices are valid
+        if *None*.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Polygons area.
+    """
+
+    polygons = np.asarray(polygons, dtype=np.float64)
+
+    if counts is None:
+        return np.abs(_cross(polygons, np.roll(polygons, -1, axis=-2)).sum(-1)) / 2
+
+    counts = np.asarray(counts)
+    valid = np.arange(polygons.shape[-2]) < counts[..., None]
+    # The padding vertices repeat the first one so that they do not contribute
+    # to the area, the empty polygons vertices are all padding.
+    polygons = np.where(valid[..., None], polygons, polygons[..., :1, :])
+    polygons = np.where((counts > 0)[..., None, None], polygons, 0)
+
+    return np.abs(_cross(polygons, np.roll(polygons, -1, axis=-2)).sum(-1)) / 2
+
+
+def intersection_area_triangles(a: ArrayLike, b: ArrayLike) -> NDArrayFloat:
+    """
+    Compute the area of the intersection of given triangles, the triangles
+    are clipped by each other with the *Sutherland-Hodgman* algorithm
+    vectorised over the broadcast triangles.
+
+    Parameters
+    ----------
+    a
+        Triangles vertices of shape (..., 3, 2).
+    b
+        Clipping triangles vertices of shape (..., 3, 2).
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Intersection area of the triangles.
+    """
+
+    a, b = np.broadcast_arrays(
+        np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    )
+    shape = a.shape[:-2]
+
+    def orient(triangles: NDArrayFloat) -> NDArrayFloat:
+        """Return given triangles with their vertices counter-clockwise."""
+
+        clockwise = (
+            _cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+            < 0
+        )
+
+        return np.where(clockwise[:, None, None], triangles[:, ::-1], triangles)
+
+    a = orient(a.reshape(-1, 3, 2))
+    b = orient(b.reshape(-1, 3, 2))
+
+    polygons, counts = a, np.full(a.shape[0], 3)
+    for i in range(3):
+        polygons, counts = _clip_polygons(polygons, counts, b[:, i], b[:, (i + 1) % 3])
+
+    area = area_polygons(polygons, counts)
+
+    # Degenerate triangles do not clip anything.
+    area = np.where((area_polygons(a) > 0) & (area_polygons(b) > 0), area, 0)
+
+    return area.reshape(shape)
+
+
+@cached_array("gamuts_intersection_areas_triangle")
+@traced()
+def _gamuts_intersection_areas_triangle(
+    chromaticity_diagram: str, *colourspaces: str
+) -> NDArrayFloat:
+    """
+    Compute the upper triangle, diagonal included, of the areas of the
+    intersections of the gamuts of given *RGB* colourspaces, the areas being
+    symmetric, the cached array is half the size of the full matrix.
+    """
+
+    primaries = np.array(
+        [RGB_colourspace(colourspace).primaries for colourspace in colourspaces],
+        dtype=np.float64,
+    ).reshape(-1, 3, 2)
+
+    if chromaticity_diagram == "CIE 1976 UCS":
+        primaries = xy_to_Luv_uv(primaries)
+
+    i, j = np.triu_indices(len(colourspaces))
+
+    return intersection_area_triangles(primaries[i], primaries[j])
+
+
+def compute_gamuts_intersection_areas(
+    chromaticity_diagram: str, *colourspaces: str
+) -> NDArrayFloat:
+    """
+    Compute the areas of the intersections of the gamuts of all the pairs of
+    given *RGB* colourspaces in given *Chromaticity Diagram*, the upper
+    triangle of the areas is cached in the :attr:`apps.cache.CACHE`
+    attribute.
+
+    The gamuts are triangles in both the *CIE 1931* and *CIE 1976 UCS*
+    *Chromaticity Diagrams* since they are related by a projective
+    transformation.
+
+    Parameters
+    ----------
+    chromaticity_diagram
+        *Chromaticity Diagram*, e.g., *CIE 1931* or *CIE 1976 UCS*.
+
+    Other Parameters
+    ----------------
+    colourspaces
+        *RGB* colourspaces to compute the gamuts intersection areas of.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Gamuts intersection areas of shape (colourspaces, colourspaces), the
+        diagonal is the area of the gamuts.
+    """
 
-if typing.TYPE_CHECKING:
-    from colour.hints import ArrayLike, Dict, Iterable, List, NDArrayFloat
+    triangle = _gamuts_intersection_areas_triangle(chromaticity_diagram, *colourspaces)
 
-from colour.io import LUTOperatorMatrix, write_LUT_SonySPImtx
-from colour.models import RGB_COLOURSPACES
-from colour.utilities import as_float_array
+    i, j = np.triu_indices(len(colourspaces))
 
-__author__ = "Colour Developers"
-__copyright__ = "Copyright 2018 Colour Developers"
-__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
-__maintainer__ = "Colour Developers"
-__email__ = "colour-developers@colour-science.org"
-__status__ = "Production"
+    areas = np.empty((len(colourspaces), len(colourspaces)))
+    areas[i, j] = triangle
+    areas[j, i] = triangle
 
-__all__ = [
-    "OPTIONS_RGB_COLOURSPACE",
-    "OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM",
-    "OPTIONS_ILLUMINANTS",
-    "TEMPLATE_NUKE_NODE_COLORMATRIX",
-    "nuke_format_matrix",
-    "spimtx_format_matrix",
-    "TEMPLATE_OCIO_COLORSPACE",
-    "matrix_3x3_to_4x4",
-]
+    return areas
 
-OPTIONS_RGB_COLOURSPACE: List[Dict] = [
-    {"label": key, "value": key}
-    for key in sorted(RGB_COLOURSPACES.keys())
-    if key not in ("aces", "adobe1998", "prophoto")
-]
-"""
-*RGB* colourspace options for a :class:`Dropdown` class instance.
-"""
 
-OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM: List[Dict] = [
-    {"label": key, "value": key}
-    for key in sorted(CHROMATIC_ADAPTATION_TRANSFORMS.keys())
-]
-"""
-*Chromatic adaptation transform* options for a :class:`Dropdown` class
-instance.
-"""
+@traced()
+def format_array(a: ArrayLike, decimals: int = 10, representation: str = "str") -> str:
+    """
+    Format given array with given decimals as :func:`str` or :func:`repr`
+    would with a fixed-point float formatter.
+
+    Unlike :func:`colour.utilities.numpy_print_options` definition, the
+    *NumPy* global print options are never modified, thus the definition is
+    re-entrant and safe to call concurrently from multiple threads. 1D and 2D
+    arrays whose rows fit on a single line are formatted directly, others are
+    formatted with :func:`numpy.array2string` definition and explicit options.
+
+    Parameters
+    ----------
+    a
+        Array to format.
+    decimals
+        Decimals to use when formatting the array.
+    representation
+        Representation to produce, :func:`str` or :func:`repr`.
+
+    Returns
+    -------
+    :class:`str`
+        Formatted array.
+    """
+
+    a = as_float_array(a)
+    pretty = f"{{: 0.{decimals}f}}".format
+
+    prefix, separator, suffix = (
+        ("array(", ", ", ")") if representation == "repr" else ("", " ", "")
+    )
+
+    if a.ndim in (1, 2):
+        rows = [separator.join(map(pretty, row)) for row in np.atleast_2d(a).tolist()]
+        indent = " " * (len(prefix) + a.ndim - 1)
+
+        # A conservative line width guarantees that *NumPy* would not wrap.
+        if max(map(len, rows)) + len(indent) + len(suffix) + 4 <= 72:
+            if a.ndim == 1:
+                return f"{prefix}[{rows[0]}]{suffix}"
+
+            return (
+                f"{prefix}[["
+                + f"]{separator.rstrip()}\n{indent}[".join(rows)
+                + f"]]{suffix}"
+            )
+
+    return (
+        prefix
+        + np.array2string(
+            a,
+            separator=separator,
+            prefix=prefix,
+            suffix=suffix,
+            formatter={"float": pretty},
+            threshold=sys.maxsize,
+        )
+        + suffix
+    )
 
-OPTIONS_ILLUMINANTS: List[Dict] = [
-    {"label": key, "value": key}
-    for key in sorted(CCS_ILLUMINANTS["CIE 1931 2 Degree Standard Observer"].keys())
-]
-"""
-*CIE 1931 2 Degree Standard Observer* illuminant options for a
-:class:`Dropdown`class instance.
-"""
 
 TEMPLATE_NUKE_NODE_COLORMATRIX: str = """
 ColorMatrix {{
@@ -176,9 +2278,623 @@ def matrix_3x3_to_4x4(M: ArrayLike) -> NDArrayFloat:
         Raveled 4x4 matrix.
     """
 
-    import numpy as np
-
     M_I = np.identity(4)
     M_I[:3, :3] = M
 
     return np.ravel(M_I)
+
+
+def _slugify(string: str) -> str:
+    """
+    Slugify given string for *Nuke*.
+    """
+
+    string = string.replace("+", "_Plus")
+    pattern = r"\(|\)"
+    string = re.sub(pattern, "", string)
+    pattern = r"\s-\s|\s|-|\.|/"
+    return re.sub(pattern, "_", string)
+
+
+@traced()
+def format_matrix(
+    M: ArrayLike,
+    input_colourspace: str,
+    output_colourspace: str,
+    formatter: str,
+    decimals: int,
+) -> str:
+    """
+    Format given colour transformation matrix from given input *RGB*
+    colourspace to the output *RGB* colourspace.
+
+    Parameters
+    ----------
+    M
+        Colour transformation matrix.
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+    formatter
+        Formatter to use, :func:`str`, :func:`repr`, *Nuke*, *OpenColorIO*
+        or *Spimtx*.
+    decimals
+        Decimals to use when formatting the colour transformation matrix.
+
+    Returns
+    -------
+    :class:`str`
+        Formatted colour transformation matrix.
+    """
+
+    if formatter in ("str", "repr"):
+        M_f = format_array(M, decimals, formatter)
+    elif formatter == "nuke":
+        M_f = TEMPLATE_NUKE_NODE_COLORMATRIX.format(
+            name=(
+                f"{_slugify(input_colourspace)}"
+                f"__to__"
+                f"{_slugify(output_colourspace)}"
+            ),
+            matrix=nuke_format_matrix(M, decimals),
+        )
+    elif formatter == "opencolorio":
+        M_f = TEMPLATE_OCIO_COLORSPACE.format(
+            name=output_colourspace,
+            input_colourspace=input_colourspace,
+            output_colourspace=output_colourspace,
+            matrix=re.sub(
+                r"\s+",
+                " ",
+                format_array(matrix_3x3_to_4x4(M), decimals, "repr")
+                .replace("array(", "")
+                .replace("[ ", "[")
+                .replace(")", "")
+                .replace("\n", ""),
+            ),
+        )
+    elif formatter == "spimtx":
+        M_f = spimtx_format_matrix(M, decimals)
+
+    return M_f
+
+
+@cached_output("format_matrix_RGB_to_RGB")
+def format_matrix_RGB_to_RGB(
+    input_colourspace: str,
+    output_colourspace: str,
+    chromatic_adaptation_transform: str,
+    formatter: str,
+    decimals: int,
+) -> str:
+    """
+    Compute and format the colour transformation matrix from given input *RGB*
+    colourspace to the output *RGB* colourspace using given
+    *chromatic adaptation transform*, the formatted matrix is cached in the
+    :attr:`apps.cache.CACHE` attribute.
+
+    Parameters
+    ----------
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+    chromatic_adaptation_transform
+        *Chromatic adaptation transform* to use, *None* as a string disables
+        the chromatic adaptation.
+    formatter
+        Formatter to use, :func:`str`, :func:`repr`, *Nuke*, *OpenColorIO*
+        or *Spimtx*.
+    decimals
+        Decimals to use when formatting the colour transformation matrix.
+
+    Returns
+    -------
+    :class:`str`
+        Formatted colour transformation matrix.
+    """
+
+    M = compute_matrix_RGB_to_RGB(
+        input_colourspace,
+        output_colourspace,
+        (
+            None
+            if chromatic_adaptation_transform == "None"
+            else chromatic_adaptation_transform
+        ),
+    )
+
+    return format_matrix(
+        M,
+        label_RGB_colourspace(input_colourspace),
+        label_RGB_colourspace(output_colourspace),
+        formatter,
+        decimals,
+    )
+
+
+@cached_output("format_matrices_RGB_to_RGB_comparison")
+def format_matrices_RGB_to_RGB_comparison(
+    input_colourspace: str,
+    output_colourspace: str,
+    chromatic_adaptation_transform: str,
+    decimals: int,
+) -> str:
+    """
+    Compute and format the colour transformation matrices from given input
+    *RGB* colourspace to the output *RGB* colourspace for every
+    *chromatic adaptation transform* as a table, along with the *Frobenius*
+    norm and the maximum absolute value of their difference with the matrix of
+    given reference *chromatic adaptation transform*, the formatted table is
+    cached in the :attr:`apps.cache.CACHE` attribute.
+
+    Parameters
+    ----------
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+    chromatic_adaptation_transform
+        Reference *chromatic adaptation transform*, *None* as a string
+        compares against the matrix without chromatic adaptation.
+    decimals
+        Decimals to use when formatting the colour transformation matrices.
+
+    Returns
+    -------
+    :class:`str`
+        Formatted table.
+    """
+
+    M = compute_matrices_RGB_to_RGB_comparison(input_colourspace, output_colourspace)
+
+    reference = CHROMATIC_ADAPTATION_TRANSFORMS_COMPARISON.index(
+        chromatic_adaptation_transform
+    )
+    delta = M - M[reference]
+    norms = np.linalg.norm(delta, axis=(-2, -1))
+    maxima = np.max(np.abs(delta), axis=(-2, -1))
+
+    rows = [("Transform", "Norm", "Maximum", "M_1", "M_2", "M_3")]
+    for transform, M_t, norm, maximum in zip(
+        CHROMATIC_ADAPTATION_TRANSFORMS_COMPARISON, M, norms, maxima, strict=True
+    ):
+        rows.append(
+            (
+                (
+                    f"{transform} *"
+                    if transform == chromatic_adaptation_transform
+                    else transform
+                ),
+                f"{norm:.{decimals}f}",
+                f"{maximum:.{decimals}f}",
+                *(f"{value:.{decimals}f}" for value in M_t[0]),
+            )
+        )
+        rows.extend(
+            ("", "", "", *(f"{value:.{decimals}f}" for value in M_r))
+            for M_r in M_t[1:]
+        )
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+    return "\n".join(
+        "  ".join(
+            value.ljust(width) if i == 0 else value.rjust(width)
+            for i, (value, width) in enumerate(zip(row, widths, strict=True))
+        ).rstrip()
+        for row in rows
+    )
+
+
+@traced()
+def format_CCT_sweep(CCT_D_uv: ArrayLike, P: ArrayLike, decimals: int = 10) -> str:
+    """
+    Format given correlated colour temperature sweep chromatically adapted
+    *primaries* as a table.
+
+    Parameters
+    ----------
+    CCT_D_uv
+        Correlated colour temperatures *CCT* and *D_uv* of the sweep.
+    P
+        Chromatically adapted *primaries* of the sweep.
+    decimals
+        Decimals to use when formatting the chromatically adapted *primaries*.
+
+    Returns
+    -------
+    :class:`str`
+        Formatted table.
+    """
+
+    rows = [("CCT", "D_uv", "R_x", "R_y", "G_x", "G_y", "B_x", "B_y")]
+    for (CCT, D_uv), P_s in zip(
+        as_float_array(CCT_D_uv), np.reshape(P, (-1, 6)), strict=True
+    ):
+        rows.append(
+            (
+                _format_quantised(CCT, 2),
+                _format_quantised(D_uv, 8),
+                *(f"{value:.{decimals}f}" for value in P_s),
+            )
+        )
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+    return "\n".join(
+        "  ".join(value.rjust(width) for value, width in zip(row, widths, strict=True))
+        for row in rows
+    )
+
+
+@cached_output("format_chromatically_adapted_primaries")
+def format_chromatically_adapted_primaries(
+    colourspace: str,
+    illuminant: str,
+    observer: str,
+    chromatic_adaptation_transform: str,
+    formatter: str,
+    decimals: int,
+) -> str:
+    """
+    Compute and format the chromatically adapted *primaries* of given *RGB*
+    colourspace to given illuminant of given standard observer using given
+    *chromatic adaptation transform*, the formatted *primaries* are cached in
+    the :attr:`apps.cache.CACHE` attribute.
+
+    Parameters
+    ----------
+    colourspace
+        *RGB* colourspace to chromatically adapt the *primaries*.
+    illuminant
+        Illuminant or target whitepoint to adapt the *primaries* to.
+    observer
+        Standard observer of the illuminant.
+    chromatic_adaptation_transform
+        *Chromatic adaptation transform* to use.
+    formatter
+        Formatter to use, :func:`str` or :func:`repr`, the correlated colour
+        temperature sweeps are formatted as a table with the former.
+    decimals
+        Decimals to use when formatting the chromatically adapted *primaries*.
+
+    Returns
+    -------
+    :class:`str`
+        Formatted chromatically adapted *primaries*.
+
+    Raises
+    ------
+    ValueError
+        If the illuminant is not defined for the standard observer.
+    """
+
+    P = compute_chromatically_adapted_primaries(
+        colourspace, illuminant, observer, chromatic_adaptation_transform
+    )
+
+    if P.ndim == 3 and formatter == "str":
+        return format_CCT_sweep(whitepoint_target(illuminant, observer)[1], P, decimals)
+
+    return format_array(P, decimals, formatter)
+
+
+TEMPLATE_PRERENDER: str = """
+<div class="row">
+    <div class="col-2"></div>
+    <div class="{column}">
+        <h3 class="text-center"><a href="{path}">{name}</a></h3>
+        <div>
+            <p>{description}</p>
+            <ul>
+{state}
+            </ul>
+            <pre class="app-widget app-output"><code class="code shell">{output}\
+</code></pre>
+        </div>
+    </div>
+    <div class="col-2"></div>
+</div>
+""".strip()
+"""
+Pre-rendered app *HTML* template, mirroring the app layouts.
+"""
+
+
+def prerender_app(
+    path: str,
+    name: str,
+    description: str,
+    state: Mapping,
+    output: str,
+    column: str = "col-8",
+) -> str:
+    """
+    Pre-render given app state and output to *HTML*.
+
+    Parameters
+    ----------
+    path
+        App path.
+    name
+        App name.
+    description
+        App description, the *Markdown* emphasis is removed.
+    state
+        App state.
+    output
+        App output.
+    column
+        Grid class of the app layout column.
+
+    Returns
+    -------
+    :class:`str`
+        Pre-rendered app *HTML*.
+    """
+
+    return TEMPLATE_PRERENDER.format(
+        path=escape(path),
+        name=escape(name),
+        description=escape(description.replace("*", "")),
+        state="\n".join(
+            f"                <li><strong>{escape(key.replace('_', ' ').title())}"
+            f"</strong>: {escape(str(value))}</li>"
+            for key, value in state.items()
+        ),
+        output=escape(output),
+        column=escape(column),
+    )
+
+
+TILE_SIZE: int = 256
+"""
+Number of image rows processed per tile by :func:`RGB_to_RGB_tiled`
+definition.
+"""
+
+TILE_WORKERS: int = min(os.cpu_count() or 1, 4)
+"""
+Default number of threads of :func:`RGB_to_RGB_tiled` definition, it is capped
+as the conversions run in the web workers.
+"""
+
+_THREAD_LOCAL: threading.local = threading.local()
+"""
+Thread local storage holding the per-thread tile scratch buffer.
+"""
+
+
+def _scratch_buffer(shape: tuple) -> NDArrayFloat:
+    """
+    Return a per-thread *float32* scratch buffer of at least given shape.
+    """
+
+    buffer = getattr(_THREAD_LOCAL, "buffer", None)
+
+    if buffer is None or buffer.size < np.prod(shape):
+        buffer = _THREAD_LOCAL.buffer = np.empty(shape, dtype=np.float32)
+
+    return buffer.ravel()[: np.prod(shape)].reshape(shape)
+
+
+def RGB_to_RGB_tiled(
+    RGB: NDArrayFloat,
+    M: ArrayLike,
+    cctf_decoding: Callable | None = None,
+    cctf_encoding: Callable | None = None,
+    tile_size: int = TILE_SIZE,
+    workers: int = TILE_WORKERS,
+) -> NDArrayFloat:
+    """
+    Apply given colour transformation matrix :math:`M` to given *float32*
+    *RGB* image in place, tile by tile.
+
+    The image is split into tiles of ``tile_size`` rows that are spread
+    across a thread pool. Each thread owns a single scratch buffer receiving
+    the matrix product, the colour component transfer functions allocate
+    their own tile sized arrays though, thus memory usage is bounded by a few
+    tiles per thread irrespective of the image size. Any alpha channel is left
+    untouched.
+
+    Parameters
+    ----------
+    RGB
+        *float32* *RGB* image of shape (height, width, channels) to process in
+        place.
+    M
+        Colour transformation matrix :math:`M`.
+    cctf_decoding
+        Decoding colour component transfer function applied before the
+        matrix.
+    cctf_encoding
+        Encoding colour component transfer function applied after the
+        matrix.
+    tile_size
+        Number of image rows per tile.
+    workers
+        Number of threads.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Processed *RGB* image, i.e., given ``RGB`` array.
+    """
+
+    if RGB.dtype != np.float32:
+        error = f'"RGB" must be a "float32" array, got "{RGB.dtype}"!'
+
+        raise TypeError(error)
+
+    M_T = np.asarray(M, dtype=np.float32).T
+    height = RGB.shape[0]
+
+    def process_tile(y: int) -> None:
+        """Process the tile starting at given row."""
+
+        tile = RGB[y : y + tile_size, :, :3]
+
+        if cctf_decoding is not None:
+            tile[...] = cctf_decoding(tile)
+
+        scratch = _scratch_buffer(tile.shape)
+        np.matmul(tile, M_T, out=scratch)
+
+        if cctf_encoding is not None:
+            tile[...] = cctf_encoding(scratch)
+        else:
+            tile[...] = scratch
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(process_tile, range(0, height, tile_size)))
+
+    return RGB
+
+
+def name_LUT3D_RGB_to_RGB(input_colourspace: str, output_colourspace: str) -> str:
+    """
+    Return the name of the 3D *LUT* converting from given input *RGB*
+    colourspace to the output *RGB* colourspace, usable as a filename.
+
+    Parameters
+    ----------
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+
+    Returns
+    -------
+    :class:`str`
+        3D *LUT* name, e.g., *sRGB__to__ACEScg*.
+    """
+
+    return re.sub(
+        r"\W+",
+        "_",
+        f"{label_RGB_colourspace(input_colourspace)}"
+        f"__to__"
+        f"{label_RGB_colourspace(output_colourspace)}",
+    )
+
+
+@lru_cache(maxsize=32)
+def LUT3D_table_RGB_to_RGB(
+    input_colourspace: str,
+    output_colourspace: str,
+    chromatic_adaptation_transform: str | None,
+    size: int = 33,
+) -> NDArrayFloat:
+    """
+    Compute the 3D *LUT* table converting from given input *RGB* colourspace
+    to the output *RGB* colourspace using given
+    *chromatic adaptation transform*.
+
+    The input colourspace decoding colour component transfer function, the
+    colour transformation matrix and the output colourspace encoding colour
+    component transfer function are evaluated over the whole lattice at once.
+    Tables are cached per arguments.
+
+    Parameters
+    ----------
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+    chromatic_adaptation_transform
+        *Chromatic adaptation transform* to use.
+    size
+        3D *LUT* size, i.e., number of lattice samples per axis.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Read-only 3D *LUT* table of shape (size, size, size, 3) indexed as
+        [R, G, B].
+    """
+
+    input_colourspace_ = RGB_colourspace(input_colourspace)
+    output_colourspace_ = RGB_colourspace(output_colourspace)
+
+    M = matrix_RGB_to_RGB(
+        input_colourspace_,
+        output_colourspace_,
+        chromatic_adaptation_transform,
+    )
+
+    samples = np.linspace(0, 1, size)
+    table = np.stack(np.meshgrid(samples, samples, samples, indexing="ij"), -1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table = input_colourspace_.cctf_decoding(table)
+        table = np.matmul(table, np.transpose(M))
+        table = output_colourspace_.cctf_encoding(table)
+
+    table = np.nan_to_num(np.asarray(table, dtype=np.float32), copy=False)
+    table.setflags(write=False)
+
+    return table
+
+
+# The tables are keyed by the *RGB* colourspace names.
+HOOKS_RELOAD_CATALOGUE.append(LUT3D_table_RGB_to_RGB.cache_clear)
+
+
+def format_LUT3D_table(
+    table: ArrayLike,
+    method: str = "cube",
+    title: str = "",
+    decimals: int = 10,
+    chunk_size: int = 4096,
+) -> Generator[str, None, None]:
+    """
+    Format given 3D *LUT* table as an *Iridas* *.cube* or *Sony* *.spi3d*
+    *LUT*, yielding the formatted *LUT* chunk by chunk.
+
+    Parameters
+    ----------
+    table
+        3D *LUT* table of shape (size, size, size, 3) indexed as [R, G, B].
+    method
+        *LUT* format, *cube* or *spi3d*.
+    title
+        *LUT* title.
+    decimals
+        Decimals to use when formatting the *LUT* table.
+    chunk_size
+        Number of *LUT* table rows per chunk.
+
+    Yields
+    ------
+    :class:`str`
+        Formatted *LUT* chunk.
+    """
+
+    table = np.asarray(table)
+    size = table.shape[0]
+
+    if method == "cube":
+        yield f'TITLE "{title}"\nLUT_3D_SIZE {size}\n'
+        yield "DOMAIN_MIN 0 0 0\nDOMAIN_MAX 1 1 1\n"
+
+        rows = np.reshape(np.transpose(table, (2, 1, 0, 3)), (-1, 3))
+        template = f"%.{decimals}f %.{decimals}f %.{decimals}f\n"
+    elif method == "spi3d":
+        yield f"SPILUT 1.0\n3 3\n{size} {size} {size}\n"
+
+        indexes = np.reshape(
+            np.stack(np.indices((size, size, size)), -1), (-1, 3)
+        )
+        rows = np.hstack([indexes, np.reshape(table, (-1, 3))])
+        template = f"%d %d %d %.{decimals}f %.{decimals}f %.{decimals}f\n"
+    else:
+        error = f'"{method}" LUT format is not supported!'
+
+        raise ValueError(error)
+
+    for i in range(0, rows.shape[0], chunk_size):
+        chunk = rows[i : i + chunk_size]
+
+        yield (template * chunk.shape[0]) % tuple(chunk.ravel().tolist())
@@ -0,0 +1,603 @@
+"""
+Export
+======
+
+Export the results of the apps for every state as content-addressed, sharded
+static files so that the lookups can be served from a static file host.
+
+The export directory contains a ``manifest.json`` file describing the axes of
+each table and mapping the shard keys, i.e., the first axis values, to the
+shard files, and a ``loader.js`` *ES* module fetching the shard of a given
+state.
+
+Usage::
+
+    python -m apps.export /path/to/directory --method binary
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import typing
+from functools import partial
+
+import numpy as np
+from colour.adaptation import (
+    chromatic_adaptation_VonKries,
+    matrix_chromatic_adaptation_VonKries,
+)
+from colour.models import XYZ_to_xyY, xy_to_XYZ
+
+if typing.TYPE_CHECKING:
+    from colour.hints import Callable, Dict, List, NDArrayFloat, Sequence, Tuple
+
+from apps import common
+from apps.common import (
+    FORMATTERS_CHROMATICALLY_ADAPTED_PRIMARIES,
+    FORMATTERS_MATRIX_RGB_TO_RGB,
+    OBSERVERS,
+    OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM,
+    RGB_colourspace,
+    format_array,
+    format_matrix,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "EXPORT_VERSION",
+    "METHODS_EXPORT",
+    "LOADER_JS",
+    "table_matrix_RGB_to_RGB",
+    "table_chromatically_adapted_primaries",
+    "write_content_addressed",
+    "export_table",
+    "export_static",
+    "main",
+]
+
+EXPORT_VERSION: int = 2
+"""
+Export format version, bumped on incompatible changes of the manifest or the
+shards.
+"""
+
+METHODS_EXPORT: Tuple = ("json", "binary")
+"""
+Supported export methods: *JSON* shards of nested objects or binary shards of
+little-endian *float64* values in *C* order.
+"""
+
+LOADER_JS: str = """
+const manifests = new Map();
+const shards = new Map();
+
+function fetchManifest(baseUrl) {
+    if (!manifests.has(baseUrl)) {
+        manifests.set(
+            baseUrl,
+            fetch(new URL("manifest.json", baseUrl)).then((response) =>
+                response.json()
+            )
+        );
+    }
+    return manifests.get(baseUrl);
+}
+
+function fetchShard(baseUrl, path, method) {
+    const url = new URL(path, baseUrl).href;
+    if (!shards.has(url)) {
+        shards.set(
+            url,
+            fetch(url).then((response) =>
+                method === "binary"
+                    ? response.arrayBuffer().then((buffer) =>
+                        new Float64Array(buffer)
+                    )
+                    : response.json()
+            )
+        );
+    }
+    return shards.get(url);
+}
+
+function canonical(manifest, value) {
+    const key = String(value).toLowerCase().replace(/[^a-z0-9+]/g, "");
+    return manifest.aliases[value] ?? manifest.aliases[key] ?? value;
+}
+
+async function lookup(baseUrl, name, state) {
+    const manifest = await fetchManifest(baseUrl);
+    const table = manifest.tables[name];
+    const [axis, ...axes] = table.axes;
+    const key = axis.name === table.aliased[0]
+        ? canonical(manifest, state[0]) : state[0];
+    const path = table.shards[key];
+    if (path === undefined) {
+        throw new Error(`"${state[0]}" is not a valid ${axis.name}!`);
+    }
+    const shard = await fetchShard(baseUrl, path, manifest.method);
+    const indexes = axes.map((axis, i) => {
+        const value = table.aliased.includes(axis.name)
+            ? canonical(manifest, state[i + 1]) : state[i + 1];
+        const index = axis.values.indexOf(value);
+        if (index === -1) {
+            throw new Error(`"${state[i + 1]}" is not a valid ${axis.name}!`);
+        }
+        return index;
+    });
+    if (manifest.method === "binary") {
+        const size = table.shape.reduce((a, b) => a * b, 1);
+        const offset = indexes.reduce(
+            (offset, index, i) => offset * axes[i].values.length + index, 0
+        ) * size;
+        const values = Array.from(shard.subarray(offset, offset + size));
+        if (values.some(Number.isNaN)) {
+            throw new Error(`"${state.join(", ")}" state is not defined!`);
+        }
+        return {
+            values: Array.from({ length: table.shape[0] }, (_, i) =>
+                values.slice(i * table.shape[1], (i + 1) * table.shape[1])
+            ),
+        };
+    }
+    const node = indexes.reduce(
+        (node, index, i) => node?.[axes[i].values[index]], shard
+    );
+    if (node === undefined) {
+        throw new Error(`"${state.join(", ")}" state is not defined!`);
+    }
+    return node;
+}
+
+export function loadMatrixRGBToRGB(
+    baseUrl, inputColourspace, outputColourspace, chromaticAdaptationTransform
+) {
+    return lookup(baseUrl, "matrix_RGB_to_RGB", [
+        inputColourspace,
+        outputColourspace,
+        chromaticAdaptationTransform,
+    ]);
+}
+
+export function loadChromaticallyAdaptedPrimaries(
+    baseUrl, colourspace, illuminant, observer, chromaticAdaptationTransform
+) {
+    return lookup(baseUrl, "chromatically_adapted_primaries", [
+        colourspace,
+        illuminant,
+        observer,
+        chromaticAdaptationTransform,
+    ]);
+}
+""".lstrip()
+"""
+*ES* module loading the values of a state from an export, e.g.,
+``loadMatrixRGBToRGB("https://example.com/export/", "sRGB", "ACEScg",
+"CAT02")``, the manifest and the shards are fetched once and memoised.
+"""
+
+
+def table_matrix_RGB_to_RGB() -> Tuple[List[List[str]], NDArrayFloat]:
+    """
+    Compute the colour transformation matrices for every input *RGB*
+    colourspace, output *RGB* colourspace and *chromatic adaptation transform*
+    at once.
+
+    The computation is broadcast over all the colourspace pairs and returns
+    the same values as :func:`colour.matrix_RGB_to_RGB` definition.
+
+    Returns
+    -------
+    :class:`tuple`
+        Axes values and colour transformation matrices table of shape
+        (input colourspaces, output colourspaces, chromatic adaptation
+        transforms, 3, 3).
+    """
+
+    names = [option["value"] for option in common.OPTIONS_RGB_COLOURSPACE]
+    transforms = [
+        "None",
+        *(option["value"] for option in OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM),
+    ]
+
+    colourspaces = [RGB_colourspace(name) for name in names]
+    RGB_to_XYZ = np.array(
+        [colourspace.matrix_RGB_to_XYZ for colourspace in colourspaces]
+    )
+    XYZ_to_RGB = np.array(
+        [colourspace.matrix_XYZ_to_RGB for colourspace in colourspaces]
+    )
+    XYZ_w = xy_to_XYZ([colourspace.whitepoint for colourspace in colourspaces])
+
+    table = np.empty((len(names), len(names), len(transforms), 3, 3))
+    for i, transform in enumerate(transforms):
+        M = RGB_to_XYZ[:, None]
+        if transform != "None":
+            M = np.matmul(
+                matrix_chromatic_adaptation_VonKries(
+                    XYZ_w[:, None], XYZ_w[None, :], transform
+                ),
+                M,
+            )
+
+        table[:, :, i] = np.matmul(XYZ_to_RGB[None, :], M)
+
+    return [names, names, transforms], table
+
+
+def table_chromatically_adapted_primaries() -> Tuple[List[List[str]], NDArrayFloat]:
+    """
+    Compute the chromatically adapted *primaries* for every *RGB* colourspace,
+    illuminant, standard observer and *chromatic adaptation transform* at
+    once.
+
+    The computation is broadcast over all the colourspaces, illuminants and
+    standard observers and returns the same values as
+    :func:`colour.chromatically_adapted_primaries` definition. The
+    illuminants are those defined for at least one standard observer, the
+    *primaries* of an illuminant undefined for a standard observer are *NaN*.
+
+    Returns
+    -------
+    :class:`tuple`
+        Axes values and chromatically adapted *primaries* table of shape
+        (colourspaces, illuminants, observers, chromatic adaptation
+        transforms, 3, 2).
+    """
+
+    names = [option["value"] for option in common.OPTIONS_RGB_COLOURSPACE]
+    illuminants = list(common.ILLUMINANTS)
+    observers = list(OBSERVERS)
+    transforms = [option["value"] for option in OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM]
+
+    colourspaces = [RGB_colourspace(name) for name in names]
+    XYZ_p = xy_to_XYZ(
+        [np.reshape(colourspace.primaries, (3, 2)) for colourspace in colourspaces]
+    )
+    XYZ_w = xy_to_XYZ([colourspace.whitepoint for colourspace in colourspaces])
+    xy_wr = np.swapaxes(common.CCS_ILLUMINANTS_OBSERVERS, 0, 1)
+    XYZ_wr = xy_to_XYZ(np.nan_to_num(xy_wr, nan=1 / 3))
+
+    table = np.empty(
+        (len(names), len(illuminants), len(observers), len(transforms), 3, 2)
+    )
+    for i, transform in enumerate(transforms):
+        XYZ_a = chromatic_adaptation_VonKries(
+            XYZ_p[:, None, None],
+            XYZ_w[:, None, None, None],
+            XYZ_wr[None, :, :, None],
+            transform,
+        )
+
+        table[:, :, :, i] = XYZ_to_xyY(XYZ_a)[..., 0:2]
+
+    table[:, np.isnan(xy_wr[..., 0])] = np.nan
+
+    return [names, illuminants, observers, transforms], table
+
+
+def write_content_addressed(directory: str, data: bytes, extension: str) -> str:
+    """
+    Write given data to a file named after its digest in given directory.
+
+    The files are immutable: a file with the same name already has the same
+    content and is not written again, they can thus be cached indefinitely.
+
+    Parameters
+    ----------
+    directory
+        Directory to write the file into.
+    data
+        Data to write.
+    extension
+        File extension.
+
+    Returns
+    -------
+    :class:`str`
+        File name.
+    """
+
+    name = f"{hashlib.sha256(data).hexdigest()[:20]}.{extension}"
+    path = os.path.join(directory, name)
+
+    if not os.path.exists(path):
+        with open(f"{path}.tmp", "wb") as file:
+            file.write(data)
+
+        os.replace(f"{path}.tmp", path)
+
+    return name
+
+
+def export_table(
+    directory: str,
+    name: str,
+    axes: Sequence[Sequence[str]],
+    axes_names: Sequence[str],
+    table: NDArrayFloat,
+    method: str = "json",
+    formatters: Dict[str, Callable] | None = None,
+    aliased: Sequence[str] = (),
+) -> Dict:
+    """
+    Export given table as shards of its first axis.
+
+    Parameters
+    ----------
+    directory
+        Export directory.
+    name
+        Table name, the shards are written into a sub-directory with that
+        name.
+    axes
+        Axes values.
+    axes_names
+        Axes names.
+    table
+        Table to export.
+    method
+        Export method, see :attr:`apps.export.METHODS_EXPORT` attribute.
+    formatters
+        Formatters of the table values, keyed by formatter name, called with
+        the value and the axes values. The formatted values are only exported
+        with the *JSON* method.
+
+    Notes
+    -----
+    -   The undefined values, i.e., containing *NaN*, are omitted from the
+        *JSON* shards and kept in the binary shards.
+    aliased
+        Names of the axes whose values are resolved through the aliases of
+        the manifest by the loader, e.g., *RGB* colourspaces.
+
+    Returns
+    -------
+    :class:`dict`
+        Table manifest.
+    """
+
+    os.makedirs(os.path.join(directory, name), exist_ok=True)
+
+    shards = {}
+    for i, key in enumerate(axes[0]):
+        if method == "binary":
+            data = np.ascontiguousarray(table[i], dtype="<f8").tobytes()
+            extension = "bin"
+        else:
+            shard = {}
+            for index in np.ndindex(table.shape[1 : len(axes)]):
+                values = [axis[j] for axis, j in zip(axes[1:], index, strict=True)]
+                value = table[(i, *index)]
+                if np.isnan(value).any():
+                    continue
+
+                node = shard
+                for axis_value in values[:-1]:
+                    node = node.setdefault(axis_value, {})
+
+                node[values[-1]] = {"values": value.tolist()}
+                if formatters:
+                    node[values[-1]]["formatted"] = {
+                        formatter: function(value, key, *values)
+                        for formatter, function in formatters.items()
+                    }
+
+            data = json.dumps(shard, separators=(",", ":")).encode("utf-8")
+            extension = "json"
+
+        shards[key] = "/".join(
+            [
+                name,
+                write_content_addressed(os.path.join(directory, name), data, extension),
+            ]
+        )
+
+    return {
+        "axes": [
+            {"name": axis_name, "values": list(axis)}
+            for axis_name, axis in zip(axes_names, axes, strict=True)
+        ],
+        "shape": list(table.shape[len(axes) :]),
+        "aliased": list(aliased),
+        "shards": shards,
+    }
+
+
+def _format_matrix(
+    M: NDArrayFloat,
+    input_colourspace: str,
+    output_colourspace: str,
+    chromatic_adaptation_transform: str,  # noqa: ARG001
+    formatter: str,
+    decimals: int,
+) -> str:
+    """Format given colour transformation matrix of a table state."""
+
+    return format_matrix(M, input_colourspace, output_colourspace, formatter, decimals)
+
+
+def _format_primaries(
+    P: NDArrayFloat,
+    *state: str,  # noqa: ARG001
+    formatter: str,
+    decimals: int,
+) -> str:
+    """Format given chromatically adapted *primaries* of a table state."""
+
+    return format_array(P, decimals, formatter)
+
+
+def export_static(
+    directory: str,
+    method: str = "json",
+    formatted: bool = False,
+    decimals: int = 10,
+    progress: Callable[[float], None] | None = None,
+) -> Dict:
+    """
+    Export the colour transformation matrices and chromatically adapted
+    *primaries* of every state of the apps into given directory.
+
+    Parameters
+    ----------
+    directory
+        Export directory.
+    method
+        Export method, see :attr:`apps.export.METHODS_EXPORT` attribute.
+    formatted
+        Whether to also export the output of every formatter, only supported
+        with the *JSON* method.
+    decimals
+        Decimals to use when formatting the outputs.
+    progress
+        Callable reporting the export progress in domain [0, 1] after each
+        table.
+
+    Returns
+    -------
+    :class:`dict`
+        Export manifest.
+
+    Raises
+    ------
+    ValueError
+        If the export method is not supported or the formatted outputs are
+        requested with the binary method.
+    """
+
+    if method not in METHODS_EXPORT:
+        error = f'"{method}" export method is not supported!'
+
+        raise ValueError(error)
+
+    if formatted and method != "json":
+        error = "Formatted outputs can only be exported with JSON method!"
+
+        raise ValueError(error)
+
+    os.makedirs(directory, exist_ok=True)
+
+    axes, table = table_matrix_RGB_to_RGB()
+    matrix_RGB_to_RGB = export_table(
+        directory,
+        "matrix_RGB_to_RGB",
+        axes,
+        [
+            "input_colourspace",
+            "output_colourspace",
+            "chromatic_adaptation_transform",
+        ],
+        table,
+        method,
+        (
+            {
+                formatter: partial(
+                    _format_matrix, formatter=formatter, decimals=decimals
+                )
+                for formatter in FORMATTERS_MATRIX_RGB_TO_RGB
+            }
+            if formatted
+            else None
+        ),
+        ["input_colourspace", "output_colourspace"],
+    )
+
+    if progress is not None:
+        progress(0.5)
+
+    axes, table = table_chromatically_adapted_primaries()
+    chromatically_adapted_primaries = export_table(
+        directory,
+        "chromatically_adapted_primaries",
+        axes,
+        ["colourspace", "illuminant", "observer", "chromatic_adaptation_transform"],
+        table,
+        method,
+        (
+            {
+                formatter: partial(
+                    _format_primaries, formatter=formatter, decimals=decimals
+                )
+                for formatter in FORMATTERS_CHROMATICALLY_ADAPTED_PRIMARIES
+            }
+            if formatted
+            else None
+        ),
+        ["colourspace"],
+    )
+
+    manifest = {
+        "version": EXPORT_VERSION,
+        "method": method,
+        "decimals": decimals if formatted else None,
+        "aliases": common.INDEX_RGB_COLOURSPACE,
+        "tables": {
+            "matrix_RGB_to_RGB": matrix_RGB_to_RGB,
+            "chromatically_adapted_primaries": chromatically_adapted_primaries,
+        },
+    }
+
+    with open(os.path.join(directory, "manifest.json"), "w") as file:
+        json.dump(manifest, file, separators=(",", ":"))
+
+    with open(os.path.join(directory, "loader.js"), "w") as file:
+        file.write(LOADER_JS)
+
+    if progress is not None:
+        progress(1)
+
+    return manifest
+
+
+def main(arguments: Sequence[str] | None = None) -> None:
+    """
+    Export the results of the apps from the command line.
+
+    Parameters
+    ----------
+    arguments
+        Command line arguments, :attr:`sys.argv` attribute is used if *None*.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m apps.export",
+        description="Export the results of the apps as static sharded files.",
+    )
+    parser.add_argument("directory", help="Export directory.")
+    parser.add_argument(
+        "--method", choices=METHODS_EXPORT, default="json", help="Export method."
+    )
+    parser.add_argument(
+        "--formatted",
+        action="store_true",
+        help="Also export the output of every formatter, JSON method only.",
+    )
+    parser.add_argument(
+        "--decimals", type=int, default=10, help="Decimals of the formatted outputs."
+    )
+
+    namespace = parser.parse_args(arguments)
+
+    try:
+        export_static(
+            namespace.directory,
+            namespace.method,
+            namespace.formatted,
+            namespace.decimals,
+        )
+    except ValueError as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
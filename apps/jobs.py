@@ -0,0 +1,702 @@
+"""
+Jobs
+====
+
+Run the long-running computations of the apps, e.g., the static export or the
+large 3D *LUT*, as background jobs in a local process pool so that the web
+workers stay responsive.
+
+The jobs state and results are persisted into an on-disk store shared by the
+web workers, any of them can thus report the progress of a job or serve its
+result. Jobs are identified by the digest of their kind and parameters so that
+an identical job is only run once until it is evicted by the time-to-live.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import re
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import typing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from functools import partial
+
+if typing.TYPE_CHECKING:
+    from colour.hints import Any, Callable, Dict, Mapping, Tuple
+
+import apps.cache
+from apps.common import (
+    LUT3D_table_RGB_to_RGB,
+    format_LUT3D_table,
+    name_LUT3D_RGB_to_RGB,
+    refresh_catalogue,
+)
+from apps.export import export_static
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "JOBS_PATH",
+    "JOBS_TTL",
+    "JOBS_WORKERS",
+    "JOBS_PENDING_MAXIMUM",
+    "STATUSES_FINISHED",
+    "job_LUT3D",
+    "job_export",
+    "JOB_KINDS",
+    "JobStore",
+    "JobQueue",
+    "JOB_QUEUE",
+]
+
+JOBS_PATH: str = os.environ.get(
+    "COLOUR_DASH_JOBS_PATH", os.path.join(tempfile.gettempdir(), "colour-dash-jobs")
+)
+"""
+Directory of the on-disk jobs store, it must be shared by the web workers.
+"""
+
+JOBS_TTL: int = int(os.environ.get("COLOUR_DASH_JOBS_TTL", "86400"))
+"""
+Time-to-live in seconds of the jobs and their results since their last update.
+"""
+
+JOBS_WORKERS: int = int(os.environ.get("COLOUR_DASH_JOBS_WORKERS", "2"))
+"""
+Number of processes of the jobs pool of each web worker.
+"""
+
+JOBS_PENDING_MAXIMUM: int = int(os.environ.get("COLOUR_DASH_JOBS_PENDING_MAXIMUM", "8"))
+"""
+Maximum number of pending or running jobs of each kind, the submission of a new
+job is rejected beyond it so that the pools and the store cannot be flooded.
+"""
+
+STATUSES_FINISHED: tuple = ("done", "failed")
+"""
+Statuses of the finished jobs.
+"""
+
+_INTERVAL_PROGRESS: float = 0.25
+"""
+Minimum interval in seconds between two progress updates of a job.
+"""
+
+_INTERVAL_EVICTION: float = 60
+"""
+Minimum interval in seconds between two evictions of the expired jobs.
+"""
+
+_INTERVAL_HEARTBEAT: float = 10
+"""
+Interval in seconds between two heartbeats of a running job, i.e., updates of
+its state.
+"""
+
+_TIMEOUT_HEARTBEAT: float = 60
+"""
+Duration in seconds without heartbeat after which a running job is stale,
+e.g., its pool process was killed.
+"""
+
+
+def job_LUT3D(
+    parameters: Mapping, path: str, progress: Callable[[float], None]
+) -> Tuple[str, str]:
+    """
+    Write the 3D *LUT* converting from the input *RGB* colourspace to the
+    output *RGB* colourspace into given path.
+
+    Parameters
+    ----------
+    parameters
+        Canonical job parameters: *input_colourspace*, *output_colourspace*,
+        *chromatic_adaptation_transform*, *decimals*, *LUT_size* and
+        *LUT_format*.
+    path
+        Path of the job result.
+    progress
+        Callable reporting the job progress in domain [0, 1].
+
+    Returns
+    -------
+    :class:`tuple`
+        Result filename and mimetype.
+    """
+
+    chromatic_adaptation_transform = parameters["chromatic_adaptation_transform"]
+    size = parameters["LUT_size"]
+
+    table = LUT3D_table_RGB_to_RGB(
+        parameters["input_colourspace"],
+        parameters["output_colourspace"],
+        (
+            None
+            if chromatic_adaptation_transform == "None"
+            else chromatic_adaptation_transform
+        ),
+        size,
+    )
+
+    name = name_LUT3D_RGB_to_RGB(
+        parameters["input_colourspace"], parameters["output_colourspace"]
+    )
+
+    chunks = math.ceil(size**3 / 4096) + 2
+    with open(path, "w") as file:
+        for i, chunk in enumerate(
+            format_LUT3D_table(
+                table, parameters["LUT_format"], name, parameters["decimals"]
+            )
+        ):
+            file.write(chunk)
+            progress((i + 1) / chunks)
+
+    return f"{name}.{parameters['LUT_format']}", "text/plain"
+
+
+def job_export(
+    parameters: Mapping, path: str, progress: Callable[[float], None]
+) -> Tuple[str, str]:
+    """
+    Write the static export of the apps as a *Zip* archive into given path.
+
+    Parameters
+    ----------
+    parameters
+        Canonical job parameters: *method*, *formatted* and *decimals*, see
+        :func:`apps.export.export_static` definition.
+    path
+        Path of the job result.
+    progress
+        Callable reporting the job progress in domain [0, 1].
+
+    Returns
+    -------
+    :class:`tuple`
+        Result filename and mimetype.
+    """
+
+    directory = f"{path}.export"
+
+    try:
+        export_static(
+            directory,
+            parameters["method"],
+            parameters["formatted"],
+            parameters["decimals"],
+            lambda value: progress(value * 0.9),
+        )
+
+        shutil.make_archive(path, "zip", directory)
+        os.replace(f"{path}.zip", path)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return "colour-dash-export.zip", "application/zip"
+
+
+JOB_KINDS: Dict[str, Callable[[Mapping, str, Callable[[float], None]], Tuple]] = {
+    "LUT3D": job_LUT3D,
+    "export": job_export,
+}
+"""
+Job kinds, the job definitions are called in the pool processes with the
+canonical job parameters, the result path and a progress callable, and return
+the result filename and mimetype.
+"""
+
+
+class JobStore:
+    """
+    Define an on-disk jobs store.
+
+    Each job is a directory named after the job id containing a ``job.json``
+    state file, replaced atomically on update, and a ``result`` file.
+
+    A pending job whose owner, i.e., the web worker that submitted it and
+    whose process pool runs it, has exited, or a running job whose heartbeat
+    has stopped, e.g., its pool process was killed, is stale: it is reported
+    as failed and replaced on creation.
+
+    Parameters
+    ----------
+    path
+        Store directory.
+    ttl
+        Time-to-live in seconds of the jobs since their last update.
+    """
+
+    def __init__(self, path: str, ttl: int = JOBS_TTL) -> None:
+        self._path = path
+        self._ttl = ttl
+
+        os.makedirs(path, exist_ok=True)
+
+    @property
+    def path(self) -> str:
+        """
+        Getter property for the store directory.
+
+        Returns
+        -------
+        :class:`str`
+            Store directory.
+        """
+
+        return self._path
+
+    def result_path(self, job_id: str) -> str:
+        """
+        Return the result path of given job.
+
+        Parameters
+        ----------
+        job_id
+            Job id.
+
+        Returns
+        -------
+        :class:`str`
+            Result path.
+        """
+
+        return os.path.join(self._path, job_id, "result")
+
+    def create(self, job_id: str, kind: str, parameters: Mapping) -> bool:
+        """
+        Create given job unless it already exists, has not failed, is not
+        stale and has not expired.
+
+        Parameters
+        ----------
+        job_id
+            Job id.
+        kind
+            Job kind, see :attr:`apps.jobs.JOB_KINDS` attribute.
+        parameters
+            Canonical job parameters.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the job was created and must be run.
+        """
+
+        directory = os.path.join(self._path, job_id)
+
+        state = self._read(job_id)
+        if state is not None and (
+            state["status"] == "failed" or self._stale(state) or self._expired(state)
+        ):
+            self._remove(job_id)
+
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            return False
+
+        now = time.time()
+        self._write(
+            job_id,
+            {
+                "id": job_id,
+                "kind": kind,
+                "parameters": dict(parameters),
+                "status": "pending",
+                "progress": 0,
+                "host": socket.gethostname(),
+                "pid": os.getpid(),
+                "created": now,
+                "updated": now,
+            },
+        )
+
+        return True
+
+    def state(self, job_id: str) -> Dict | None:
+        """
+        Return the state of given job.
+
+        Parameters
+        ----------
+        job_id
+            Job id.
+
+        Returns
+        -------
+        :class:`dict` or :py:data:`None`
+            Job state or *None* if the job id is not valid, the job does not
+            exist or has expired, a stale job is reported as failed.
+        """
+
+        if not re.fullmatch(r"[0-9a-f]{20}", job_id):
+            return None
+
+        state = self._read(job_id)
+
+        if state is None or self._expired(state):
+            return None
+
+        if self._stale(state):
+            return {**state, "status": "failed", "error": "The job was interrupted!"}
+
+        return state
+
+    def update(self, job_id: str, **fields: Any) -> Dict:
+        """
+        Update given job state with given fields.
+
+        Parameters
+        ----------
+        job_id
+            Job id.
+
+        Other Parameters
+        ----------------
+        fields
+            Fields to update, e.g., *status* or *progress*.
+
+        Returns
+        -------
+        :class:`dict`
+            Updated job state.
+        """
+
+        with open(os.path.join(self._path, job_id, "job.json")) as file:
+            state = json.load(file)
+
+        state.update(fields, updated=time.time())
+        self._write(job_id, state)
+
+        return state
+
+    def active(self, kind: str) -> int:
+        """
+        Return the number of pending or running jobs of given kind.
+
+        Parameters
+        ----------
+        kind
+            Job kind, see :attr:`apps.jobs.JOB_KINDS` attribute.
+
+        Returns
+        -------
+        :class:`int`
+            Number of pending or running jobs, the stale and expired jobs are
+            not counted.
+        """
+
+        count = 0
+        for job_id in os.listdir(self._path):
+            state = self.state(job_id)
+            if (
+                state is not None
+                and state["kind"] == kind
+                and state["status"] not in STATUSES_FINISHED
+            ):
+                count += 1
+
+        return count
+
+    def evict(self) -> None:
+        """Remove the expired jobs and their results."""
+
+        for job_id in os.listdir(self._path):
+            try:
+                updated = os.path.getmtime(os.path.join(self._path, job_id, "job.json"))
+            except OSError:
+                continue
+
+            if time.time() - updated > self._ttl:
+                self._remove(job_id)
+
+    def _read(self, job_id: str) -> Dict | None:
+        """Read given job state regardless of its expiry."""
+
+        try:
+            with open(os.path.join(self._path, job_id, "job.json")) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _expired(self, state: Mapping) -> bool:
+        """Return whether given job state has expired."""
+
+        return time.time() - state["updated"] > self._ttl
+
+    def _stale(self, state: Mapping) -> bool:
+        """Return whether given job state is stale."""
+
+        if state["status"] == "running":
+            return time.time() - state["updated"] > _TIMEOUT_HEARTBEAT
+
+        if state["status"] == "pending" and state.get("host") == socket.gethostname():
+            try:
+                os.kill(state["pid"], 0)
+            except ProcessLookupError:
+                return True
+            except (KeyError, OSError):
+                return False
+
+        return False
+
+    def _write(self, job_id: str, state: Mapping) -> None:
+        """Write atomically given job state."""
+
+        path = os.path.join(self._path, job_id, "job.json")
+        with open(f"{path}.{os.getpid()}.tmp", "w") as file:
+            json.dump(state, file)
+
+        os.replace(f"{path}.{os.getpid()}.tmp", path)
+
+    def _remove(self, job_id: str) -> None:
+        """Remove given job, renaming it first so that it disappears at once."""
+
+        directory = os.path.join(self._path, job_id)
+        trash = f"{directory}.{os.getpid()}.{threading.get_ident()}.removed"
+
+        try:
+            os.rename(directory, trash)
+        except OSError:
+            return
+
+        shutil.rmtree(trash, ignore_errors=True)
+
+
+def _run_job(path: str, ttl: int, job_id: str) -> None:
+    """
+    Run given job of given store in a pool process, the progress, result and
+    errors are written into the store and a heartbeat thread updates the job
+    state while it is running.
+    """
+
+    refresh_catalogue(0)
+
+    store = JobStore(path, ttl)
+    lock = threading.Lock()
+
+    def update(**fields: Any) -> Dict:
+        """Update the job state, serialised with the heartbeat thread."""
+
+        with lock:
+            return store.update(job_id, **fields)
+
+    state = update(status="running")
+
+    stopped = threading.Event()
+
+    def heartbeat() -> None:
+        """Update the job state until it is finished."""
+
+        while not stopped.wait(_INTERVAL_HEARTBEAT):
+            with suppress(OSError):
+                update()
+
+    thread = threading.Thread(target=heartbeat, daemon=True)
+    thread.start()
+
+    updated = 0.0
+
+    def progress(value: float) -> None:
+        """Write the job progress, throttled."""
+
+        nonlocal updated
+
+        if time.monotonic() - updated >= _INTERVAL_PROGRESS:
+            updated = time.monotonic()
+            update(progress=round(value, 4))
+
+    result_path = store.result_path(job_id)
+    try:
+        filename, mimetype = JOB_KINDS[state["kind"]](
+            state["parameters"], f"{result_path}.tmp", progress
+        )
+        os.replace(f"{result_path}.tmp", result_path)
+    except Exception as error:  # noqa: BLE001
+        fields = {"status": "failed", "error": str(error)}
+    else:
+        fields = {
+            "status": "done",
+            "progress": 1,
+            "filename": filename,
+            "mimetype": mimetype,
+        }
+    finally:
+        stopped.set()
+        thread.join()
+
+    update(**fields)
+
+
+class JobQueue:
+    """
+    Define a queue running the jobs in a local process pool and persisting
+    them into a :class:`apps.jobs.JobStore` class instance.
+
+    The process pool is created lazily, i.e., in the web worker process
+    submitting the first job, with the *spawn* start method so that the pool
+    processes do not inherit the web worker state.
+
+    Parameters
+    ----------
+    path
+        Store directory.
+    ttl
+        Time-to-live in seconds of the jobs since their last update.
+    workers
+        Number of processes of the pool.
+    pending_maximum
+        Maximum number of pending or running jobs of each kind.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: int = JOBS_TTL,
+        workers: int = JOBS_WORKERS,
+        pending_maximum: int = JOBS_PENDING_MAXIMUM,
+    ) -> None:
+        self._path = path
+        self._ttl = ttl
+        self._workers = workers
+        self._pending_maximum = pending_maximum
+        self._store: JobStore | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._evicted = 0.0
+
+    @property
+    def store(self) -> JobStore:
+        """
+        Getter property for the jobs store, created on first access.
+
+        Returns
+        -------
+        :class:`apps.jobs.JobStore`
+            Jobs store.
+        """
+
+        if self._store is None:
+            self._store = JobStore(self._path, self._ttl)
+
+        return self._store
+
+    def submit(self, kind: str, parameters: Mapping) -> str:
+        """
+        Submit a job of given kind with given canonical parameters, an
+        identical pending, running or done job is reused unless it is stale.
+
+        Parameters
+        ----------
+        kind
+            Job kind, see :attr:`apps.jobs.JOB_KINDS` attribute.
+        parameters
+            Canonical job parameters.
+
+        Returns
+        -------
+        :class:`str`
+            Job id.
+
+        Raises
+        ------
+        ValueError
+            If the job kind is unknown.
+        RuntimeError
+            If the job must be run but the maximum number of pending or running
+            jobs of given kind is reached.
+        """
+
+        if kind not in JOB_KINDS:
+            error = f'"{kind}" job kind is not supported!'
+
+            raise ValueError(error)
+
+        job_id = self._job_id(kind, parameters)
+
+        with self._lock:
+            if time.monotonic() - self._evicted > _INTERVAL_EVICTION:
+                self._evicted = time.monotonic()
+                self.store.evict()
+
+            state = self.store.state(job_id)
+            reused = state is not None and state["status"] != "failed"
+            if not reused and self.store.active(kind) >= self._pending_maximum:
+                error = f'Too many "{kind}" jobs are pending, please retry later!'
+
+                raise RuntimeError(error)
+
+            if self.store.create(job_id, kind, parameters):
+                try:
+                    future = self._pool().submit(
+                        _run_job, self.store.path, self._ttl, job_id
+                    )
+                except BrokenProcessPool:
+                    self._executor = None
+                    future = self._pool().submit(
+                        _run_job, self.store.path, self._ttl, job_id
+                    )
+
+                future.add_done_callback(partial(self._fail_on_error, job_id))
+
+        return job_id
+
+    @staticmethod
+    def _job_id(kind: str, parameters: Mapping) -> str:
+        """Return the id of the job of given kind with given parameters."""
+
+        # The catalogue versions are hashed so that the jobs are run again once
+        # an in-house colourspace or illuminant is redefined.
+        return hashlib.sha256(
+            json.dumps(
+                [kind, parameters, apps.cache.CACHE_KEY_VERSIONS], sort_keys=True
+            ).encode("utf-8")
+        ).hexdigest()[:20]
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """Return the process pool, creating it if needs be."""
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self._workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+        return self._executor
+
+    def _fail_on_error(self, job_id: str, future: Future) -> None:
+        """
+        Mark given job as failed if its pool process terminated abruptly, the
+        pool is then re-created on next submission.
+        """
+
+        error = future.exception()
+        if error is None:
+            return
+
+        if isinstance(error, BrokenProcessPool):
+            self._executor = None
+
+        with suppress(OSError):
+            self.store.update(job_id, status="failed", error=str(error))
+
+
+JOB_QUEUE: JobQueue = JobQueue(JOBS_PATH, JOBS_TTL, JOBS_WORKERS, JOBS_PENDING_MAXIMUM)
+"""
+Jobs queue shared by the apps.
+"""
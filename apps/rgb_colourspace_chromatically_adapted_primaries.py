@@ -5,23 +5,35 @@ RGB Colourspace Chromatically Adapted Primaries Application
 
 from __future__ import annotations
 
-import sys
+import typing
 import urllib.parse
-from contextlib import suppress
+from functools import partial
 from urllib.parse import parse_qs, urlencode, urlparse
 
-from colour.colorimetry import CCS_ILLUMINANTS
-from colour.models import RGB_COLOURSPACES, chromatically_adapted_primaries
-from colour.utilities import numpy_print_options
+from dash import no_update
 from dash.dcc import Dropdown, Link, Location, Markdown, Slider
-from dash.dependencies import Input, Output
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
 from dash.html import H3, H5, A, Button, Code, Div, Li, Pre, Ul
 
-from app import APP, SERVER_URL
+if typing.TYPE_CHECKING:
+    from colour.hints import Dict, List, Mapping
+
+from app import APP, PRERENDERERS, SERVER_URL
+from apps.analytics import ANALYTICS
 from apps.common import (
+    HOOKS_RELOAD_CATALOGUE,
     OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM,
-    OPTIONS_ILLUMINANTS,
-    OPTIONS_RGB_COLOURSPACE,
+    OPTIONS_OBSERVER,
+    SCHEMA_STATE_CHROMATICALLY_ADAPTED_PRIMARIES,
+    STATE_DEFAULT_CHROMATICALLY_ADAPTED_PRIMARIES,
+    canonical_observer,
+    canonical_state,
+    format_chromatically_adapted_primaries,
+    options_illuminant,
+    options_RGB_colourspace,
+    prerender_app,
+    refresh_layout_options,
 )
 
 __author__ = "Colour Developers"
@@ -38,7 +50,10 @@ __all__ = [
     "APP_UID",
     "STATE_DEFAULT",
     "LAYOUT",
+    "set_colourspace_options",
+    "set_illuminant_options",
     "set_primaries_output",
+    "prerender_permalink",
     "update_state_on_url_query_change",
     "update_url_query_on_state_change",
 ]
@@ -56,8 +71,13 @@ App path, i.e., app url.
 APP_DESCRIPTION: str = (
     "This app computes the "
     "*Chromatically Adapted Primaries* of the given "
-    "*RGB Colourspace* to the given *Illuminant* using the "
-    "given *Chromatic Adaptation Transform*."
+    "*RGB Colourspace* to the given *Illuminant* of the given *Observer* "
+    "using the given *Chromatic Adaptation Transform*. Arbitrary target "
+    "whitepoints can be typed in the *Illuminant* field as a correlated "
+    "colour temperature, "
+    "e.g., `cct:6504` or `cct:6504,0.0032` with *Duv*, a sweep, e.g., "
+    "`cct:2000:10000:100`, or chromaticity coordinates, e.g., "
+    "`xy:0.3127,0.329`."
 )
 """
 App description.
@@ -77,15 +97,7 @@ def _uid(id_: str) -> str:
     return f"{id_}-{APP_UID}"
 
 
-STATE_DEFAULT = {
-    "colourspace": OPTIONS_RGB_COLOURSPACE[0]["value"],
-    "illuminant": OPTIONS_ILLUMINANTS[0]["value"],
-    "chromatic_adaptation_transform": OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM[0][
-        "value"
-    ],
-    "formatter": "str",
-    "decimals": 10,
-}
+STATE_DEFAULT = dict(STATE_DEFAULT_CHROMATICALLY_ADAPTED_PRIMARIES)
 """
 Default App state.
 """
@@ -103,7 +115,9 @@ LAYOUT: Div = Div(
                         H5(children="Colourspace"),
                         Dropdown(
                             id=_uid("colourspace"),
-                            options=OPTIONS_RGB_COLOURSPACE,
+                            options=options_RGB_colourspace(
+                                value=STATE_DEFAULT["colourspace"]
+                            ),
                             value=STATE_DEFAULT["colourspace"],
                             clearable=False,
                             className="app-widget",
@@ -111,11 +125,21 @@ LAYOUT: Div = Div(
                         H5(children="Illuminant"),
                         Dropdown(
                             id=_uid("illuminant"),
-                            options=OPTIONS_ILLUMINANTS,
+                            options=options_illuminant(
+                                value=STATE_DEFAULT["illuminant"]
+                            ),
                             value=STATE_DEFAULT["illuminant"],
                             clearable=False,
                             className="app-widget",
                         ),
+                        H5(children="Observer"),
+                        Dropdown(
+                            id=_uid("observer"),
+                            options=OPTIONS_OBSERVER,
+                            value=STATE_DEFAULT["observer"],
+                            clearable=False,
+                            className="app-widget",
+                        ),
                         H5(children="Chromatic Adaptation Transform"),
                         Dropdown(
                             id=_uid("chromatic-adaptation-transform"),
@@ -213,12 +237,88 @@ App layout, i.e., :class:`Div` class instance.
 LAYOUT : Div
 """
 
+HOOKS_RELOAD_CATALOGUE.append(
+    partial(
+        refresh_layout_options, LAYOUT, [_uid("colourspace")], [_uid("illuminant")]
+    )
+)
+
+
+@APP.callback(
+    Output(_uid("colourspace"), "options"),
+    [
+        Input(_uid("colourspace"), "search_value"),
+        Input(_uid("colourspace"), "value"),
+    ],
+)
+def set_colourspace_options(search_value: str | None, colourspace: str) -> List[Dict]:
+    """
+    Set the *RGB* colourspace options matching the search value using the
+    server-side search index.
+
+    Parameters
+    ----------
+    search_value
+        *RGB* colourspace search value.
+    colourspace
+        *RGB* colourspace.
+
+    Returns
+    -------
+    :class:`list`
+        *RGB* colourspace options.
+    """
+
+    return options_RGB_colourspace(search_value, colourspace)
+
+
+@APP.callback(
+    Output(_uid("illuminant"), "options"),
+    [
+        Input(_uid("illuminant"), "search_value"),
+        Input(_uid("illuminant"), "value"),
+        Input(_uid("observer"), "value"),
+    ],
+)
+def set_illuminant_options(
+    search_value: str | None, illuminant: str, observer: str
+) -> List[Dict]:
+    """
+    Set the illuminant options of the given standard observer, including the
+    target whitepoint typed in the search value.
+
+    The options of each standard observer are precomputed, thus switching the
+    standard observer does not rebuild them.
+
+    Parameters
+    ----------
+    search_value
+        Illuminant search value.
+    illuminant
+        Illuminant or target whitepoint.
+    observer
+        Standard observer.
+
+    Returns
+    -------
+    :class:`list`
+        Illuminant options.
+    """
+
+    try:
+        observer = canonical_observer(observer)
+    except ValueError:
+        raise PreventUpdate from None
+
+    return options_illuminant(search_value, illuminant, observer)
+
 
 @APP.callback(
     Output(component_id=_uid("primaries-output"), component_property="children"),
     [
         Input(_uid("colourspace"), "value"),
         Input(_uid("illuminant"), "value"),
+        Input(_uid("observer"), "value"),
         Input(_uid("chromatic-adaptation-transform"), "value"),
         Input(_uid("formatter"), "value"),
         Input(_uid("decimals"), "value"),
@@ -227,6 +327,7 @@ LAYOUT : Div
 def set_primaries_output(
     colourspace: str,
     illuminant: str,
+    observer: str,
     chromatic_adaptation_transform: str,
     formatter: str,
     decimals: int,
@@ -242,8 +343,9 @@ def set_primaries_output(
     colourspace
         *RGB* colourspace to chromatically adapt the *primaries*.
     illuminant
-        *CIE 1931 2 Degree Standard Observer* illuminant to adapt the
-        *primaries* to.
+        Illuminant or target whitepoint to adapt the *primaries* to.
+    observer
+        Standard observer of the illuminant.
     chromatic_adaptation_transform
         *Chromatic adaptation transform* to use.
     formatter
@@ -254,32 +356,67 @@ def set_primaries_output(
     Returns
     -------
     :class:`str`
-        Chromatically adapted *primaries*.
+        Chromatically adapted *primaries* or error message if the App state is
+        not valid.
+    """
+
+    try:
+        state = canonical_state(
+            {
+                "colourspace": colourspace,
+                "illuminant": illuminant,
+                "observer": observer,
+                "chromatic_adaptation_transform": chromatic_adaptation_transform,
+                "formatter": formatter,
+                "decimals": decimals,
+            },
+            SCHEMA_STATE_CHROMATICALLY_ADAPTED_PRIMARIES,
+            STATE_DEFAULT,
+        )
+        ANALYTICS.record("chromatically_adapted_primaries", state)
+
+        return format_chromatically_adapted_primaries(*state.values())
+    except ValueError as error:
+        return str(error)
+
+
+def prerender_permalink(query: Mapping[str, str]) -> str | None:
+    """
+    Pre-render the App for given URL query, i.e., permanent link, so that the
+    chromatically adapted *primaries* is painted before the *Dash* renderer loads.
+
+    Parameters
+    ----------
+    query
+        URL query.
+
+    Returns
+    -------
+    :class:`str` or :py:data:`None`
+        Pre-rendered App *HTML* or *None* if the URL query is not valid.
     """
 
-    P = chromatically_adapted_primaries(
-        RGB_COLOURSPACES[colourspace].primaries,
-        RGB_COLOURSPACES[colourspace].whitepoint,
-        CCS_ILLUMINANTS["CIE 1931 2 Degree Standard Observer"][illuminant],
-        chromatic_adaptation_transform,
+    try:
+        state = canonical_state(
+            query, SCHEMA_STATE_CHROMATICALLY_ADAPTED_PRIMARIES, STATE_DEFAULT
+        )
+        output = format_chromatically_adapted_primaries(*state.values())
+    except ValueError:
+        return None
+
+    return prerender_app(
+        APP_PATH, APP_NAME, APP_DESCRIPTION, state, output, column="col-6"
     )
 
-    with numpy_print_options(
-        formatter={"float": f"{{: 0.{decimals}f}}".format},
-        threshold=sys.maxsize,
-    ):
-        if formatter == "str":
-            P_f = str(P)
-        elif formatter == "repr":
-            P_f = repr(P)
 
-        return P_f
+PRERENDERERS[APP_PATH] = prerender_permalink
 
 
 @APP.callback(
     [
         Output(_uid("colourspace"), "value"),
         Output(_uid("illuminant"), "value"),
+        Output(_uid("observer"), "value"),
         Output(_uid("chromatic-adaptation-transform"), "value"),
         Output(_uid("formatter"), "value"),
         Output(_uid("decimals"), "value"),
@@ -287,16 +424,35 @@ def set_primaries_output(
     [
         Input(_uid("url"), "href"),
     ],
+    [
+        State(_uid("colourspace"), "value"),
+        State(_uid("illuminant"), "value"),
+        State(_uid("observer"), "value"),
+        State(_uid("chromatic-adaptation-transform"), "value"),
+        State(_uid("formatter"), "value"),
+        State(_uid("decimals"), "value"),
+    ],
 )
-def update_state_on_url_query_change(href: str) -> tuple:
+def update_state_on_url_query_change(href: str, *state: str | int) -> tuple:
     """
     Update the App state on URL query change.
 
+    The URL query is canonicalised first, e.g., aliases are resolved and the
+    decimals clipped, the update is prevented if it is not valid. Only the
+    state values that differ from the current App state are updated so that
+    unchanged widgets do not trigger their dependent callbacks, the update is
+    prevented altogether if the URL query matches the App state.
+
     Parameters
     ----------
     href
         URL.
 
+    Other Parameters
+    ----------------
+    state
+        Current App state.
+
     Returns
     -------
     :class:`tuple`
@@ -307,20 +463,21 @@ def update_state_on_url_query_change(href: str) -> tuple:
 
     query = parse_qs(parse_result.query)
 
-    def value_from_query(value: str) -> str:
-        """Return the given value from the query."""
-
-        with suppress(KeyError):
-            return query[value][0]
-
-        return STATE_DEFAULT[value.replace("-", "_")]
-
-    return (
-        value_from_query("colourspace"),
-        value_from_query("illuminant"),
-        value_from_query("chromatic-adaptation-transform"),
-        value_from_query("formatter"),
-        int(value_from_query("decimals")),
+    try:
+        values = tuple(
+            canonical_state(
+                query, SCHEMA_STATE_CHROMATICALLY_ADAPTED_PRIMARIES, STATE_DEFAULT
+            ).values()
+        )
+    except ValueError:
+        raise PreventUpdate from None
+
+    if values == state:
+        raise PreventUpdate
+
+    return tuple(
+        no_update if value == current else value
+        for value, current in zip(values, state, strict=True)
     )
 
 
@@ -329,17 +486,21 @@ def update_state_on_url_query_change(href: str) -> tuple:
     [
         Input(_uid("colourspace"), "value"),
         Input(_uid("illuminant"), "value"),
+        Input(_uid("observer"), "value"),
         Input(_uid("chromatic-adaptation-transform"), "value"),
         Input(_uid("formatter"), "value"),
         Input(_uid("decimals"), "value"),
     ],
+    [State(_uid("url"), "search")],
 )
 def update_url_query_on_state_change(
     colourspace: str,
     illuminant: str,
+    observer: str,
     chromatic_adaptation_transform: str,
     formatter: str,
     decimals: int,
+    search: str | None = None,
 ) -> str:
     """
     Update the URL query on App state change.
@@ -349,8 +510,9 @@ def update_url_query_on_state_change(
     colourspace
         *RGB* colourspace to chromatically adapt the *primaries*.
     illuminant
-        *CIE 1931 2 Degree Standard Observer* illuminant to adapt the
-        *primaries* to.
+        Illuminant or target whitepoint to adapt the *primaries* to.
+    observer
+        Standard observer of the illuminant.
     chromatic_adaptation_transform
         *Chromatic adaptation transform* to use.
     formatter
@@ -358,6 +520,11 @@ def update_url_query_on_state_change(
     decimals
         Decimals to use when formatting the chromatically adapted *primaries*.
 
+    Other Parameters
+    ----------------
+    search
+        Current URL query, the update is prevented if it is unchanged.
+
     Returns
     -------
     :class:`str`
@@ -368,12 +535,16 @@ def update_url_query_on_state_change(
         {
             "colourspace": colourspace,
             "illuminant": illuminant,
+            "observer": observer,
             "chromatic-adaptation-transform": chromatic_adaptation_transform,
             "formatter": formatter,
             "decimals": decimals,
         }
     )
 
+    if f"?{query}" == search:
+        raise PreventUpdate
+
     return f"?{query}"
 
 
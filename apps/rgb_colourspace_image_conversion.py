@@ -0,0 +1,717 @@
+"""
+RGB Colourspace Image Conversion Application
+============================================
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import os
+import typing
+import urllib.parse
+from functools import partial
+
+import imageio.v3 as iio
+import numpy as np
+import OpenEXR
+from colour.models import matrix_RGB_to_RGB
+from dash import ctx, no_update
+from dash.dcc import Checklist, Download, Dropdown, Link, Location, Markdown, Upload
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+from dash.html import H3, H5, A, Button, Code, Div, Li, Pre, Ul
+from flask import Response, abort, request
+
+if typing.TYPE_CHECKING:
+    from colour.hints import Dict, List, NDArray
+
+from app import APP, SERVER, SERVER_URL
+from apps.common import (
+    HOOKS_RELOAD_CATALOGUE,
+    OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM,
+    OPTIONS_RGB_COLOURSPACE,
+    RGB_colourspace,
+    RGB_to_RGB_tiled,
+    canonical_RGB_colourspace,
+    options_RGB_colourspace,
+    refresh_layout_options,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "APP_NAME",
+    "APP_PATH",
+    "APP_DESCRIPTION",
+    "APP_UID",
+    "OPTIONS_IMAGE_FORMAT",
+    "IMAGE_PIXELS_MAXIMUM",
+    "IMAGE_PIXELS_MAXIMUM_UPLOAD",
+    "IMAGE_SIZE_MAXIMUM_UPLOAD",
+    "STATE_DEFAULT",
+    "image_pixels",
+    "read_image",
+    "write_image",
+    "convert_image",
+    "LAYOUT",
+    "set_colourspace_options",
+    "set_image_conversion_output",
+    "convert_image_endpoint",
+]
+
+APP_NAME: str = "RGB Colourspace Image Conversion"
+"""
+App name.
+"""
+
+APP_PATH: str = f"/apps/{__name__.split('.')[-1]}"
+"""
+App path, i.e., app url.
+"""
+
+APP_DESCRIPTION: str = (
+    "This app converts the given image from the *Input RGB Colourspace* to "
+    "the *Output RGB Colourspace* using the given "
+    "*Chromatic Adaptation Transform*. Images larger than 16MiB or 4MP must "
+    f"be posted to the `{APP_PATH}/convert` endpoint."
+)
+"""
+App description.
+"""
+
+APP_UID: int = hash(APP_NAME)
+"""
+App unique id.
+"""
+
+OPTIONS_IMAGE_FORMAT: List[Dict] = [
+    {"label": "Same as Input", "value": "input"},
+    {"label": "OpenEXR", "value": ".exr"},
+    {"label": "TIFF", "value": ".tiff"},
+    {"label": "PNG", "value": ".png"},
+]
+"""
+Output image format options for a :class:`Dropdown` class instance.
+"""
+
+IMAGE_PIXELS_MAXIMUM: int = 8192 * 4320
+"""
+Maximum number of pixels of an image converted by the image conversion
+endpoint, i.e., an 8K frame.
+"""
+
+IMAGE_PIXELS_MAXIMUM_UPLOAD: int = 2048 * 2048
+"""
+Maximum number of pixels of an image uploaded to the App, its conversion is
+sent back through the callback as *base64* encoded *JSON*.
+"""
+
+IMAGE_SIZE_MAXIMUM_UPLOAD: int = 16 * 1024**2
+"""
+Maximum size in bytes of an image uploaded to the App.
+"""
+
+
+def _uid(id_: str) -> str:
+    """
+    Generate a unique id for given id by appending the application *UID*.
+    """
+
+    return f"{id_}-{APP_UID}"
+
+
+STATE_DEFAULT = {
+    "input_colourspace": OPTIONS_RGB_COLOURSPACE[0]["value"],
+    "output_colourspace": OPTIONS_RGB_COLOURSPACE[0]["value"],
+    "chromatic_adaptation_transform": OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM[0][
+        "value"
+    ],
+    "transfer_functions": [],
+    "image_format": OPTIONS_IMAGE_FORMAT[0]["value"],
+}
+"""
+Default App state.
+"""
+
+
+def image_pixels(data: bytes, extension: str) -> int:
+    """
+    Return the number of pixels of given encoded image without decoding its
+    pixel data.
+
+    Parameters
+    ----------
+    data
+        Encoded image, e.g., *OpenEXR*, *TIFF* or *PNG* file content.
+    extension
+        Extension of the encoded image, e.g., *.exr*.
+
+    Returns
+    -------
+    :class:`int`
+        Number of pixels.
+
+    Raises
+    ------
+    ValueError
+        If the *OpenEXR* image header cannot be decoded.
+    """
+
+    extension = extension.lower()
+
+    if extension == ".exr":
+        try:
+            header = OpenEXR.File(io.BytesIO(data), header_only=True).header()
+        except RuntimeError as error:
+            raise ValueError(str(error)) from None
+
+        minimum, maximum = header["dataWindow"]
+
+        return int(np.prod(maximum - minimum + 1))
+
+    plugin = "tifffile" if extension in (".tif", ".tiff") else None
+    shape = iio.improps(data, extension=extension, plugin=plugin).shape
+
+    return int(np.prod(shape[:2]))
+
+
+def read_image(
+    data: bytes, extension: str, pixels_maximum: int = IMAGE_PIXELS_MAXIMUM
+) -> NDArray:
+    """
+    Decode given encoded image, the *OpenEXR* images are decoded with the
+    *OpenEXR* bindings and the *TIFF* images with the *tifffile* plugin so that
+    their floating point data is preserved.
+
+    Parameters
+    ----------
+    data
+        Encoded image, e.g., *OpenEXR*, *TIFF* or *PNG* file content.
+    extension
+        Extension of the encoded image, e.g., *.exr*.
+    pixels_maximum
+        Maximum number of pixels of the image, it is checked before decoding
+        the pixel data.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Decoded image.
+
+    Raises
+    ------
+    ValueError
+        If the image has more pixels than given maximum or if the *OpenEXR*
+        image cannot be decoded or has no *RGB(A)* or *Y* channels.
+    """
+
+    extension = extension.lower()
+
+    pixels = image_pixels(data, extension)
+    if pixels > pixels_maximum:
+        error = f"Image has {pixels} pixels, the maximum is {pixels_maximum}!"
+
+        raise ValueError(error)
+
+    if extension == ".exr":
+        try:
+            channels = OpenEXR.File(
+                io.BytesIO(data), separate_channels=False
+            ).channels()
+        except RuntimeError as error:
+            raise ValueError(str(error)) from None
+
+        for name in ("RGBA", "RGB", "Y"):
+            if name in channels:
+                return channels[name].pixels
+
+        error = f'OpenEXR image has no "RGB(A)" or "Y" channels: {list(channels)}!'
+
+        raise ValueError(error)
+
+    if extension in (".tif", ".tiff"):
+        return iio.imread(data, extension=extension, plugin="tifffile")
+
+    return iio.imread(data, extension=extension)
+
+
+def write_image(RGB: NDArray, extension: str) -> bytes:
+    """
+    Encode given image, the *OpenEXR* images are encoded with the *OpenEXR*
+    bindings and the *TIFF* images with the *tifffile* plugin.
+
+    Parameters
+    ----------
+    RGB
+        Image to encode, *float32* for *OpenEXR* images.
+    extension
+        Extension of the encoded image, e.g., *.exr*.
+
+    Returns
+    -------
+    :class:`bytes`
+        Encoded image.
+    """
+
+    extension = extension.lower()
+
+    if extension == ".exr":
+        buffer = io.BytesIO()
+        OpenEXR.File(
+            {"compression": OpenEXR.ZIP_COMPRESSION, "type": OpenEXR.scanlineimage},
+            {"RGBA" if RGB.shape[-1] == 4 else "RGB": np.ascontiguousarray(RGB)},
+        ).write(buffer)
+
+        return buffer.getvalue()
+
+    if extension in (".tif", ".tiff"):
+        return iio.imwrite("<bytes>", RGB, extension=extension, plugin="tifffile")
+
+    return iio.imwrite("<bytes>", RGB, extension=extension)
+
+
+def convert_image(
+    data: bytes,
+    extension: str,
+    input_colourspace: str,
+    output_colourspace: str,
+    chromatic_adaptation_transform: str | None,
+    apply_cctf: bool = False,
+    output_extension: str | None = None,
+    pixels_maximum: int = IMAGE_PIXELS_MAXIMUM,
+) -> bytes:
+    """
+    Convert given encoded image from given input *RGB* colourspace to the
+    output *RGB* colourspace using given *chromatic adaptation transform*.
+
+    The image is decoded into a single *float32* buffer that is processed in
+    place and tile by tile with :func:`apps.common.RGB_to_RGB_tiled`
+    definition. The decoding is not streamed thus the peak memory usage is
+    the encoded image, the decoded *float32* image, its encoded conversion
+    and a few tile sized temporaries per thread, the number of pixels is thus
+    checked before decoding, e.g., about 425MB for the *float32* buffer of an
+    8K *RGB* frame.
+
+    Parameters
+    ----------
+    data
+        Encoded image, e.g., *OpenEXR*, *TIFF* or *PNG* file content.
+    extension
+        Extension of the encoded image, e.g., *.exr*.
+    input_colourspace
+        Input *RGB* colourspace name, alias or custom definition.
+    output_colourspace
+        Output *RGB* colourspace name, alias or custom definition.
+    chromatic_adaptation_transform
+        *Chromatic adaptation transform* to use.
+    apply_cctf
+        Whether to apply the decoding and encoding colour component transfer
+        functions of the input and output *RGB* colourspaces.
+    output_extension
+        Extension of the converted image, defaults to given ``extension``.
+    pixels_maximum
+        Maximum number of pixels of the image.
+
+    Returns
+    -------
+    :class:`bytes`
+        Encoded converted image.
+    """
+
+    chromatic_adaptation_transform = (
+        None
+        if chromatic_adaptation_transform == "None"
+        else chromatic_adaptation_transform
+    )
+
+    input_colourspace_ = RGB_colourspace(canonical_RGB_colourspace(input_colourspace))
+    output_colourspace_ = RGB_colourspace(canonical_RGB_colourspace(output_colourspace))
+
+    M = matrix_RGB_to_RGB(
+        input_colourspace_,
+        output_colourspace_,
+        chromatic_adaptation_transform,
+    )
+
+    image = read_image(data, extension, pixels_maximum)
+    dtype = image.dtype
+
+    if image.ndim == 2:
+        image = np.repeat(image[..., None], 3, axis=-1)
+
+    RGB = image.astype(np.float32, copy=False)
+    # The integer or half-float decoded image is released before the
+    # conversion so that only the "float32" buffer is held.
+    del image
+    if np.issubdtype(dtype, np.integer):
+        RGB /= np.iinfo(dtype).max
+
+    RGB_to_RGB_tiled(
+        RGB,
+        M,
+        input_colourspace_.cctf_decoding if apply_cctf else None,
+        output_colourspace_.cctf_encoding if apply_cctf else None,
+    )
+
+    output_extension = (output_extension or extension).lower()
+    if output_extension != ".exr":
+        # *Pillow* only writes 8-bit *RGB* *PNG* images.
+        if output_extension == ".png":
+            dtype = np.uint8
+
+        if np.issubdtype(dtype, np.integer):
+            maximum = np.iinfo(dtype).max
+            np.clip(RGB, 0, 1, out=RGB)
+            RGB *= maximum
+            np.rint(RGB, out=RGB)
+            RGB = RGB.astype(dtype)
+
+    return write_image(RGB, output_extension)
+
+
+LAYOUT: Div = Div(
+    [
+        Div(className="col-2"),
+        Div(
+            [
+                Location(id=_uid("url"), refresh=False),
+                H3([Link(APP_NAME, href=APP_PATH)], className="text-center"),
+                Div(
+                    [
+                        Markdown(APP_DESCRIPTION),
+                        H5(children="Image"),
+                        Upload(
+                            Div(["Drag and Drop or ", A("Select an Image")]),
+                            id=_uid("image"),
+                            accept=".exr,.tif,.tiff,.png",
+                            max_size=IMAGE_SIZE_MAXIMUM_UPLOAD,
+                            className="app-widget",
+                            style={
+                                "borderWidth": "1px",
+                                "borderStyle": "dashed",
+                                "borderRadius": "5px",
+                                "textAlign": "center",
+                                "padding": "10px",
+                            },
+                        ),
+                        H5(children="Input Colourspace"),
+                        Dropdown(
+                            id=_uid("input-colourspace"),
+                            options=options_RGB_colourspace(
+                                value=STATE_DEFAULT["input_colourspace"]
+                            ),
+                            value=STATE_DEFAULT["input_colourspace"],
+                            clearable=False,
+                            className="app-widget",
+                        ),
+                        H5(children="Output Colourspace"),
+                        Dropdown(
+                            id=_uid("output-colourspace"),
+                            options=options_RGB_colourspace(
+                                value=STATE_DEFAULT["output_colourspace"]
+                            ),
+                            value=STATE_DEFAULT["output_colourspace"],
+                            clearable=False,
+                            className="app-widget",
+                        ),
+                        H5(children="Chromatic Adaptation Transform"),
+                        Dropdown(
+                            id=_uid("chromatic-adaptation-transform"),
+                            options=[
+                                *OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM,
+                                {"label": "None", "value": "None"},
+                            ],
+                            value=STATE_DEFAULT["chromatic_adaptation_transform"],
+                            clearable=False,
+                            className="app-widget",
+                        ),
+                        Checklist(
+                            id=_uid("transfer-functions"),
+                            options=[
+                                {
+                                    "label": " Apply Transfer Functions",
+                                    "value": "cctf",
+                                }
+                            ],
+                            value=STATE_DEFAULT["transfer_functions"],
+                            className="app-widget",
+                        ),
+                        H5(children="Output Format"),
+                        Dropdown(
+                            id=_uid("image-format"),
+                            options=OPTIONS_IMAGE_FORMAT,
+                            value=STATE_DEFAULT["image_format"],
+                            clearable=False,
+                            className="app-widget",
+                        ),
+                        Button(
+                            "Convert",
+                            id=_uid("convert-button"),
+                            n_clicks=0,
+                            style={"width": "100%"},
+                        ),
+                        Pre(
+                            [
+                                Code(
+                                    id=_uid("image-conversion-output"),
+                                    className="code shell",
+                                )
+                            ],
+                            className="app-widget app-output",
+                        ),
+                        Download(id=_uid("image-download")),
+                        Ul(
+                            [
+                                Li(
+                                    [
+                                        Link(
+                                            "Back to index...",
+                                            href="/",
+                                            className="app-link",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                                Li(
+                                    [
+                                        A(
+                                            "Permalink",
+                                            href=urllib.parse.urljoin(
+                                                str(SERVER_URL), APP_PATH
+                                            ),
+                                            target="_blank",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                                Li(
+                                    [
+                                        A(
+                                            "colour-science.org",
+                                            href="https://www.colour-science.org",
+                                            target="_blank",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                            ],
+                            className="list-inline text-center",
+                        ),
+                    ],
+                ),
+            ],
+            className="col-8",
+        ),
+        Div(className="col-2"),
+    ],
+    className="row",
+)
+"""
+App layout, i.e., :class:`Div` class instance.
+
+LAYOUT : Div
+"""
+
+HOOKS_RELOAD_CATALOGUE.append(
+    partial(
+        refresh_layout_options,
+        LAYOUT,
+        [_uid("input-colourspace"), _uid("output-colourspace")],
+    )
+)
+
+
+@APP.callback(
+    [
+        Output(_uid("input-colourspace"), "options"),
+        Output(_uid("output-colourspace"), "options"),
+    ],
+    [
+        Input(_uid("input-colourspace"), "search_value"),
+        Input(_uid("output-colourspace"), "search_value"),
+        Input(_uid("input-colourspace"), "value"),
+        Input(_uid("output-colourspace"), "value"),
+    ],
+)
+def set_colourspace_options(
+    input_search_value: str | None,
+    output_search_value: str | None,
+    input_colourspace: str,
+    output_colourspace: str,
+) -> tuple:
+    """
+    Set the input and output *RGB* colourspace options matching the search
+    values using the server-side search index.
+
+    Only the options of the triggered :class:`Dropdown` class instances are
+    updated.
+
+    Parameters
+    ----------
+    input_search_value
+        Input *RGB* colourspace search value.
+    output_search_value
+        Output *RGB* colourspace search value.
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+
+    Returns
+    -------
+    :class:`tuple`
+        Input and output *RGB* colourspace options.
+    """
+
+    triggered = {prop_id.split(".")[0] for prop_id in ctx.triggered_prop_ids}
+
+    return tuple(
+        options_RGB_colourspace(search_value, value)
+        if not triggered or _uid(id_) in triggered
+        else no_update
+        for id_, search_value, value in (
+            ("input-colourspace", input_search_value, input_colourspace),
+            ("output-colourspace", output_search_value, output_colourspace),
+        )
+    )
+
+
+@APP.callback(
+    [
+        Output(_uid("image-download"), "data"),
+        Output(_uid("image-conversion-output"), "children"),
+    ],
+    [Input(_uid("convert-button"), "n_clicks")],
+    [
+        State(_uid("image"), "contents"),
+        State(_uid("image"), "filename"),
+        State(_uid("input-colourspace"), "value"),
+        State(_uid("output-colourspace"), "value"),
+        State(_uid("chromatic-adaptation-transform"), "value"),
+        State(_uid("transfer-functions"), "value"),
+        State(_uid("image-format"), "value"),
+    ],
+)
+def set_image_conversion_output(
+    n_clicks: int,
+    contents: str | None,
+    filename: str | None,
+    input_colourspace: str,
+    output_colourspace: str,
+    chromatic_adaptation_transform: str,
+    transfer_functions: List[str],
+    image_format: str,
+) -> tuple:
+    """
+    Convert the uploaded image from given input *RGB* colourspace to the
+    output *RGB* colourspace using given *chromatic adaptation transform* and
+    send it to the :class:`Download` class instance.
+
+    Parameters
+    ----------
+    n_clicks
+        Number of clicks on the *Convert* button.
+    contents
+        Uploaded image content as a *base64* encoded data url.
+    filename
+        Uploaded image filename.
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+    chromatic_adaptation_transform
+        *Chromatic adaptation transform* to use.
+    transfer_functions
+        Whether to apply the colour component transfer functions.
+    image_format
+        Output image format extension or *input*.
+
+    Returns
+    -------
+    :class:`tuple`
+        Download data and conversion message.
+    """
+
+    if not n_clicks:
+        raise PreventUpdate
+
+    if contents is None or filename is None:
+        return None, "Please upload an image first!"
+
+    root, extension = os.path.splitext(filename)
+    output_extension = extension if image_format == "input" else image_format
+
+    try:
+        image = convert_image(
+            base64.b64decode(contents.split(",", 1)[1]),
+            extension,
+            input_colourspace,
+            output_colourspace,
+            chromatic_adaptation_transform,
+            "cctf" in transfer_functions,
+            output_extension,
+            IMAGE_PIXELS_MAXIMUM_UPLOAD,
+        )
+    except Exception as error:  # noqa: BLE001
+        return None, f'Could not convert "{filename}": {error}'
+
+    output_filename = f"{root}_{output_colourspace}{output_extension}"
+
+    return (
+        {
+            "content": base64.b64encode(image).decode("ascii"),
+            "filename": output_filename,
+            "base64": True,
+        },
+        f'Converted "{filename}" to "{output_filename}".',
+    )
+
+
+@SERVER.route(f"{APP_PATH}/convert", methods=["POST"])
+def convert_image_endpoint() -> Response:
+    """
+    Convert the image posted as the request body using the *RGB* colourspaces
+    and *chromatic adaptation transform* given in the URL query.
+
+    The query keys are the same as the App state keys, e.g.,
+    ``?input-colourspace=sRGB&output-colourspace=ACEScg&extension=.exr``.
+
+    The request body size is limited by :attr:`app.MAX_CONTENT_LENGTH` attribute
+    and the number of pixels of the image by
+    :attr:`apps.rgb_colourspace_image_conversion.IMAGE_PIXELS_MAXIMUM`
+    attribute.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Converted image.
+    """
+
+    def value_from_query(value: str) -> str:
+        """Return the given value from the query."""
+
+        return request.args.get(value, STATE_DEFAULT[value.replace("-", "_")])
+
+    extension = request.args.get("extension", ".exr")
+    image_format = value_from_query("image-format")
+
+    try:
+        image = convert_image(
+            request.get_data(),
+            extension,
+            value_from_query("input-colourspace"),
+            value_from_query("output-colourspace"),
+            value_from_query("chromatic-adaptation-transform"),
+            request.args.get("transfer-functions", "false").lower() == "true",
+            extension if image_format == "input" else image_format,
+        )
+    except (KeyError, OSError, TypeError, ValueError) as error:
+        abort(400, str(error))
+
+    return Response(image, mimetype="application/octet-stream")
@@ -5,28 +5,49 @@ RGB Colourspace Transformation Matrix Application
 
 from __future__ import annotations
 
-import re
-import sys
+import typing
 import urllib.parse
-from contextlib import suppress
+from functools import partial
 from urllib.parse import parse_qs, urlencode, urlparse
 
-from colour.models import RGB_COLOURSPACES, matrix_RGB_to_RGB
-from colour.utilities import numpy_print_options
-from dash.dcc import Dropdown, Link, Location, Markdown, Slider
-from dash.dependencies import Input, Output
-from dash.html import H3, H5, A, Button, Code, Div, Li, Pre, Ul
+if typing.TYPE_CHECKING:
+    from colour.hints import Dict, List, Mapping, Tuple
 
-from app import APP, SERVER_URL
+from dash import ctx, no_update
+from dash.dcc import (
+    Dropdown,
+    Interval,
+    Link,
+    Location,
+    Markdown,
+    Slider,
+    Store,
+    Textarea,
+)
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+from dash.html import H3, H5, A, Button, Code, Details, Div, Li, Pre, Span, Summary, Ul
+from flask import Response, abort, request, stream_with_context
+
+from app import APP, PRERENDERERS, SERVER, SERVER_URL
+from apps.analytics import ANALYTICS
 from apps.common import (
+    HOOKS_RELOAD_CATALOGUE,
     OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM,
-    OPTIONS_RGB_COLOURSPACE,
-    TEMPLATE_NUKE_NODE_COLORMATRIX,
-    TEMPLATE_OCIO_COLORSPACE,
-    matrix_3x3_to_4x4,
-    nuke_format_matrix,
-    spimtx_format_matrix,
+    SCHEMA_STATE_MATRIX_RGB_TO_RGB,
+    STATE_DEFAULT_MATRIX_RGB_TO_RGB,
+    LUT3D_table_RGB_to_RGB,
+    canonical_state,
+    compute_matrix_RGB_to_RGB,
+    format_LUT3D_table,
+    format_matrices_RGB_to_RGB_comparison,
+    format_matrix_RGB_to_RGB,
+    name_LUT3D_RGB_to_RGB,
+    options_RGB_colourspace,
+    prerender_app,
+    refresh_layout_options,
 )
+from apps.jobs import JOB_QUEUE
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2018 Colour Developers"
@@ -40,11 +61,25 @@ __all__ = [
     "APP_NAME",
     "APP_DESCRIPTION",
     "APP_UID",
+    "OPTIONS_LUT_SIZE",
+    "LUT_SIZE_MAXIMUM",
+    "LUT_SIZE_MAXIMUM_JOB",
+    "OPTIONS_LUT_FORMAT",
+    "RGB_CONVERTER_DEFAULT",
     "STATE_DEFAULT",
     "LAYOUT",
+    "set_colourspace_options",
     "set_RGB_to_RGB_matrix_output",
+    "set_RGB_to_RGB_matrices_comparison_output",
+    "set_RGB_converter_matrix",
+    "prerender_permalink",
     "update_state_on_url_query_change",
     "update_url_query_on_state_change",
+    "set_LUT_download_href",
+    "canonical_LUT_state",
+    "download_LUT",
+    "submit_LUT_job",
+    "set_LUT_job_progress",
 ]
 
 APP_NAME: str = "RGB Colourspace Transformation Matrix"
@@ -61,7 +96,8 @@ APP_DESCRIPTION: str = (
     "This app computes the colour transformation "
     "matrix from the *Input RGB Colourspace* to the "
     "*Output RGB Colourspace* using the given "
-    "*Chromatic Adaptation Transform*."
+    "*Chromatic Adaptation Transform*. The matrices of all the "
+    "*Chromatic Adaptation Transforms* can be compared against the given one."
 )
 """
 App description.
@@ -72,6 +108,36 @@ APP_UID: int = hash(APP_NAME)
 App unique id.
 """
 
+OPTIONS_LUT_SIZE: List[Dict] = [
+    {"label": str(size), "value": size} for size in (17, 33, 65)
+]
+"""
+3D *LUT* size options for a :class:`Dropdown` class instance.
+"""
+
+LUT_SIZE_MAXIMUM: int = 65
+"""
+Maximum size of the 3D *LUT* streamed synchronously.
+"""
+
+LUT_SIZE_MAXIMUM_JOB: int = 129
+"""
+Maximum size of the 3D *LUT* rendered as a background job.
+"""
+
+OPTIONS_LUT_FORMAT: List[Dict] = [
+    {"label": "Iridas .cube", "value": "cube"},
+    {"label": "Sony .spi3d", "value": "spi3d"},
+]
+"""
+3D *LUT* format options for a :class:`Dropdown` class instance.
+"""
+
+RGB_CONVERTER_DEFAULT: Tuple = (0.18, 0.18, 0.18)
+"""
+Default linear *RGB* triplet of the *RGB* converter.
+"""
+
 
 def _uid(id_: str) -> str:
     """
@@ -82,13 +148,9 @@ def _uid(id_: str) -> str:
 
 
 STATE_DEFAULT = {
-    "input_colourspace": OPTIONS_RGB_COLOURSPACE[0]["value"],
-    "output_colourspace": OPTIONS_RGB_COLOURSPACE[0]["value"],
-    "chromatic_adaptation_transform": OPTIONS_CHROMATIC_ADAPTATION_TRANSFORM[0][
-        "value"
-    ],
-    "formatter": "str",
-    "decimals": 10,
+    **STATE_DEFAULT_MATRIX_RGB_TO_RGB,
+    "LUT_size": OPTIONS_LUT_SIZE[1]["value"],
+    "LUT_format": OPTIONS_LUT_FORMAT[0]["value"],
 }
 """
 Default App state.
@@ -107,7 +169,9 @@ LAYOUT: Div = Div(
                         H5(children="Input Colourspace"),
                         Dropdown(
                             id=_uid("input-colourspace"),
-                            options=OPTIONS_RGB_COLOURSPACE,
+                            options=options_RGB_colourspace(
+                                value=STATE_DEFAULT["input_colourspace"]
+                            ),
                             value=STATE_DEFAULT["input_colourspace"],
                             clearable=False,
                             className="app-widget",
@@ -115,7 +179,9 @@ LAYOUT: Div = Div(
                         H5(children="Output Colourspace"),
                         Dropdown(
                             id=_uid("output-colourspace"),
-                            options=OPTIONS_RGB_COLOURSPACE,
+                            options=options_RGB_colourspace(
+                                value=STATE_DEFAULT["output_colourspace"]
+                            ),
                             value=STATE_DEFAULT["output_colourspace"],
                             clearable=False,
                             className="app-widget",
@@ -175,6 +241,114 @@ LAYOUT: Div = Div(
                             ],
                             className="app-widget app-output",
                         ),
+                        Details(
+                            [
+                                Summary("Compare Chromatic Adaptation Transforms"),
+                                Pre(
+                                    [
+                                        Code(
+                                            id=_uid(
+                                                "rgb-colourspace-transformation-"
+                                                "matrices-comparison-output"
+                                            ),
+                                            className="code shell",
+                                        )
+                                    ],
+                                    className="app-widget app-output",
+                                ),
+                            ],
+                            id=_uid("compare-chromatic-adaptation-transforms"),
+                            open=False,
+                            className="app-widget",
+                        ),
+                        Details(
+                            [
+                                Summary("Convert Linear RGB Values"),
+                                *(
+                                    Slider(
+                                        id=_uid(f"RGB-converter-{component}"),
+                                        min=0,
+                                        max=1,
+                                        step=0.001,
+                                        value=value,
+                                        marks={0: "0", 0.5: component, 1: "1"},
+                                        tooltip={"placement": "bottom"},
+                                        updatemode="drag",
+                                        className="app-widget",
+                                    )
+                                    for component, value in zip(
+                                        "RGB", RGB_CONVERTER_DEFAULT, strict=True
+                                    )
+                                ),
+                                Textarea(
+                                    id=_uid("RGB-converter-swatches"),
+                                    placeholder=(
+                                        "Paste linear RGB triplets, one per "
+                                        "line, e.g., 0.18 0.18 0.18"
+                                    ),
+                                    style={"width": "100%"},
+                                    className="app-widget",
+                                ),
+                                Pre(
+                                    [
+                                        Code(
+                                            id=_uid("RGB-converter-output"),
+                                            className="code shell",
+                                        )
+                                    ],
+                                    className="app-widget app-output",
+                                ),
+                            ],
+                            open=False,
+                            className="app-widget",
+                        ),
+                        H5(children="LUT Size"),
+                        Dropdown(
+                            id=_uid("LUT-size"),
+                            options=OPTIONS_LUT_SIZE,
+                            value=STATE_DEFAULT["LUT_size"],
+                            clearable=False,
+                            className="app-widget",
+                        ),
+                        H5(children="LUT Format"),
+                        Dropdown(
+                            id=_uid("LUT-format"),
+                            options=OPTIONS_LUT_FORMAT,
+                            value=STATE_DEFAULT["LUT_format"],
+                            clearable=False,
+                            className="app-widget",
+                        ),
+                        A(
+                            Button("Download LUT", style={"width": "100%"}),
+                            id=_uid("LUT-download"),
+                            download="",
+                        ),
+                        Button(
+                            "Render LUT in Background",
+                            id=_uid("LUT-job-button"),
+                            n_clicks=0,
+                            style={"width": "100%"},
+                        ),
+                        Div(
+                            [
+                                Span(id=_uid("LUT-job-progress")),
+                                " ",
+                                A(
+                                    "Download",
+                                    id=_uid("LUT-job-download"),
+                                    download="",
+                                    style={"display": "none"},
+                                ),
+                            ],
+                            className="app-widget",
+                        ),
+                        Store(id=_uid("LUT-job")),
+                        Interval(
+                            id=_uid("LUT-job-interval"),
+                            interval=1000,
+                            disabled=True,
+                        ),
+                        Store(id=_uid("RGB-converter")),
                         Ul(
                             [
                                 Li(
@@ -228,6 +402,69 @@ App layout, i.e., :class:`Div` class instance.
 LAYOUT : Div
 """
 
+HOOKS_RELOAD_CATALOGUE.append(
+    partial(
+        refresh_layout_options,
+        LAYOUT,
+        [_uid("input-colourspace"), _uid("output-colourspace")],
+    )
+)
+
+
+@APP.callback(
+    [
+        Output(_uid("input-colourspace"), "options"),
+        Output(_uid("output-colourspace"), "options"),
+    ],
+    [
+        Input(_uid("input-colourspace"), "search_value"),
+        Input(_uid("output-colourspace"), "search_value"),
+        Input(_uid("input-colourspace"), "value"),
+        Input(_uid("output-colourspace"), "value"),
+    ],
+)
+def set_colourspace_options(
+    input_search_value: str | None,
+    output_search_value: str | None,
+    input_colourspace: str,
+    output_colourspace: str,
+) -> tuple:
+    """
+    Set the input and output *RGB* colourspace options matching the search
+    values using the server-side search index.
+
+    Only the options of the triggered :class:`Dropdown` class instances are
+    updated.
+
+    Parameters
+    ----------
+    input_search_value
+        Input *RGB* colourspace search value.
+    output_search_value
+        Output *RGB* colourspace search value.
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+
+    Returns
+    -------
+    :class:`tuple`
+        Input and output *RGB* colourspace options.
+    """
+
+    triggered = {prop_id.split(".")[0] for prop_id in ctx.triggered_prop_ids}
+
+    return tuple(
+        options_RGB_colourspace(search_value, value)
+        if not triggered or _uid(id_) in triggered
+        else no_update
+        for id_, search_value, value in (
+            ("input-colourspace", input_search_value, input_colourspace),
+            ("output-colourspace", output_search_value, output_colourspace),
+        )
+    )
+
 
 @APP.callback(
     Output(
@@ -271,68 +508,203 @@ def set_RGB_to_RGB_matrix_output(
     Returns
     -------
     :class:`str`
-        Colour transformation matrix.
+        Colour transformation matrix or error message if the App state is not
+        valid.
     """
 
-    chromatic_adaptation_transform = (
-        None
-        if chromatic_adaptation_transform == "None"
-        else chromatic_adaptation_transform
+    try:
+        state = canonical_state(
+            {
+                "input_colourspace": input_colourspace,
+                "output_colourspace": output_colourspace,
+                "chromatic_adaptation_transform": chromatic_adaptation_transform,
+                "formatter": formatter,
+                "decimals": decimals,
+            },
+            SCHEMA_STATE_MATRIX_RGB_TO_RGB,
+            STATE_DEFAULT,
+        )
+    except ValueError as error:
+        return str(error)
+
+    ANALYTICS.record("matrix_RGB_to_RGB", state)
+
+    return format_matrix_RGB_to_RGB(*state.values())
+
+
+@APP.callback(
+    Output(
+        component_id=_uid(
+            "rgb-colourspace-transformation-matrices-comparison-output"
+        ),
+        component_property="children",
+    ),
+    [
+        Input(_uid("compare-chromatic-adaptation-transforms"), "open"),
+        Input(_uid("input-colourspace"), "value"),
+        Input(_uid("output-colourspace"), "value"),
+        Input(_uid("chromatic-adaptation-transform"), "value"),
+        Input(_uid("decimals"), "value"),
+    ],
+)
+def set_RGB_to_RGB_matrices_comparison_output(
+    is_open: bool,
+    input_colourspace: str,
+    output_colourspace: str,
+    chromatic_adaptation_transform: str,
+    decimals: int,
+) -> str:
+    """
+    Compute and write the colour transformation matrices from given input
+    *RGB* colourspace to the output *RGB* colourspace for every
+    *chromatic adaptation transform*, compared against given
+    *chromatic adaptation transform*, into the comparison :class:`Pre` class
+    instance.
+
+    The matrices are computed at once and only when the comparison
+    :class:`Details` class instance is open.
+
+    Parameters
+    ----------
+    is_open
+        Whether the comparison :class:`Details` class instance is open.
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+    chromatic_adaptation_transform
+        Reference *chromatic adaptation transform*.
+    decimals
+        Decimals to use when formatting the colour transformation matrices.
+
+    Returns
+    -------
+    :class:`str`
+        Colour transformation matrices comparison table or error message if
+        the App state is not valid.
+    """
+
+    if not is_open:
+        raise PreventUpdate
+
+    try:
+        state = canonical_state(
+            {
+                "input_colourspace": input_colourspace,
+                "output_colourspace": output_colourspace,
+                "chromatic_adaptation_transform": chromatic_adaptation_transform,
+                "decimals": decimals,
+            },
+            SCHEMA_STATE_MATRIX_RGB_TO_RGB,
+            STATE_DEFAULT,
+        )
+    except ValueError as error:
+        return str(error)
+
+    return format_matrices_RGB_to_RGB_comparison(
+        state["input_colourspace"],
+        state["output_colourspace"],
+        state["chromatic_adaptation_transform"],
+        state["decimals"],
     )
 
-    M = matrix_RGB_to_RGB(
-        RGB_COLOURSPACES[input_colourspace],
-        RGB_COLOURSPACES[output_colourspace],
-        chromatic_adaptation_transform,
+
+@APP.callback(
+    Output(_uid("RGB-converter"), "data"),
+    [
+        Input(_uid("input-colourspace"), "value"),
+        Input(_uid("output-colourspace"), "value"),
+        Input(_uid("chromatic-adaptation-transform"), "value"),
+    ],
+)
+def set_RGB_converter_matrix(
+    input_colourspace: str,
+    output_colourspace: str,
+    chromatic_adaptation_transform: str,
+) -> Dict | None:
+    """
+    Send the colour transformation matrix from given input *RGB* colourspace
+    to the output *RGB* colourspace using given
+    *chromatic adaptation transform* to the *RGB* converter.
+
+    The matrix is only sent when the *RGB* colourspaces or the
+    *chromatic adaptation transform* change, the *RGB* values are then
+    converted in the browser without any request to the server. The values
+    are linear, i.e., the colour component transfer functions of the *RGB*
+    colourspaces are not applied.
+
+    Parameters
+    ----------
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+    chromatic_adaptation_transform
+        *Chromatic adaptation transform* to use.
+
+    Returns
+    -------
+    :class:`dict` or :py:data:`None`
+        Colour transformation matrix or *None* if the App state is not valid.
+    """
+
+    try:
+        state = canonical_state(
+            {
+                "input_colourspace": input_colourspace,
+                "output_colourspace": output_colourspace,
+                "chromatic_adaptation_transform": chromatic_adaptation_transform,
+            },
+            SCHEMA_STATE_MATRIX_RGB_TO_RGB,
+            STATE_DEFAULT,
+        )
+    except ValueError:
+        return None
+
+    M = compute_matrix_RGB_to_RGB(
+        state["input_colourspace"],
+        state["output_colourspace"],
+        (
+            None
+            if state["chromatic_adaptation_transform"] == "None"
+            else state["chromatic_adaptation_transform"]
+        ),
     )
 
-    with numpy_print_options(
-        formatter={"float": f"{{: 0.{decimals}f}}".format},
-        threshold=sys.maxsize,
-    ):
-        if formatter == "str":
-            M_f = str(M)
-        elif formatter == "repr":
-            M_f = repr(M)
-        elif formatter == "nuke":
-
-            def slugify(string: str) -> str:
-                """Slugify given string for *Nuke*."""
-
-                string = string.replace("+", "_Plus")
-                pattern = r"\(|\)"
-                string = re.sub(pattern, "", string)
-                pattern = r"\s-\s|\s|-|\.|/"
-                return re.sub(pattern, "_", string)
-
-            M_f = TEMPLATE_NUKE_NODE_COLORMATRIX.format(
-                name=(
-                    f"{slugify(input_colourspace)}"
-                    f"__to__"
-                    f"{slugify(output_colourspace)}"
-                ),
-                matrix=nuke_format_matrix(M, decimals),
-            )
-        elif formatter == "opencolorio":
-            M_f = TEMPLATE_OCIO_COLORSPACE.format(
-                name=output_colourspace,
-                input_colourspace=input_colourspace,
-                output_colourspace=output_colourspace,
-                matrix=re.sub(
-                    r"\s+",
-                    " ",
-                    repr(matrix_3x3_to_4x4(M))
-                    .replace("array(", "")
-                    .replace("[ ", "[")
-                    .replace(")", "")
-                    .replace("\n", ""),
-                ),
-            )
+    return {"matrix": M.tolist()}
+
 
-        elif formatter == "spimtx":
-            M_f = spimtx_format_matrix(M, decimals)
+def prerender_permalink(query: Mapping[str, str]) -> str | None:
+    """
+    Pre-render the App for given URL query, i.e., permanent link, so that the
+    colour transformation matrix is painted before the *Dash* renderer loads.
 
-        return M_f
+    Parameters
+    ----------
+    query
+        URL query.
+
+    Returns
+    -------
+    :class:`str` or :py:data:`None`
+        Pre-rendered App *HTML* or *None* if the URL query is not valid.
+    """
+
+    try:
+        state = canonical_state(query, SCHEMA_STATE_MATRIX_RGB_TO_RGB, STATE_DEFAULT)
+    except ValueError:
+        return None
+
+    return prerender_app(
+        APP_PATH,
+        APP_NAME,
+        APP_DESCRIPTION,
+        state,
+        format_matrix_RGB_to_RGB(*state.values()),
+    )
+
+
+PRERENDERERS[APP_PATH] = prerender_permalink
 
 
 @APP.callback(
@@ -346,16 +718,34 @@ def set_RGB_to_RGB_matrix_output(
     [
         Input(_uid("url"), "href"),
     ],
+    [
+        State(_uid("input-colourspace"), "value"),
+        State(_uid("output-colourspace"), "value"),
+        State(_uid("chromatic-adaptation-transform"), "value"),
+        State(_uid("formatter"), "value"),
+        State(_uid("decimals"), "value"),
+    ],
 )
-def update_state_on_url_query_change(href: str) -> tuple:
+def update_state_on_url_query_change(href: str, *state: str | int) -> tuple:
     """
     Update the App state on URL query change.
 
+    The URL query is canonicalised first, e.g., aliases are resolved and the
+    decimals clipped, the update is prevented if it is not valid. Only the
+    state values that differ from the current App state are updated so that
+    unchanged widgets do not trigger their dependent callbacks, the update is
+    prevented altogether if the URL query matches the App state.
+
     Parameters
     ----------
     href
         URL.
 
+    Other Parameters
+    ----------------
+    state
+        Current App state.
+
     Returns
     -------
     :class:`tuple`
@@ -366,20 +756,21 @@ def update_state_on_url_query_change(href: str) -> tuple:
 
     query = parse_qs(parse_result.query)
 
-    def value_from_query(value: str) -> str:
-        """Return the given value from the query."""
-
-        with suppress(KeyError):
-            return query[value][0]
+    try:
+        values = tuple(
+            canonical_state(
+                query, SCHEMA_STATE_MATRIX_RGB_TO_RGB, STATE_DEFAULT
+            ).values()
+        )
+    except ValueError:
+        raise PreventUpdate from None
 
-        return STATE_DEFAULT[value.replace("-", "_")]
+    if values == state:
+        raise PreventUpdate
 
-    return (
-        value_from_query("input-colourspace"),
-        value_from_query("output-colourspace"),
-        value_from_query("chromatic-adaptation-transform"),
-        value_from_query("formatter"),
-        int(value_from_query("decimals")),
+    return tuple(
+        no_update if value == current else value
+        for value, current in zip(values, state, strict=True)
     )
 
 
@@ -392,6 +783,7 @@ def update_state_on_url_query_change(href: str) -> tuple:
         Input(_uid("formatter"), "value"),
         Input(_uid("decimals"), "value"),
     ],
+    [State(_uid("url"), "search")],
 )
 def update_url_query_on_state_change(
     input_colourspace: str,
@@ -399,6 +791,7 @@ def update_url_query_on_state_change(
     chromatic_adaptation_transform: str,
     formatter: str,
     decimals: int,
+    search: str | None = None,
 ) -> str:
     """
     Update the URL query on App state change.
@@ -416,6 +809,11 @@ def update_url_query_on_state_change(
     decimals
         Decimals to use when formatting the colour transformation matrix.
 
+    Other Parameters
+    ----------------
+    search
+        Current URL query, the update is prevented if it is unchanged.
+
     Returns
     -------
     :class:`str`
@@ -432,9 +830,296 @@ def update_url_query_on_state_change(
         }
     )
 
+    if f"?{query}" == search:
+        raise PreventUpdate
+
     return f"?{query}"
 
 
+@APP.callback(
+    Output(_uid("LUT-download"), "href"),
+    [
+        Input(_uid("input-colourspace"), "value"),
+        Input(_uid("output-colourspace"), "value"),
+        Input(_uid("chromatic-adaptation-transform"), "value"),
+        Input(_uid("decimals"), "value"),
+        Input(_uid("LUT-size"), "value"),
+        Input(_uid("LUT-format"), "value"),
+    ],
+)
+def set_LUT_download_href(
+    input_colourspace: str,
+    output_colourspace: str,
+    chromatic_adaptation_transform: str,
+    decimals: int,
+    LUT_size: int,
+    LUT_format: str,
+) -> str:
+    """
+    Update the 3D *LUT* download link on App state change.
+
+    Parameters
+    ----------
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+    chromatic_adaptation_transform
+        *Chromatic adaptation transform* to use.
+    decimals
+        Decimals to use when formatting the 3D *LUT*.
+    LUT_size
+        3D *LUT* size.
+    LUT_format
+        3D *LUT* format, *cube* or *spi3d*.
+
+    Returns
+    -------
+    :class:`str`
+        3D *LUT* download url.
+    """
+
+    query = urlencode(
+        {
+            "input-colourspace": input_colourspace,
+            "output-colourspace": output_colourspace,
+            "chromatic-adaptation-transform": chromatic_adaptation_transform,
+            "decimals": decimals,
+            "LUT-size": LUT_size,
+            "LUT-format": LUT_format,
+        }
+    )
+
+    return f"{APP_PATH}/lut?{query}"
+
+
+def canonical_LUT_state(
+    query: Mapping[str, str], LUT_size_maximum: int = LUT_SIZE_MAXIMUM
+) -> Dict:
+    """
+    Return the canonical 3D *LUT* state of given URL query.
+
+    Parameters
+    ----------
+    query
+        URL query.
+    LUT_size_maximum
+        Maximum 3D *LUT* size.
+
+    Returns
+    -------
+    :class:`dict`
+        Canonical 3D *LUT* state, i.e., the *RGB* colourspaces,
+        *chromatic adaptation transform*, decimals, 3D *LUT* size and format.
+
+    Raises
+    ------
+    ValueError
+        If the URL query is not valid.
+    """
+
+    state = canonical_state(query, SCHEMA_STATE_MATRIX_RGB_TO_RGB, STATE_DEFAULT)
+    del state["formatter"]
+
+    try:
+        state["LUT_size"] = int(query.get("LUT-size", STATE_DEFAULT["LUT_size"]))
+    except ValueError:
+        error = "LUT size is not an integer!"
+
+        raise ValueError(error) from None
+
+    if not 2 <= state["LUT_size"] <= LUT_size_maximum:
+        error = "LUT size is out of range!"
+
+        raise ValueError(error)
+
+    state["LUT_format"] = query.get("LUT-format", STATE_DEFAULT["LUT_format"])
+    if state["LUT_format"] not in ("cube", "spi3d"):
+        error = f'"{state["LUT_format"]}" LUT format is not supported!'
+
+        raise ValueError(error)
+
+    return state
+
+
+@SERVER.route(f"{APP_PATH}/lut")
+def download_LUT() -> Response:
+    """
+    Stream the 3D *LUT* converting from the input *RGB* colourspace to the
+    output *RGB* colourspace, including their colour component transfer
+    functions, for the state given in the URL query.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Streamed 3D *LUT*.
+    """
+
+    try:
+        state = canonical_LUT_state(request.args.to_dict())
+    except ValueError as error:
+        abort(400, str(error))
+
+    LUT_size = state["LUT_size"]
+    LUT_format = state["LUT_format"]
+
+    input_colourspace = state["input_colourspace"]
+    output_colourspace = state["output_colourspace"]
+    chromatic_adaptation_transform = state["chromatic_adaptation_transform"]
+
+    table = LUT3D_table_RGB_to_RGB(
+        input_colourspace,
+        output_colourspace,
+        (
+            None
+            if chromatic_adaptation_transform == "None"
+            else chromatic_adaptation_transform
+        ),
+        LUT_size,
+    )
+
+    name = name_LUT3D_RGB_to_RGB(input_colourspace, output_colourspace)
+
+    return Response(
+        stream_with_context(
+            format_LUT3D_table(table, LUT_format, name, state["decimals"])
+        ),
+        mimetype="text/plain",
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{LUT_format}"'
+        },
+    )
+
+
+@APP.callback(
+    Output(_uid("LUT-job"), "data"),
+    [Input(_uid("LUT-job-button"), "n_clicks")],
+    [
+        State(_uid("input-colourspace"), "value"),
+        State(_uid("output-colourspace"), "value"),
+        State(_uid("chromatic-adaptation-transform"), "value"),
+        State(_uid("decimals"), "value"),
+        State(_uid("LUT-size"), "value"),
+        State(_uid("LUT-format"), "value"),
+    ],
+    prevent_initial_call=True,
+)
+def submit_LUT_job(
+    n_clicks: int,  # noqa: ARG001
+    input_colourspace: str,
+    output_colourspace: str,
+    chromatic_adaptation_transform: str,
+    decimals: int,
+    LUT_size: int,
+    LUT_format: str,
+) -> Dict:
+    """
+    Submit the 3D *LUT* of the App state as a background job, its progress is
+    then polled by the App with a :class:`Interval` class instance.
+
+    Parameters
+    ----------
+    n_clicks
+        Number of clicks of the :class:`Button` class instance.
+    input_colourspace
+        Input *RGB* colourspace.
+    output_colourspace
+        Output *RGB* colourspace.
+    chromatic_adaptation_transform
+        *Chromatic adaptation transform* to use.
+    decimals
+        Decimals to use when formatting the 3D *LUT*.
+    LUT_size
+        3D *LUT* size.
+    LUT_format
+        3D *LUT* format, *cube* or *spi3d*.
+
+    Returns
+    -------
+    :class:`dict`
+        Job id and result url, or submission error.
+    """
+
+    try:
+        state = canonical_LUT_state(
+            {
+                "input-colourspace": input_colourspace,
+                "output-colourspace": output_colourspace,
+                "chromatic-adaptation-transform": chromatic_adaptation_transform,
+                "decimals": decimals,
+                "LUT-size": LUT_size,
+                "LUT-format": LUT_format,
+            },
+            LUT_SIZE_MAXIMUM_JOB,
+        )
+    except ValueError:
+        raise PreventUpdate from None
+
+    try:
+        job_id = JOB_QUEUE.submit("LUT3D", state)
+    except RuntimeError as error:
+        return {"error": str(error)}
+
+    return {"id": job_id, "result": f"/jobs/{job_id}/result"}
+
+
+@APP.callback(
+    [
+        Output(_uid("LUT-job-progress"), "children"),
+        Output(_uid("LUT-job-download"), "href"),
+        Output(_uid("LUT-job-download"), "style"),
+        Output(_uid("LUT-job-interval"), "disabled"),
+    ],
+    [
+        Input(_uid("LUT-job"), "data"),
+        Input(_uid("LUT-job-interval"), "n_intervals"),
+    ],
+    prevent_initial_call=True,
+)
+def set_LUT_job_progress(
+    job: Dict | None,
+    n_intervals: int,  # noqa: ARG001
+) -> Tuple:
+    """
+    Set the progress of the 3D *LUT* background job polled from the jobs store
+    and its download link once it is rendered, the polling is enabled when a
+    job is submitted and disabled once it is finished.
+
+    Parameters
+    ----------
+    job
+        Job id and result url, or submission error.
+    n_intervals
+        Number of intervals elapsed of the :class:`Interval` class instance.
+
+    Returns
+    -------
+    :class:`tuple`
+        Job progress, download link url and style and whether the polling of
+        the job progress is disabled.
+    """
+
+    if not job:
+        raise PreventUpdate
+
+    hidden = {"display": "none"}
+
+    if "error" in job:
+        return job["error"], no_update, hidden, True
+
+    state = JOB_QUEUE.store.state(job["id"])
+    if state is None:
+        return "The job has expired!", no_update, hidden, True
+
+    if state["status"] == "done":
+        return "Rendered.", job["result"], {}, True
+
+    if state["status"] == "failed":
+        return f"Failed: {state['error']}", no_update, hidden, True
+
+    return f"Rendering... {round(state['progress'] * 100)}%", no_update, hidden, False
+
+
 APP.clientside_callback(
     f"""
     function(n_clicks) {{
@@ -450,3 +1135,54 @@ APP.clientside_callback(
     [Output(component_id=_uid("dev-null"), component_property="children")],
     [Input(_uid("copy-to-clipboard-button"), "n_clicks")],
 )
+
+
+APP.clientside_callback(
+    """
+    function(converter, R, G, B, swatches, decimals) {
+        if (!converter) {
+            return "";
+        }
+        var M = converter.matrix;
+        var lines = (swatches || "").split("\\n").filter(function(line) {
+            return line.trim() !== "";
+        });
+        var RGB = new Float64Array(3 * (lines.length + 1));
+        RGB.set([R, G, B]);
+        lines.forEach(function(line, i) {
+            var triplet = line.trim().split(/[\\s,;]+/).filter(Boolean)
+                .map(Number);
+            RGB.set(triplet.length === 3 ? triplet : [NaN, NaN, NaN], 3 * (i + 1));
+        });
+        var converted = new Float64Array(RGB.length);
+        for (var i = 0; i < RGB.length; i += 3) {
+            for (var j = 0; j < 3; j++) {
+                converted[i + j] = M[j][0] * RGB[i] + M[j][1] * RGB[i + 1] +
+                    M[j][2] * RGB[i + 2];
+            }
+        }
+        var format = function(a, i) {
+            return Array.from(a.subarray(i, i + 3), function(value) {
+                return value.toFixed(decimals);
+            }).join(", ");
+        };
+        var output = [];
+        for (var i = 0; i < RGB.length; i += 3) {
+            output.push(
+                isNaN(converted[i]) ? "Invalid RGB triplet: " + lines[i / 3 - 1] :
+                "[" + format(RGB, i) + "] -> [" + format(converted, i) + "]"
+            );
+        }
+        return output.join("\\n");
+    }
+    """,
+    Output(_uid("RGB-converter-output"), "children"),
+    [
+        Input(_uid("RGB-converter"), "data"),
+        Input(_uid("RGB-converter-R"), "value"),
+        Input(_uid("RGB-converter-G"), "value"),
+        Input(_uid("RGB-converter-B"), "value"),
+        Input(_uid("RGB-converter-swatches"), "value"),
+        Input(_uid("decimals"), "value"),
+    ],
+)
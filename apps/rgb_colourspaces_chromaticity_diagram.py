@@ -0,0 +1,554 @@
+"""
+RGB Colourspaces Chromaticity Diagram Application
+=================================================
+"""
+
+from __future__ import annotations
+
+import typing
+import urllib.parse
+from functools import lru_cache, partial
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import numpy as np
+from colour.colorimetry import MSDS_CMFS
+from colour.models import XYZ_to_xy, xy_to_Luv_uv
+from dash import Patch, ctx, no_update
+from dash.dcc import Dropdown, Graph, Link, Location, Markdown
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+from dash.html import H3, H5, A, Div, Li, Ul
+
+if typing.TYPE_CHECKING:
+    from colour.hints import ArrayLike, Dict, List, NDArrayFloat
+
+from app import APP, SERVER_URL
+from apps.common import (
+    HOOKS_RELOAD_CATALOGUE,
+    RGB_colourspace,
+    canonical_RGB_colourspace,
+    label_RGB_colourspace,
+    options_RGB_colourspace,
+    refresh_layout_options,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "APP_NAME",
+    "APP_PATH",
+    "APP_DESCRIPTION",
+    "APP_UID",
+    "OPTIONS_CHROMATICITY_DIAGRAM",
+    "SPECTRAL_LOCUS_INTERVAL",
+    "STATE_DEFAULT",
+    "figure_template",
+    "gamut_traces",
+    "LAYOUT",
+    "set_colourspaces_options",
+    "set_chromaticity_diagram_output",
+    "update_state_on_url_query_change",
+    "update_url_query_on_state_change",
+]
+
+APP_NAME: str = "RGB Colourspaces Chromaticity Diagram"
+"""
+App name.
+"""
+
+APP_PATH: str = f"/apps/{__name__.split('.')[-1]}"
+"""
+App path, i.e., app url.
+"""
+
+APP_DESCRIPTION: str = (
+    "This app plots the gamut of the given *RGB Colourspaces* in the "
+    "*CIE 1931* or *CIE 1976 UCS* *Chromaticity Diagram*."
+)
+"""
+App description.
+"""
+
+APP_UID: int = hash(APP_NAME)
+"""
+App unique id.
+"""
+
+OPTIONS_CHROMATICITY_DIAGRAM: List[Dict] = [
+    {"label": "CIE 1931", "value": "CIE 1931"},
+    {"label": "CIE 1976 UCS", "value": "CIE 1976 UCS"},
+]
+"""
+*Chromaticity Diagram* options for a :class:`Dropdown` class instance.
+"""
+
+SPECTRAL_LOCUS_INTERVAL: int = 5
+"""
+Wavelength interval in nm at which the spectral locus is downsampled.
+"""
+
+
+def _uid(id_: str) -> str:
+    """
+    Generate a unique id for given id by appending the application *UID*.
+    """
+
+    return f"{id_}-{APP_UID}"
+
+
+def _is_chromaticity_diagram(diagram: str | None) -> bool:
+    """
+    Return whether given *Chromaticity Diagram* is supported.
+    """
+
+    return any(option["value"] == diagram for option in OPTIONS_CHROMATICITY_DIAGRAM)
+
+
+STATE_DEFAULT = {
+    "colourspaces": ["ITU-R BT.709", "ITU-R BT.2020"],
+    "chromaticity_diagram": OPTIONS_CHROMATICITY_DIAGRAM[0]["value"],
+}
+"""
+Default App state.
+"""
+
+
+def _xy_to_chromaticity_diagram(xy: ArrayLike, diagram: str) -> NDArrayFloat:
+    """
+    Convert given *CIE xy* chromaticity coordinates to the coordinates of the
+    given *Chromaticity Diagram*.
+    """
+
+    xy = np.asarray(xy, dtype=np.float64)
+
+    return xy_to_Luv_uv(xy) if diagram == "CIE 1976 UCS" else xy
+
+
+@lru_cache(maxsize=len(OPTIONS_CHROMATICITY_DIAGRAM))
+def figure_template(diagram: str) -> Dict:
+    """
+    Return the serialised figure template, i.e., the spectral locus and the
+    background, of given *Chromaticity Diagram*.
+
+    The spectral locus is stored as a layout shape so that the figure data
+    only ever contains the gamut traces, allowing interactions to patch them
+    without sending the template again. The template is computed once per
+    supported diagram.
+
+    Parameters
+    ----------
+    diagram
+        *Chromaticity Diagram*, e.g., *CIE 1931* or *CIE 1976 UCS*.
+
+    Returns
+    -------
+    :class:`dict`
+        Serialised figure template.
+
+    Raises
+    ------
+    ValueError
+        If the *Chromaticity Diagram* is not supported.
+    """
+
+    if not _is_chromaticity_diagram(diagram):
+        error = f'"{diagram}" chromaticity diagram is not supported!'
+
+        raise ValueError(error)
+
+    cmfs = MSDS_CMFS["CIE 1931 2 Degree Standard Observer"]
+    wavelengths = np.arange(380, 701, SPECTRAL_LOCUS_INTERVAL)
+    ij = _xy_to_chromaticity_diagram(
+        XYZ_to_xy(cmfs[wavelengths]), diagram  # pyright: ignore
+    )
+
+    path = "M " + " L ".join(f"{i:.5f},{j:.5f}" for i, j in ij) + " Z"
+
+    annotations = [
+        {
+            "x": i,
+            "y": j,
+            "text": str(wavelength),
+            "showarrow": False,
+            "xanchor": "left" if wavelength > 510 else "right",
+            "font": {"size": 9, "color": "#7f7f7f"},
+        }
+        for wavelength, (i, j) in zip(wavelengths, ij, strict=True)
+        if wavelength in (460, 470, 480, 490, 500, 520, 540, 560, 580, 600, 620)
+    ]
+
+    i_label, j_label = ("u'", "v'") if diagram == "CIE 1976 UCS" else ("x", "y")
+
+    return {
+        "data": [],
+        "layout": {
+            "shapes": [
+                {
+                    "type": "path",
+                    "path": path,
+                    "fillcolor": "rgba(127, 127, 127, 0.1)",
+                    "line": {"color": "#3f3f3f", "width": 1.5},
+                    "layer": "below",
+                }
+            ],
+            "annotations": annotations,
+            "xaxis": {
+                "title": {"text": i_label},
+                "range": [-0.1, 0.8],
+                "zeroline": False,
+            },
+            "yaxis": {
+                "title": {"text": j_label},
+                "range": [-0.1, 0.9],
+                "scaleanchor": "x",
+                "scaleratio": 1,
+                "zeroline": False,
+            },
+            "legend": {"x": 1, "xanchor": "right", "y": 1},
+            "margin": {"l": 40, "r": 20, "t": 20, "b": 40},
+            "height": 640,
+            "uirevision": diagram,
+        },
+    }
+
+
+def gamut_traces(colourspaces: List[str], diagram: str) -> List[Dict]:
+    """
+    Return the *scattergl* gamut traces of given *RGB* colourspaces in given
+    *Chromaticity Diagram*.
+
+    Parameters
+    ----------
+    colourspaces
+        *RGB* colourspaces to return the gamut traces of.
+    diagram
+        *Chromaticity Diagram*, e.g., *CIE 1931* or *CIE 1976 UCS*.
+
+    Returns
+    -------
+    :class:`list`
+        Gamut traces.
+    """
+
+    if not colourspaces:
+        return []
+
+    xy = np.stack(
+        [
+            np.vstack(
+                [
+                    RGB_colourspace(colourspace).primaries,
+                    RGB_colourspace(colourspace).primaries[0],
+                ]
+            )
+            for colourspace in colourspaces
+        ]
+    )
+    ij = np.round(_xy_to_chromaticity_diagram(xy, diagram), 6)
+
+    return [
+        {
+            "type": "scattergl",
+            "mode": "lines+markers",
+            "name": label_RGB_colourspace(colourspace),
+            "x": ij[i, :, 0].tolist(),
+            "y": ij[i, :, 1].tolist(),
+            "customdata": [*"RGBR"],
+            "hovertemplate": "%{customdata}: %{x}, %{y}",
+            "marker": {"size": 5},
+            "line": {"width": 1.5},
+        }
+        for i, colourspace in enumerate(colourspaces)
+    ]
+
+
+LAYOUT: Div = Div(
+    [
+        Div(className="col-2"),
+        Div(
+            [
+                Location(id=_uid("url"), refresh=False),
+                H3([Link(APP_NAME, href=APP_PATH)], className="text-center"),
+                Div(
+                    [
+                        Markdown(APP_DESCRIPTION),
+                        H5(children="Colourspaces"),
+                        Dropdown(
+                            id=_uid("colourspaces"),
+                            options=options_RGB_colourspace(
+                                value=STATE_DEFAULT["colourspaces"]
+                            ),
+                            value=STATE_DEFAULT["colourspaces"],
+                            multi=True,
+                            className="app-widget",
+                        ),
+                        H5(children="Chromaticity Diagram"),
+                        Dropdown(
+                            id=_uid("chromaticity-diagram"),
+                            options=OPTIONS_CHROMATICITY_DIAGRAM,
+                            value=STATE_DEFAULT["chromaticity_diagram"],
+                            clearable=False,
+                            className="app-widget",
+                        ),
+                        Graph(
+                            id=_uid("chromaticity-diagram-output"),
+                            config={"displaylogo": False},
+                            className="app-widget app-output",
+                        ),
+                        Ul(
+                            [
+                                Li(
+                                    [
+                                        Link(
+                                            "Back to index...",
+                                            href="/",
+                                            className="app-link",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                                Li(
+                                    [
+                                        A(
+                                            "Permalink",
+                                            href=urllib.parse.urljoin(
+                                                str(SERVER_URL), APP_PATH
+                                            ),
+                                            target="_blank",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                                Li(
+                                    [
+                                        A(
+                                            "colour-science.org",
+                                            href="https://www.colour-science.org",
+                                            target="_blank",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                            ],
+                            className="list-inline text-center",
+                        ),
+                    ],
+                ),
+            ],
+            className="col-8",
+        ),
+        Div(className="col-2"),
+    ],
+    className="row",
+)
+"""
+App layout, i.e., :class:`Div` class instance.
+
+LAYOUT : Div
+"""
+
+HOOKS_RELOAD_CATALOGUE.append(
+    partial(refresh_layout_options, LAYOUT, [_uid("colourspaces")])
+)
+
+
+@APP.callback(
+    Output(_uid("colourspaces"), "options"),
+    [
+        Input(_uid("colourspaces"), "search_value"),
+        Input(_uid("colourspaces"), "value"),
+    ],
+)
+def set_colourspaces_options(
+    search_value: str | None, colourspaces: List[str]
+) -> List[Dict]:
+    """
+    Set the *RGB* colourspaces options matching the search value using the
+    server-side search index.
+
+    Parameters
+    ----------
+    search_value
+        *RGB* colourspaces search value.
+    colourspaces
+        Selected *RGB* colourspaces.
+
+    Returns
+    -------
+    :class:`list`
+        *RGB* colourspace options.
+    """
+
+    return options_RGB_colourspace(search_value, colourspaces)
+
+
+@APP.callback(
+    Output(
+        component_id=_uid("chromaticity-diagram-output"),
+        component_property="figure",
+    ),
+    [
+        Input(_uid("colourspaces"), "value"),
+        Input(_uid("chromaticity-diagram"), "value"),
+    ],
+)
+def set_chromaticity_diagram_output(
+    colourspaces: List[str] | None, chromaticity_diagram: str
+) -> Dict | Patch:
+    """
+    Plot the gamut of given *RGB* colourspaces in given
+    *Chromaticity Diagram* into the output :class:`Graph` class instance.
+
+    The figure template is only sent when the *Chromaticity Diagram* changes,
+    any other interaction patches the gamut traces only.
+
+    Parameters
+    ----------
+    colourspaces
+        *RGB* colourspaces to plot the gamut of.
+    chromaticity_diagram
+        *Chromaticity Diagram*, e.g., *CIE 1931* or *CIE 1976 UCS*.
+
+    Returns
+    -------
+    :class:`dict` or :class:`Patch`
+        Figure or figure patch.
+    """
+
+    if not _is_chromaticity_diagram(chromaticity_diagram):
+        raise PreventUpdate
+
+    traces = gamut_traces(colourspaces or [], chromaticity_diagram)
+
+    triggered = ctx.triggered_prop_ids.values()
+
+    if triggered and _uid("chromaticity-diagram") not in triggered:
+        figure = Patch()
+        figure["data"] = traces
+
+        return figure
+
+    return {**figure_template(chromaticity_diagram), "data": traces}
+
+
+@APP.callback(
+    [
+        Output(_uid("colourspaces"), "value"),
+        Output(_uid("chromaticity-diagram"), "value"),
+    ],
+    [
+        Input(_uid("url"), "href"),
+    ],
+    [
+        State(_uid("colourspaces"), "value"),
+        State(_uid("chromaticity-diagram"), "value"),
+    ],
+)
+def update_state_on_url_query_change(
+    href: str, *state: List[str] | str | None
+) -> tuple:
+    """
+    Update the App state on URL query change.
+
+    Only the state values that differ from the current App state are updated
+    so that unchanged widgets do not trigger their dependent callbacks, the
+    update is prevented altogether if the URL query matches the App state.
+
+    Parameters
+    ----------
+    href
+        URL.
+
+    Other Parameters
+    ----------------
+    state
+        Current App state.
+
+    Returns
+    -------
+    :class:`tuple`
+        App state.
+    """
+
+    parse_result = urlparse(href)
+
+    query = parse_qs(parse_result.query)
+
+    try:
+        colourspaces = [
+            canonical_RGB_colourspace(colourspace)
+            for colourspace in query.get("colourspaces", STATE_DEFAULT["colourspaces"])
+        ]
+    except ValueError:
+        raise PreventUpdate from None
+
+    values = (
+        colourspaces,
+        query.get(
+            "chromaticity-diagram", [STATE_DEFAULT["chromaticity_diagram"]]
+        )[0],
+    )
+
+    if not _is_chromaticity_diagram(values[1]):
+        raise PreventUpdate
+
+    if values == state:
+        raise PreventUpdate
+
+    return tuple(
+        no_update if value == current else value
+        for value, current in zip(values, state, strict=True)
+    )
+
+
+@APP.callback(
+    Output(_uid("url"), "search"),
+    [
+        Input(_uid("colourspaces"), "value"),
+        Input(_uid("chromaticity-diagram"), "value"),
+    ],
+    [State(_uid("url"), "search")],
+)
+def update_url_query_on_state_change(
+    colourspaces: List[str] | None,
+    chromaticity_diagram: str,
+    search: str | None = None,
+) -> str:
+    """
+    Update the URL query on App state change.
+
+    Parameters
+    ----------
+    colourspaces
+        *RGB* colourspaces to plot the gamut of.
+    chromaticity_diagram
+        *Chromaticity Diagram*, e.g., *CIE 1931* or *CIE 1976 UCS*.
+
+    Other Parameters
+    ----------------
+    search
+        Current URL query, the update is prevented if it is unchanged.
+
+    Returns
+    -------
+    :class:`str`
+        Url query.
+    """
+
+    query = urlencode(
+        {
+            "colourspaces": colourspaces or [],
+            "chromaticity-diagram": chromaticity_diagram,
+        },
+        doseq=True,
+    )
+
+    if f"?{query}" == search:
+        raise PreventUpdate
+
+    return f"?{query}"
@@ -0,0 +1,602 @@
+"""
+RGB Colourspaces Gamut Coverage Application
+===========================================
+"""
+
+from __future__ import annotations
+
+import typing
+import urllib.parse
+from functools import partial
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import numpy as np
+from dash import no_update
+from dash.dash_table import DataTable, FormatTemplate
+from dash.dash_table.Format import Format, Scheme
+from dash.dcc import Dropdown, Link, Location, Markdown
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+from dash.html import H3, H5, A, Div, Li, Ul
+from flask import Response, abort, jsonify, request
+
+if typing.TYPE_CHECKING:
+    from colour.hints import Dict, List, NDArrayFloat, Tuple
+
+from app import APP, SERVER, SERVER_URL
+from apps import common
+from apps.common import (
+    HOOKS_RELOAD_CATALOGUE,
+    canonical_RGB_colourspace,
+    compute_gamuts_intersection_areas,
+    label_RGB_colourspace,
+    options_RGB_colourspace,
+    refresh_layout_options,
+)
+from apps.rgb_colourspaces_chromaticity_diagram import OPTIONS_CHROMATICITY_DIAGRAM
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "APP_NAME",
+    "APP_PATH",
+    "APP_DESCRIPTION",
+    "APP_UID",
+    "COLUMNS_COVERAGE",
+    "PAGE_SIZE",
+    "STATE_DEFAULT",
+    "gamut_coverage",
+    "coverage_pairs",
+    "LAYOUT",
+    "set_colourspaces_options",
+    "set_coverage_output",
+    "coverage",
+    "update_state_on_url_query_change",
+    "update_url_query_on_state_change",
+]
+
+APP_NAME: str = "RGB Colourspaces Gamut Coverage"
+"""
+App name.
+"""
+
+APP_PATH: str = f"/apps/{__name__.split('.')[-1]}"
+"""
+App path, i.e., app url.
+"""
+
+APP_DESCRIPTION: str = (
+    "This app computes the coverage and the overlap of the gamuts of all the "
+    "pairs of the given *RGB Colourspaces*, or of all of them, in the "
+    "*CIE 1931* or *CIE 1976 UCS* *Chromaticity Diagram*."
+)
+"""
+App description.
+"""
+
+APP_UID: int = hash(APP_NAME)
+"""
+App unique id.
+"""
+
+COLUMNS_COVERAGE: List[Dict] = [
+    {"name": "Colourspace A", "id": "colourspace_a"},
+    {"name": "Colourspace B", "id": "colourspace_b"},
+    {
+        "name": "Area A",
+        "id": "area_a",
+        "type": "numeric",
+        "format": Format(precision=6, scheme=Scheme.fixed),
+    },
+    {
+        "name": "Area B",
+        "id": "area_b",
+        "type": "numeric",
+        "format": Format(precision=6, scheme=Scheme.fixed),
+    },
+    {
+        "name": "A Covered by B",
+        "id": "coverage_a_by_b",
+        "type": "numeric",
+        "format": FormatTemplate.percentage(2),
+    },
+    {
+        "name": "B Covered by A",
+        "id": "coverage_b_by_a",
+        "type": "numeric",
+        "format": FormatTemplate.percentage(2),
+    },
+    {
+        "name": "Overlap",
+        "id": "overlap",
+        "type": "numeric",
+        "format": FormatTemplate.percentage(2),
+    },
+]
+"""
+Columns of the gamut coverage :class:`DataTable` class instance, the overlap
+is the area of the intersection of the gamuts divided by the area of their
+union.
+"""
+
+PAGE_SIZE: int = 20
+"""
+Number of pairs per page of the gamut coverage :class:`DataTable` class
+instance.
+"""
+
+
+def _uid(id_: str) -> str:
+    """
+    Generate a unique id for given id by appending the application *UID*.
+    """
+
+    return f"{id_}-{APP_UID}"
+
+
+STATE_DEFAULT = {
+    "colourspaces": [],
+    "chromaticity_diagram": OPTIONS_CHROMATICITY_DIAGRAM[0]["value"],
+}
+"""
+Default App state, every *RGB* colourspace is compared if none is given.
+"""
+
+
+def gamut_coverage(
+    colourspaces: List[str], chromaticity_diagram: str
+) -> Tuple[List[str], NDArrayFloat, NDArrayFloat, NDArrayFloat]:
+    """
+    Compute the gamut coverage and overlap of all the pairs of given *RGB*
+    colourspaces in given *Chromaticity Diagram*.
+
+    Parameters
+    ----------
+    colourspaces
+        *RGB* colourspaces to compare, every *RGB* colourspace is compared if
+        empty.
+    chromaticity_diagram
+        *Chromaticity Diagram*, e.g., *CIE 1931* or *CIE 1976 UCS*.
+
+    Returns
+    -------
+    :class:`tuple`
+        *RGB* colourspaces, gamuts area, coverage of shape
+        (colourspaces, colourspaces) whose element :math:`ij` is the fraction
+        of the gamut :math:`i` covered by the gamut :math:`j` and overlap of
+        shape (colourspaces, colourspaces).
+    """
+
+    colourspaces = colourspaces or [
+        option["value"] for option in common.OPTIONS_RGB_COLOURSPACE
+    ]
+
+    intersections = compute_gamuts_intersection_areas(
+        chromaticity_diagram, *colourspaces
+    )
+    areas = np.diagonal(intersections)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coverage_ = intersections / areas[:, None]
+        overlap = intersections / (areas[:, None] + areas[None, :] - intersections)
+
+    return colourspaces, areas, coverage_, overlap
+
+
+def coverage_pairs(
+    colourspaces: List[str],
+    chromaticity_diagram: str,
+    sort_by: List[Dict] | None = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Return the columns of the gamut coverage of all the pairs of given *RGB*
+    colourspaces in given *Chromaticity Diagram*, sorted as given.
+
+    Parameters
+    ----------
+    colourspaces
+        *RGB* colourspaces to compare, every *RGB* colourspace is compared if
+        empty.
+    chromaticity_diagram
+        *Chromaticity Diagram*, e.g., *CIE 1931* or *CIE 1976 UCS*.
+    sort_by
+        :class:`DataTable` class instance sorting, i.e., the column id and
+        the direction.
+
+    Returns
+    -------
+    :class:`dict`
+        Pairs columns keyed by the :attr:`COLUMNS_COVERAGE` attribute ids.
+    """
+
+    colourspaces, areas, coverage_, overlap = gamut_coverage(
+        colourspaces, chromaticity_diagram
+    )
+    labels = np.array(
+        [label_RGB_colourspace(colourspace) for colourspace in colourspaces],
+        dtype=object,
+    )
+
+    i, j = np.triu_indices(len(colourspaces), 1)
+
+    pairs = {
+        "colourspace_a": labels[i],
+        "colourspace_b": labels[j],
+        "area_a": areas[i],
+        "area_b": areas[j],
+        "coverage_a_by_b": coverage_[i, j],
+        "coverage_b_by_a": coverage_[j, i],
+        "overlap": overlap[i, j],
+    }
+
+    if sort_by:
+        column_id, direction = sort_by[0]["column_id"], sort_by[0]["direction"]
+        order = np.argsort(pairs[column_id], kind="stable")
+        if direction == "desc":
+            order = order[::-1]
+
+        pairs = {key: column[order] for key, column in pairs.items()}
+
+    return pairs
+
+
+LAYOUT: Div = Div(
+    [
+        Div(className="col-2"),
+        Div(
+            [
+                Location(id=_uid("url"), refresh=False),
+                H3([Link(APP_NAME, href=APP_PATH)], className="text-center"),
+                Div(
+                    [
+                        Markdown(APP_DESCRIPTION),
+                        H5(children="Colourspaces"),
+                        Dropdown(
+                            id=_uid("colourspaces"),
+                            options=options_RGB_colourspace(
+                                value=STATE_DEFAULT["colourspaces"]
+                            ),
+                            value=STATE_DEFAULT["colourspaces"],
+                            multi=True,
+                            placeholder="All colourspaces",
+                            className="app-widget",
+                        ),
+                        H5(children="Chromaticity Diagram"),
+                        Dropdown(
+                            id=_uid("chromaticity-diagram"),
+                            options=OPTIONS_CHROMATICITY_DIAGRAM,
+                            value=STATE_DEFAULT["chromaticity_diagram"],
+                            clearable=False,
+                            className="app-widget",
+                        ),
+                        Div(
+                            [
+                                DataTable(
+                                    id=_uid("coverage-output"),
+                                    columns=COLUMNS_COVERAGE,
+                                    page_action="custom",
+                                    page_current=0,
+                                    page_size=PAGE_SIZE,
+                                    sort_action="custom",
+                                    sort_mode="single",
+                                    sort_by=[],
+                                    style_table={"overflowX": "auto"},
+                                    style_cell={"fontFamily": "monospace"},
+                                )
+                            ],
+                            className="app-widget app-output",
+                        ),
+                        Ul(
+                            [
+                                Li(
+                                    [
+                                        Link(
+                                            "Back to index...",
+                                            href="/",
+                                            className="app-link",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                                Li(
+                                    [
+                                        A(
+                                            "Permalink",
+                                            href=urllib.parse.urljoin(
+                                                str(SERVER_URL), APP_PATH
+                                            ),
+                                            target="_blank",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                                Li(
+                                    [
+                                        A(
+                                            "colour-science.org",
+                                            href="https://www.colour-science.org",
+                                            target="_blank",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                            ],
+                            className="list-inline text-center",
+                        ),
+                    ],
+                ),
+            ],
+            className="col-8",
+        ),
+        Div(className="col-2"),
+    ],
+    className="row",
+)
+"""
+App layout, i.e., :class:`Div` class instance.
+
+LAYOUT : Div
+"""
+
+HOOKS_RELOAD_CATALOGUE.append(
+    partial(refresh_layout_options, LAYOUT, [_uid("colourspaces")])
+)
+
+
+@APP.callback(
+    Output(_uid("colourspaces"), "options"),
+    [
+        Input(_uid("colourspaces"), "search_value"),
+        Input(_uid("colourspaces"), "value"),
+    ],
+)
+def set_colourspaces_options(
+    search_value: str | None, colourspaces: List[str]
+) -> List[Dict]:
+    """
+    Set the *RGB* colourspaces options matching the search value using the
+    server-side search index.
+
+    Parameters
+    ----------
+    search_value
+        *RGB* colourspaces search value.
+    colourspaces
+        Selected *RGB* colourspaces.
+
+    Returns
+    -------
+    :class:`list`
+        *RGB* colourspace options.
+    """
+
+    return options_RGB_colourspace(search_value, colourspaces)
+
+
+@APP.callback(
+    [
+        Output(_uid("coverage-output"), "data"),
+        Output(_uid("coverage-output"), "page_count"),
+    ],
+    [
+        Input(_uid("colourspaces"), "value"),
+        Input(_uid("chromaticity-diagram"), "value"),
+        Input(_uid("coverage-output"), "page_current"),
+        Input(_uid("coverage-output"), "sort_by"),
+    ],
+)
+def set_coverage_output(
+    colourspaces: List[str] | None,
+    chromaticity_diagram: str,
+    page_current: int | None,
+    sort_by: List[Dict] | None,
+) -> tuple:
+    """
+    Set the current page of the gamut coverage of all the pairs of given *RGB*
+    colourspaces into the output :class:`DataTable` class instance.
+
+    The pairs are sorted and paginated server-side so that only the current
+    page is sent to the browser, whatever the number of *RGB* colourspaces.
+
+    Parameters
+    ----------
+    colourspaces
+        *RGB* colourspaces to compare, every *RGB* colourspace is compared if
+        empty.
+    chromaticity_diagram
+        *Chromaticity Diagram*, e.g., *CIE 1931* or *CIE 1976 UCS*.
+    page_current
+        Current page.
+    sort_by
+        :class:`DataTable` class instance sorting.
+
+    Returns
+    -------
+    :class:`tuple`
+        Current page rows and page count.
+    """
+
+    pairs = coverage_pairs(colourspaces or [], chromaticity_diagram, sort_by)
+
+    count = len(pairs["overlap"])
+    start = (page_current or 0) * PAGE_SIZE
+    page = {key: column[start : start + PAGE_SIZE] for key, column in pairs.items()}
+
+    rows = [
+        {
+            key: value if isinstance(value, str) else float(value)
+            for key, value in zip(page, values, strict=True)
+        }
+        for values in zip(*page.values(), strict=True)
+    ]
+
+    return rows, max(-(-count // PAGE_SIZE), 1)
+
+
+@SERVER.route(f"{APP_PATH}/coverage")
+def coverage() -> Response:
+    """
+    Return the gamut coverage and overlap matrices of the *RGB* colourspaces
+    and the *Chromaticity Diagram* given in the URL query, every *RGB*
+    colourspace is compared if none is given.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Gamut coverage and overlap matrices.
+    """
+
+    chromaticity_diagram = request.args.get(
+        "chromaticity-diagram", STATE_DEFAULT["chromaticity_diagram"]
+    )
+    if chromaticity_diagram not in [
+        option["value"] for option in OPTIONS_CHROMATICITY_DIAGRAM
+    ]:
+        abort(400, f'"{chromaticity_diagram}" chromaticity diagram is not supported!')
+
+    try:
+        colourspaces = [
+            canonical_RGB_colourspace(colourspace)
+            for colourspace in request.args.getlist("colourspaces")
+        ]
+    except ValueError as error:
+        abort(400, str(error))
+
+    colourspaces, areas, coverage_, overlap = gamut_coverage(
+        colourspaces, chromaticity_diagram
+    )
+
+    def to_list(a: NDArrayFloat) -> list:
+        """Convert given array to a *JSON* serialisable list."""
+
+        return np.where(np.isfinite(a), a, None).tolist()
+
+    return jsonify(
+        {
+            "colourspaces": colourspaces,
+            "chromaticity_diagram": chromaticity_diagram,
+            "areas": to_list(areas),
+            "coverage": to_list(coverage_),
+            "overlap": to_list(overlap),
+        }
+    )
+
+
+@APP.callback(
+    [
+        Output(_uid("colourspaces"), "value"),
+        Output(_uid("chromaticity-diagram"), "value"),
+    ],
+    [
+        Input(_uid("url"), "href"),
+    ],
+    [
+        State(_uid("colourspaces"), "value"),
+        State(_uid("chromaticity-diagram"), "value"),
+    ],
+)
+def update_state_on_url_query_change(
+    href: str, *state: List[str] | str | None
+) -> tuple:
+    """
+    Update the App state on URL query change.
+
+    Only the state values that differ from the current App state are updated
+    so that unchanged widgets do not trigger their dependent callbacks, the
+    update is prevented altogether if the URL query matches the App state.
+
+    Parameters
+    ----------
+    href
+        URL.
+
+    Other Parameters
+    ----------------
+    state
+        Current App state.
+
+    Returns
+    -------
+    :class:`tuple`
+        App state.
+    """
+
+    parse_result = urlparse(href)
+
+    query = parse_qs(parse_result.query)
+
+    try:
+        colourspaces = [
+            canonical_RGB_colourspace(colourspace)
+            for colourspace in query.get("colourspaces", STATE_DEFAULT["colourspaces"])
+        ]
+    except ValueError:
+        raise PreventUpdate from None
+
+    values = (
+        colourspaces,
+        query.get(
+            "chromaticity-diagram", [STATE_DEFAULT["chromaticity_diagram"]]
+        )[0],
+    )
+
+    if values == state:
+        raise PreventUpdate
+
+    return tuple(
+        no_update if value == current else value
+        for value, current in zip(values, state, strict=True)
+    )
+
+
+@APP.callback(
+    Output(_uid("url"), "search"),
+    [
+        Input(_uid("colourspaces"), "value"),
+        Input(_uid("chromaticity-diagram"), "value"),
+    ],
+    [State(_uid("url"), "search")],
+)
+def update_url_query_on_state_change(
+    colourspaces: List[str] | None,
+    chromaticity_diagram: str,
+    search: str | None = None,
+) -> str:
+    """
+    Update the URL query on App state change.
+
+    Parameters
+    ----------
+    colourspaces
+        *RGB* colourspaces to compare.
+    chromaticity_diagram
+        *Chromaticity Diagram*, e.g., *CIE 1931* or *CIE 1976 UCS*.
+
+    Other Parameters
+    ----------------
+    search
+        Current URL query, the update is prevented if it is unchanged.
+
+    Returns
+    -------
+    :class:`str`
+        Url query.
+    """
+
+    query = urlencode(
+        {
+            "colourspaces": colourspaces or [],
+            "chromaticity-diagram": chromaticity_diagram,
+        },
+        doseq=True,
+    )
+
+    if f"?{query}" == search:
+        raise PreventUpdate
+
+    return f"?{query}"
@@ -0,0 +1,762 @@
+"""
+RGB Colourspaces Transfer Functions Application
+===============================================
+"""
+
+from __future__ import annotations
+
+import typing
+import urllib.parse
+from functools import lru_cache, partial
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import numpy as np
+from colour.utilities import suppress_warnings
+from dash import Patch, ctx, no_update
+from dash.dcc import Dropdown, Graph, Link, Location, Markdown
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+from dash.html import H3, H5, A, Div, Li, Ul
+
+if typing.TYPE_CHECKING:
+    from colour.hints import ArrayLike, Dict, List, Mapping, NDArrayFloat, Tuple
+
+from app import APP, SERVER_URL
+from apps.common import (
+    HOOKS_RELOAD_CATALOGUE,
+    RGB_colourspace,
+    canonical_RGB_colourspace,
+    label_RGB_colourspace,
+    options_RGB_colourspace,
+    refresh_layout_options,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "APP_NAME",
+    "APP_PATH",
+    "APP_DESCRIPTION",
+    "APP_UID",
+    "OPTIONS_CCTF",
+    "OPTIONS_SCALE",
+    "DOMAINS_SCALE",
+    "SAMPLES_CURVE",
+    "SAMPLES_TRACE",
+    "CACHE_SIZE_CURVE",
+    "STATE_DEFAULT",
+    "curve",
+    "decimate",
+    "visible_range",
+    "figure_template",
+    "curve_traces",
+    "LAYOUT",
+    "set_colourspaces_options",
+    "set_transfer_functions_output",
+    "update_state_on_url_query_change",
+    "update_url_query_on_state_change",
+]
+
+APP_NAME: str = "RGB Colourspaces Transfer Functions"
+"""
+App name.
+"""
+
+APP_PATH: str = f"/apps/{__name__.split('.')[-1]}"
+"""
+App path, i.e., app url.
+"""
+
+APP_DESCRIPTION: str = (
+    "This app plots the encoding and decoding colour component transfer "
+    "functions, i.e., the *OETF*, *EOTF* and their inverses, of the given "
+    "*RGB Colourspaces* on linear or logarithmic axes."
+)
+"""
+App description.
+"""
+
+APP_UID: int = hash(APP_NAME)
+"""
+App unique id.
+"""
+
+OPTIONS_CCTF: List[Dict] = [
+    {"label": "Encoding CCTF - OETF / Inverse EOTF", "value": "Encoding"},
+    {"label": "Decoding CCTF - EOTF / Inverse OETF", "value": "Decoding"},
+]
+"""
+Colour component transfer function options for a :class:`Dropdown` class
+instance.
+"""
+
+OPTIONS_SCALE: List[Dict] = [
+    {"label": "Linear", "value": "Linear"},
+    {"label": "Log", "value": "Log"},
+]
+"""
+Axes scale options for a :class:`Dropdown` class instance.
+"""
+
+DOMAINS_SCALE: Dict[str, Tuple[float, float]] = {
+    "Linear": (0, 1),
+    "Log": (1e-4, 1),
+}
+"""
+Domains of the curves evaluated on a dense grid per axes scale, the curves are
+evaluated on demand outside of them.
+"""
+
+SAMPLES_CURVE: int = 8193
+"""
+Number of samples of the dense grid the curves are evaluated on.
+"""
+
+SAMPLES_TRACE: int = 512
+"""
+Maximum number of samples of the decimated traces sent to the browser.
+"""
+
+CACHE_SIZE_CURVE: int = 256
+"""
+Number of curves cached by each process.
+"""
+
+_RANGE_DECADES: Tuple[int, int] = (-307, 308)
+"""
+Range of the logarithmic axes decades whose powers of ten are positive normal
+*float64* values.
+"""
+
+
+def _is_cctf_scale(cctf: str | None, scale: str | None) -> bool:
+    """
+    Return whether given colour component transfer function and axes scale are
+    supported.
+    """
+
+    return any(option["value"] == cctf for option in OPTIONS_CCTF) and any(
+        option["value"] == scale for option in OPTIONS_SCALE
+    )
+
+
+def _uid(id_: str) -> str:
+    """
+    Generate a unique id for given id by appending the application *UID*.
+    """
+
+    return f"{id_}-{APP_UID}"
+
+
+STATE_DEFAULT = {
+    "colourspaces": ["sRGB", "ITU-R BT.709", "S-Gamut3"],
+    "cctf": OPTIONS_CCTF[0]["value"],
+    "scale": OPTIONS_SCALE[0]["value"],
+}
+"""
+Default App state.
+"""
+
+
+def _grid(start: float, end: float, samples: int, scale: str) -> NDArrayFloat:
+    """
+    Return a grid of given number of samples between given values, spaced
+    evenly on given axes scale.
+    """
+
+    if scale == "Log":
+        return np.geomspace(start, end, samples)
+
+    return np.linspace(start, end, samples)
+
+
+def _evaluate_cctf(colourspace: str, cctf: str, x: ArrayLike) -> NDArrayFloat:
+    """
+    Evaluate the given colour component transfer function of given *RGB*
+    colourspace at given values, the undefined values are set to *NaN*.
+    """
+
+    definition = RGB_colourspace(colourspace)
+    function = (
+        definition.cctf_encoding if cctf == "Encoding" else definition.cctf_decoding
+    )
+
+    with suppress_warnings(), np.errstate(all="ignore"):
+        y = np.asarray(function(np.asarray(x, dtype=np.float64)), dtype=np.float64)
+
+    return np.where(np.isfinite(y), y, np.nan)
+
+
+@lru_cache(maxsize=CACHE_SIZE_CURVE)
+def curve(colourspace: str, cctf: str, scale: str) -> Tuple[NDArrayFloat, NDArrayFloat]:
+    """
+    Return the given colour component transfer function of given *RGB*
+    colourspace evaluated once on the dense grid of given axes scale.
+
+    Parameters
+    ----------
+    colourspace
+        *RGB* colourspace name.
+    cctf
+        Colour component transfer function, e.g., *Encoding* or *Decoding*.
+    scale
+        Axes scale, e.g., *Linear* or *Log*.
+
+    Returns
+    -------
+    :class:`tuple`
+        Read-only grid and curve values.
+    """
+
+    x = _grid(*DOMAINS_SCALE[scale], SAMPLES_CURVE, scale)
+    y = _evaluate_cctf(colourspace, cctf, x)
+
+    x.flags.writeable = False
+    y.flags.writeable = False
+
+    return x, y
+
+
+# The curves are keyed by the *RGB* colourspace names.
+HOOKS_RELOAD_CATALOGUE.append(curve.cache_clear)
+
+
+def decimate(
+    x: ArrayLike, y: ArrayLike, samples: int = SAMPLES_TRACE
+) -> Tuple[NDArrayFloat, NDArrayFloat]:
+    """
+    Decimate given curve to given number of samples by keeping the minimum and
+    maximum of each bucket of consecutive samples, along with the end samples,
+    so that the shape of the curve is preserved.
+
+    Parameters
+    ----------
+    x
+        Curve abscissae, sorted.
+    y
+        Curve values.
+    samples
+        Maximum number of samples of the decimated curve.
+
+    Returns
+    -------
+    :class:`tuple`
+        Decimated curve abscissae and values.
+    """
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+
+    count = x.shape[0]
+    if count <= samples:
+        return x, y
+
+    buckets = (samples - 2) // 2
+    size = -(-count // buckets)
+
+    indexes = np.minimum(np.arange(buckets * size), count - 1).reshape(buckets, size)
+    values = y[indexes]
+    is_nan = np.isnan(values)
+    rows = np.arange(buckets)
+
+    indexes = np.unique(
+        np.concatenate(
+            [
+                [0, count - 1],
+                indexes[rows, np.where(is_nan, np.inf, values).argmin(axis=1)],
+                indexes[rows, np.where(is_nan, -np.inf, values).argmax(axis=1)],
+            ]
+        )
+    )
+
+    return x[indexes], y[indexes]
+
+
+def visible_range(
+    relayout_data: Mapping | None, scale: str
+) -> Tuple[float, float] | None:
+    """
+    Return the visible abscissae range from given graph relayout data.
+
+    Parameters
+    ----------
+    relayout_data
+        Graph relayout data.
+    scale
+        Axes scale, e.g., *Linear* or *Log*.
+
+    Returns
+    -------
+    :class:`tuple` or :py:data:`None`
+        Visible abscissae range or *None* if the graph is not zoomed or if the
+        relayout data range is not valid.
+    """
+
+    relayout_data = relayout_data or {}
+
+    try:
+        if "xaxis.range[0]" in relayout_data and "xaxis.range[1]" in relayout_data:
+            start = relayout_data["xaxis.range[0]"]
+            end = relayout_data["xaxis.range[1]"]
+        elif "xaxis.range" in relayout_data:
+            start, end = relayout_data["xaxis.range"]
+        else:
+            return None
+
+        start, end = sorted([float(start), float(end)])
+    except (TypeError, ValueError):
+        return None
+
+    if not (np.isfinite(start) and np.isfinite(end)):
+        return None
+
+    # Logarithmic axes ranges are expressed in decades, they are sent by the
+    # client and are clamped so that their powers of ten are finite and
+    # non-zero.
+    if scale == "Log":
+        start, end = (
+            10.0 ** min(max(value, _RANGE_DECADES[0]), _RANGE_DECADES[1])
+            for value in (start, end)
+        )
+
+    return start, end
+
+
+@lru_cache(maxsize=len(OPTIONS_CCTF) * len(OPTIONS_SCALE))
+def figure_template(cctf: str, scale: str) -> Dict:
+    """
+    Return the serialised figure template, i.e., the axes, of given colour
+    component transfer function and axes scale.
+
+    Parameters
+    ----------
+    cctf
+        Colour component transfer function, e.g., *Encoding* or *Decoding*.
+    scale
+        Axes scale, e.g., *Linear* or *Log*.
+
+    Returns
+    -------
+    :class:`dict`
+        Serialised figure template.
+
+    Raises
+    ------
+    ValueError
+        If the colour component transfer function or the axes scale is not
+        supported.
+    """
+
+    if not _is_cctf_scale(cctf, scale):
+        error = f'"{cctf}" transfer function or "{scale}" axes scale is not supported!'
+
+        raise ValueError(error)
+
+    x_label, y_label = (
+        ("Linear Value", "Non-Linear Value")
+        if cctf == "Encoding"
+        else ("Non-Linear Value", "Linear Value")
+    )
+
+    axis_type = "log" if scale == "Log" else "linear"
+
+    return {
+        "data": [],
+        "layout": {
+            "xaxis": {"title": {"text": x_label}, "type": axis_type},
+            "yaxis": {"title": {"text": y_label}, "type": axis_type},
+            "legend": {"x": 0, "xanchor": "left", "y": 1},
+            "margin": {"l": 40, "r": 20, "t": 20, "b": 40},
+            "height": 640,
+            "uirevision": f"{cctf} - {scale}",
+        },
+    }
+
+
+def curve_traces(
+    colourspaces: List[str],
+    cctf: str,
+    scale: str,
+    x_range: Tuple[float, float] | None = None,
+) -> List[Dict]:
+    """
+    Return the decimated *scattergl* traces of the given colour component
+    transfer function of given *RGB* colourspaces.
+
+    The traces are decimated from the dense curves in the visible range, the
+    curves are evaluated in the visible range directly if it is not covered
+    by enough samples of the dense grid, e.g., when zooming in deeply.
+
+    Parameters
+    ----------
+    colourspaces
+        *RGB* colourspaces to return the traces of.
+    cctf
+        Colour component transfer function, e.g., *Encoding* or *Decoding*.
+    scale
+        Axes scale, e.g., *Linear* or *Log*.
+    x_range
+        Visible abscissae range, the whole domain if *None*.
+
+    Returns
+    -------
+    :class:`list`
+        Curve traces.
+    """
+
+    traces = []
+    for colourspace in colourspaces:
+        x, y = curve(colourspace, cctf, scale)
+
+        if x_range is not None:
+            start, end = x_range
+            if scale == "Log":
+                start = max(start, np.finfo(np.float64).tiny)
+
+            i = max(int(np.searchsorted(x, start)) - 1, 0)
+            j = min(int(np.searchsorted(x, end, "right")) + 1, x.shape[0])
+
+            if start < x[0] or end > x[-1] or j - i < SAMPLES_TRACE:
+                x = _grid(start, end, SAMPLES_TRACE, scale)
+                y = _evaluate_cctf(colourspace, cctf, x)
+            else:
+                x, y = x[i:j], y[i:j]
+
+        x, y = decimate(x, y, SAMPLES_TRACE)
+
+        traces.append(
+            {
+                "type": "scattergl",
+                "mode": "lines",
+                "name": label_RGB_colourspace(colourspace),
+                "x": x.tolist(),
+                "y": np.where(np.isnan(y), None, y).tolist(),
+                "hovertemplate": "%{x}, %{y}",
+                "line": {"width": 1.5},
+            }
+        )
+
+    return traces
+
+
+LAYOUT: Div = Div(
+    [
+        Div(className="col-2"),
+        Div(
+            [
+                Location(id=_uid("url"), refresh=False),
+                H3([Link(APP_NAME, href=APP_PATH)], className="text-center"),
+                Div(
+                    [
+                        Markdown(APP_DESCRIPTION),
+                        H5(children="Colourspaces"),
+                        Dropdown(
+                            id=_uid("colourspaces"),
+                            options=options_RGB_colourspace(
+                                value=STATE_DEFAULT["colourspaces"]
+                            ),
+                            value=STATE_DEFAULT["colourspaces"],
+                            multi=True,
+                            className="app-widget",
+                        ),
+                        H5(children="Transfer Function"),
+                        Dropdown(
+                            id=_uid("cctf"),
+                            options=OPTIONS_CCTF,
+                            value=STATE_DEFAULT["cctf"],
+                            clearable=False,
+                            className="app-widget",
+                        ),
+                        H5(children="Scale"),
+                        Dropdown(
+                            id=_uid("scale"),
+                            options=OPTIONS_SCALE,
+                            value=STATE_DEFAULT["scale"],
+                            clearable=False,
+                            className="app-widget",
+                        ),
+                        Graph(
+                            id=_uid("transfer-functions-output"),
+                            config={"displaylogo": False},
+                            className="app-widget app-output",
+                        ),
+                        Ul(
+                            [
+                                Li(
+                                    [
+                                        Link(
+                                            "Back to index...",
+                                            href="/",
+                                            className="app-link",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                                Li(
+                                    [
+                                        A(
+                                            "Permalink",
+                                            href=urllib.parse.urljoin(
+                                                str(SERVER_URL), APP_PATH
+                                            ),
+                                            target="_blank",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                                Li(
+                                    [
+                                        A(
+                                            "colour-science.org",
+                                            href="https://www.colour-science.org",
+                                            target="_blank",
+                                        )
+                                    ],
+                                    className="list-inline-item",
+                                ),
+                            ],
+                            className="list-inline text-center",
+                        ),
+                    ],
+                ),
+            ],
+            className="col-8",
+        ),
+        Div(className="col-2"),
+    ],
+    className="row",
+)
+"""
+App layout, i.e., :class:`Div` class instance.
+
+LAYOUT : Div
+"""
+
+HOOKS_RELOAD_CATALOGUE.append(
+    partial(refresh_layout_options, LAYOUT, [_uid("colourspaces")])
+)
+
+
+@APP.callback(
+    Output(_uid("colourspaces"), "options"),
+    [
+        Input(_uid("colourspaces"), "search_value"),
+        Input(_uid("colourspaces"), "value"),
+    ],
+)
+def set_colourspaces_options(
+    search_value: str | None, colourspaces: List[str]
+) -> List[Dict]:
+    """
+    Set the *RGB* colourspaces options matching the search value using the
+    server-side search index.
+
+    Parameters
+    ----------
+    search_value
+        *RGB* colourspaces search value.
+    colourspaces
+        Selected *RGB* colourspaces.
+
+    Returns
+    -------
+    :class:`list`
+        *RGB* colourspace options.
+    """
+
+    return options_RGB_colourspace(search_value, colourspaces)
+
+
+@APP.callback(
+    Output(
+        component_id=_uid("transfer-functions-output"),
+        component_property="figure",
+    ),
+    [
+        Input(_uid("colourspaces"), "value"),
+        Input(_uid("cctf"), "value"),
+        Input(_uid("scale"), "value"),
+        Input(_uid("transfer-functions-output"), "relayoutData"),
+    ],
+)
+def set_transfer_functions_output(
+    colourspaces: List[str] | None,
+    cctf: str,
+    scale: str,
+    relayout_data: Dict | None,
+) -> Dict | Patch:
+    """
+    Plot the given colour component transfer function of given *RGB*
+    colourspaces into the output :class:`Graph` class instance.
+
+    The figure template is only sent when the transfer function or the axes
+    scale change, any other interaction, e.g., zooming, patches the curve
+    traces only, decimated for the visible range.
+
+    Parameters
+    ----------
+    colourspaces
+        *RGB* colourspaces to plot the transfer function of.
+    cctf
+        Colour component transfer function, e.g., *Encoding* or *Decoding*.
+    scale
+        Axes scale, e.g., *Linear* or *Log*.
+    relayout_data
+        Graph relayout data, i.e., the visible range.
+
+    Returns
+    -------
+    :class:`dict` or :class:`Patch`
+        Figure or figure patch.
+    """
+
+    if not _is_cctf_scale(cctf, scale):
+        raise PreventUpdate
+
+    triggered = set(ctx.triggered_prop_ids.values())
+
+    if not triggered or triggered & {_uid("cctf"), _uid("scale")}:
+        return {
+            **figure_template(cctf, scale),
+            "data": curve_traces(colourspaces or [], cctf, scale),
+        }
+
+    x_range = visible_range(relayout_data, scale)
+
+    # The relayout events that neither zoom nor reset the zoom, e.g., the
+    # initial autosize, do not change the traces.
+    if (
+        triggered == {_uid("transfer-functions-output")}
+        and x_range is None
+        and "xaxis.autorange" not in (relayout_data or {})
+    ):
+        raise PreventUpdate
+
+    figure = Patch()
+    figure["data"] = curve_traces(colourspaces or [], cctf, scale, x_range)
+
+    return figure
+
+
+@APP.callback(
+    [
+        Output(_uid("colourspaces"), "value"),
+        Output(_uid("cctf"), "value"),
+        Output(_uid("scale"), "value"),
+    ],
+    [
+        Input(_uid("url"), "href"),
+    ],
+    [
+        State(_uid("colourspaces"), "value"),
+        State(_uid("cctf"), "value"),
+        State(_uid("scale"), "value"),
+    ],
+)
+def update_state_on_url_query_change(
+    href: str, *state: List[str] | str | None
+) -> tuple:
+    """
+    Update the App state on URL query change.
+
+    Only the state values that differ from the current App state are updated
+    so that unchanged widgets do not trigger their dependent callbacks, the
+    update is prevented altogether if the URL query matches the App state.
+
+    Parameters
+    ----------
+    href
+        URL.
+
+    Other Parameters
+    ----------------
+    state
+        Current App state.
+
+    Returns
+    -------
+    :class:`tuple`
+        App state.
+    """
+
+    parse_result = urlparse(href)
+
+    query = parse_qs(parse_result.query)
+
+    try:
+        colourspaces = [
+            canonical_RGB_colourspace(colourspace)
+            for colourspace in query.get("colourspaces", STATE_DEFAULT["colourspaces"])
+        ]
+    except ValueError:
+        raise PreventUpdate from None
+
+    cctf = query.get("cctf", [STATE_DEFAULT["cctf"]])[0]
+    scale = query.get("scale", [STATE_DEFAULT["scale"]])[0]
+
+    if not _is_cctf_scale(cctf, scale):
+        raise PreventUpdate
+
+    values = (colourspaces, cctf, scale)
+
+    if values == state:
+        raise PreventUpdate
+
+    return tuple(
+        no_update if value == current else value
+        for value, current in zip(values, state, strict=True)
+    )
+
+
+@APP.callback(
+    Output(_uid("url"), "search"),
+    [
+        Input(_uid("colourspaces"), "value"),
+        Input(_uid("cctf"), "value"),
+        Input(_uid("scale"), "value"),
+    ],
+    [State(_uid("url"), "search")],
+)
+def update_url_query_on_state_change(
+    colourspaces: List[str] | None,
+    cctf: str,
+    scale: str,
+    search: str | None = None,
+) -> str:
+    """
+    Update the URL query on App state change.
+
+    Parameters
+    ----------
+    colourspaces
+        *RGB* colourspaces to plot the transfer function of.
+    cctf
+        Colour component transfer function, e.g., *Encoding* or *Decoding*.
+    scale
+        Axes scale, e.g., *Linear* or *Log*.
+
+    Other Parameters
+    ----------------
+    search
+        Current URL query, the update is prevented if it is unchanged.
+
+    Returns
+    -------
+    :class:`str`
+        Url query.
+    """
+
+    query = urlencode(
+        {"colourspaces": colourspaces or [], "cctf": cctf, "scale": scale},
+        doseq=True,
+    )
+
+    if f"?{query}" == search:
+        raise PreventUpdate
+
+    return f"?{query}"
@@ -0,0 +1,155 @@
+"""
+Define the unit tests for the :mod:`apps.analytics` module.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+import pytest
+
+import index
+from apps.analytics import Analytics, SketchSpaceSaving
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestSketchSpaceSaving",
+    "TestAnalytics",
+    "TestAnalyticsEndpoint",
+]
+
+
+class TestSketchSpaceSaving:
+    """
+    Define :class:`apps.analytics.SketchSpaceSaving` class unit tests methods.
+    """
+
+    def test_add(self) -> None:
+        """
+        Test :meth:`apps.analytics.SketchSpaceSaving.add` method.
+        """
+
+        sketch = SketchSpaceSaving(3)
+
+        for key in "aaaabbbcc":
+            sketch.add(key)
+
+        # "c" has the minimum count and is replaced, its count being kept as
+        # the maximum overestimation of "d".
+        sketch.add("d")
+
+        assert sketch.top() == [("a", 4, 0), ("b", 3, 0), ("d", 3, 2)]
+
+        # The heap entry of "b" is outdated once "b" is incremented, it must be
+        # refreshed so that "d" is replaced.
+        sketch.add("b")
+        sketch.add("e")
+
+        assert sketch.top() == [("a", 4, 0), ("b", 4, 0), ("e", 4, 3)]
+        assert sketch.total == 12
+
+    def test_merge(self) -> None:
+        """
+        Test :meth:`apps.analytics.SketchSpaceSaving.merge` method and that
+        the merged sketch keeps replacing the key with the minimum count.
+        """
+
+        sketch_a, sketch_b = SketchSpaceSaving(2), SketchSpaceSaving(2)
+
+        for key in "aaab":
+            sketch_a.add(key)
+
+        for key in "ccd":
+            sketch_b.add(key)
+
+        sketch_a.merge(sketch_b)
+
+        assert sketch_a.top() == [("a", 4, 1), ("c", 3, 1)]
+
+        sketch_a.add("e")
+
+        assert sketch_a.top() == [("a", 4, 1), ("e", 4, 3)]
+
+        sketch = SketchSpaceSaving.from_dict(sketch_a.to_dict())
+        sketch.add("a")
+        sketch.add("f")
+
+        assert sketch.top() == [("a", 5, 1), ("f", 5, 4)]
+
+
+class TestAnalytics:
+    """
+    Define :class:`apps.analytics.Analytics` class unit tests methods.
+    """
+
+    def test_save(self, tmp_path: os.PathLike, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test :meth:`apps.analytics.Analytics.save` method and that the sketches
+        of the process are kept when the analytics file cannot be written.
+        """
+
+        path = os.path.join(tmp_path, "analytics.json")
+        analytics = Analytics(path, 4, 3600)
+
+        for state in ({"a": 1}, {"a": 1}, {"b": 2}):
+            analytics.record("app", state)
+
+        def mkstemp(*args: object, **kwargs: object) -> None:  # noqa: ARG001
+            """Fail to create the temporary analytics file."""
+
+            raise OSError
+
+        with monkeypatch.context() as context:
+            context.setattr(tempfile, "mkstemp", mkstemp)
+
+            assert not analytics.save()
+
+        assert not os.path.exists(path)
+        assert analytics.sketches()["app"].top() == [
+            ('{"a":1}', 2, 0),
+            ('{"b":2}', 1, 0),
+        ]
+
+        analytics.record("app", {"b": 2})
+
+        assert analytics.save()
+        # The keys with equal counts are not ordered.
+        assert sorted(Analytics(path, 4).sketches()["app"].top()) == [
+            ('{"a":1}', 2, 0),
+            ('{"b":2}', 2, 0),
+        ]
+
+
+class TestAnalyticsEndpoint:
+    """
+    Define the *index.analytics* endpoint unit tests methods.
+    """
+
+    def test_analytics(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that the *index.analytics* endpoint requires the administration
+        token.
+        """
+
+        client = index.SERVER.test_client()
+
+        monkeypatch.setattr(index, "ADMIN_TOKEN", None)
+
+        assert client.get("/analytics").status_code == 404
+
+        monkeypatch.setattr(index, "ADMIN_TOKEN", "token")
+
+        assert client.get("/analytics").status_code == 401
+        assert (
+            client.get(
+                "/analytics?top=1", headers={"Authorization": "Bearer token"}
+            ).status_code
+            == 200
+        )
@@ -0,0 +1,81 @@
+"""
+Define the unit tests for the :mod:`apps.batch` module.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from apps.batch import run_batch
+from apps.common import format_matrix_RGB_to_RGB
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestRunBatch",
+]
+
+
+class TestRunBatch:
+    """
+    Define :func:`apps.batch.run_batch` definition unit tests methods.
+    """
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_run_batch(self, workers: int) -> None:
+        """
+        Test that :func:`apps.batch.run_batch` definition writes one output
+        record per input record in the input order, the invalid records being
+        written as error records.
+        """
+
+        lines = [
+            json.dumps({"input-colourspace": "sRGB", "decimals": decimals})
+            for decimals in range(1, 12)
+        ]
+        lines[2] = "{"
+        lines[5] = "[]"
+        lines[8] = json.dumps({"input-colourspace": "Undefined"})
+
+        output_file = io.StringIO()
+        run_batch(
+            "matrix_RGB_to_RGB",
+            io.StringIO("".join(f"{line}\n" for line in lines)),
+            output_file,
+            workers,
+            2,
+        )
+
+        records = [json.loads(line) for line in output_file.getvalue().splitlines()]
+
+        assert len(records) == len(lines)
+
+        for i, record in enumerate(records):
+            if i in (2, 5, 8):
+                assert list(record) == ["error"]
+                continue
+
+            state = record["state"]
+
+            assert state["input_colourspace"] == "sRGB"
+            assert state["decimals"] == i + 1
+            assert record["output"] == format_matrix_RGB_to_RGB(*state.values())
+
+        assert records[5] == {"error": "Record is not a JSON object!"}
+        assert "Undefined" in records[8]["error"]
+
+    def test_raise_exception_run_batch(self) -> None:
+        """
+        Test :func:`apps.batch.run_batch` definition raised exception.
+        """
+
+        with pytest.raises(ValueError):
+            run_batch("undefined", io.StringIO(), io.StringIO())
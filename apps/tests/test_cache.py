@@ -0,0 +1,459 @@
+"""
+Define the unit tests for the :mod:`apps.cache` module.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from apps import cache
+from apps.cache import (
+    CacheFilesystem,
+    CacheRedis,
+    CacheSharedMemory,
+    SingleFlight,
+    _cache_key,
+)
+from apps.common import (
+    OPTIONS_RGB_COLOURSPACE,
+    compute_gamuts_intersection_areas,
+    format_chromatically_adapted_primaries,
+    format_matrices_RGB_to_RGB_comparison,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestCacheFilesystem",
+    "FakeRedis",
+    "TestCacheRedis",
+    "TestCacheSharedMemory",
+    "TestSingleFlight",
+    "TestCached",
+]
+
+
+class TestCacheFilesystem:
+    """
+    Define :class:`apps.cache.CacheFilesystem` class unit tests methods.
+    """
+
+    def test_get_set(self, tmp_path: os.PathLike) -> None:
+        """
+        Test :meth:`apps.cache.CacheFilesystem.get` and
+        :meth:`apps.cache.CacheFilesystem.set` methods.
+        """
+
+        cache_filesystem = CacheFilesystem(str(tmp_path))
+
+        assert cache_filesystem.get("a") is None
+
+        cache_filesystem.set("a", b"\x00\r\n")
+
+        assert cache_filesystem.get("a") == b"\x00\r\n"
+
+    def test_evict(self, tmp_path: os.PathLike) -> None:
+        """
+        Test :meth:`apps.cache.CacheFilesystem.evict` method.
+        """
+
+        cache_filesystem = CacheFilesystem(str(tmp_path), maxbytes=3000)
+
+        for i, key in enumerate("abc"):
+            cache_filesystem.set(key, bytes(1000))
+            # The values are written in the past as the modification time
+            # resolution of some filesystems is coarse.
+            mtime = time.time() - 30 + i * 10
+            os.utime(cache_filesystem._path(key), (mtime, mtime))  # noqa: SLF001
+
+        # Reading "a" makes "b" then "c" the least recently used values.
+        assert cache_filesystem.get("a") is not None
+
+        cache_filesystem.set("d", bytes(1000))
+
+        assert cache_filesystem.get("b") is None
+        assert cache_filesystem.get("c") is None
+        assert cache_filesystem.get("a") is not None
+        assert cache_filesystem.get("d") is not None
+
+
+class FakeRedis:
+    """
+    Define a fake socket connected to an in-memory *Redis* server speaking
+    the *Redis* serialisation protocol (RESP).
+
+    Parameters
+    ----------
+    store
+        Values of the server.
+    commands
+        Commands received by the server.
+    """
+
+    def __init__(self, store: dict, commands: list) -> None:
+        self._store = store
+        self._commands = commands
+        self._replies = bytearray()
+
+    def setsockopt(self, *args: int) -> None:
+        """Ignore given socket option."""
+
+    def makefile(self, mode: str) -> FakeRedis:  # noqa: ARG002
+        """Return the socket file, i.e., the fake socket itself."""
+
+        return self
+
+    def close(self) -> None:
+        """Close the socket."""
+
+    def readline(self) -> bytes:
+        """Read a line of the replies."""
+
+        index = self._replies.index(b"\r\n") + 2
+        line = bytes(self._replies[:index])
+        del self._replies[:index]
+
+        return line
+
+    def read(self, length: int) -> bytes:
+        """Read given number of bytes of the replies."""
+
+        data = bytes(self._replies[:length])
+        del self._replies[:length]
+
+        return data
+
+    def sendall(self, data: bytes) -> None:
+        """Parse given command and write its reply."""
+
+        position = data.index(b"\r\n")
+        count = int(data[1:position])
+        position += 2
+
+        arguments = []
+        for _ in range(count):
+            end = data.index(b"\r\n", position)
+            length = int(data[position + 1 : end])
+            arguments.append(data[end + 2 : end + 2 + length])
+            position = end + 2 + length + 2
+
+        self._commands.append(arguments)
+
+        command = arguments[0].upper()
+        if command == b"GET":
+            value = self._store.get(arguments[1])
+            self._replies += (
+                b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+            )
+        elif command in (b"SET", b"SELECT"):
+            if command == b"SET":
+                self._store[arguments[1]] = arguments[2]
+
+            self._replies += b"+OK\r\n"
+        else:
+            self._replies += b"-ERR unknown command\r\n"
+
+
+class TestCacheRedis:
+    """
+    Define :class:`apps.cache.CacheRedis` class unit tests methods.
+    """
+
+    @pytest.fixture
+    def server(self, monkeypatch: pytest.MonkeyPatch) -> tuple:
+        """
+        Connect the :class:`apps.cache.CacheRedis` class instances to a fake
+        in-memory server and return its values and received commands.
+        """
+
+        store: dict = {}
+        commands: list = []
+
+        monkeypatch.setattr(
+            cache.socket,
+            "create_connection",
+            lambda *_args: FakeRedis(store, commands),
+        )
+
+        return store, commands
+
+    def test_get_set(self, server: tuple) -> None:
+        """
+        Test :meth:`apps.cache.CacheRedis.get` and
+        :meth:`apps.cache.CacheRedis.set` methods.
+        """
+
+        store, commands = server
+
+        cache_redis = CacheRedis(database=2, ttl=60)
+
+        assert cache_redis.get("a") is None
+
+        cache_redis.set("a", b"\x00\r\n$-1\r\n")
+
+        assert cache_redis.get("a") == b"\x00\r\n$-1\r\n"
+        assert store == {b"colour-dash:a": b"\x00\r\n$-1\r\n"}
+        assert commands == [
+            [b"SELECT", b"2"],
+            [b"GET", b"colour-dash:a"],
+            [b"SET", b"colour-dash:a", b"\x00\r\n$-1\r\n", b"EX", b"60"],
+            [b"GET", b"colour-dash:a"],
+        ]
+
+    def test_connection_error(
+        self, server: tuple, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that :class:`apps.cache.CacheRedis` class connection and server
+        errors are cache misses and that it reconnects afterwards.
+        """
+
+        store, commands = server
+
+        create_connection = cache.socket.create_connection
+
+        def refuse(*_args: object) -> None:
+            """Refuse the connection."""
+
+            raise ConnectionRefusedError
+
+        monkeypatch.setattr(cache.socket, "create_connection", refuse)
+
+        cache_redis = CacheRedis()
+        cache_redis.set("a", b"a")
+
+        assert cache_redis.get("a") is None
+
+        monkeypatch.setattr(cache.socket, "create_connection", create_connection)
+
+        cache_redis.set("a", b"a")
+
+        assert cache_redis.get("a") == b"a"
+        assert cache_redis._command("UNKNOWN") is None  # noqa: SLF001
+        assert cache_redis.get("a") == b"a"
+
+
+class TestCacheSharedMemory:
+    """
+    Define :class:`apps.cache.CacheSharedMemory` class unit tests methods.
+    """
+
+    def test_get_set(self) -> None:
+        """
+        Test :meth:`apps.cache.CacheSharedMemory.get` and
+        :meth:`apps.cache.CacheSharedMemory.set` methods.
+        """
+
+        cache = CacheSharedMemory(size_classes=((16, 256), (4, 4096)))
+
+        assert cache.get("a") is None
+
+        cache.set("a", b"small")
+        cache.set("b", b"b" * 1024)
+
+        assert cache.get("a") == b"small"
+        assert cache.get("b") == b"b" * 1024
+        assert cache.skipped == 0
+
+    def test_skipped(self) -> None:
+        """
+        Test :attr:`apps.cache.CacheSharedMemory.skipped` property.
+        """
+
+        cache = CacheSharedMemory(size_classes=((16, 256), (4, 4096)))
+
+        cache.set("a", b"a" * 4096)
+        cache.set("b", b"b" * 8192)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.skipped == 2
+        assert cache.statistics()["skipped"] == 2
+
+    def test_shared(self, tmp_path: os.PathLike) -> None:
+        """
+        Test that the values are shared by the instances mapping a same file
+        and that the values of the largest size class are cached.
+        """
+
+        path = os.path.join(tmp_path, "colour-dash.cache")
+        CacheSharedMemory.create(path, ((16, 256), (4, 262144)))
+
+        writer = CacheSharedMemory(path)
+        reader = CacheSharedMemory(path)
+
+        value = os.urandom(200000)
+        writer.set("a", value)
+
+        assert reader.get("a") == value
+        assert reader.statistics()["size_classes"] == [
+            {"slots": 16, "slot_size": 256},
+            {"slots": 4, "slot_size": 262144},
+        ]
+
+
+class TestSingleFlight:
+    """
+    Define :class:`apps.cache.SingleFlight` class unit tests methods.
+    """
+
+    def test_threads(self, tmp_path: os.PathLike) -> None:
+        """
+        Test that the threads computing keys hashed onto a same byte-range
+        lock are serialised.
+        """
+
+        single_flight = SingleFlight(os.path.join(tmp_path, "colour-dash.lock"), 1)
+
+        lock = threading.Lock()
+        active = []
+        concurrency = []
+
+        def compute() -> bytes:
+            with lock:
+                active.append(None)
+                concurrency.append(len(active))
+
+            time.sleep(0.05)
+
+            with lock:
+                active.pop()
+
+            return b"value"
+
+        threads = [
+            threading.Thread(
+                target=single_flight.run, args=(key, compute, lambda: None)
+            )
+            for key in "abcd"
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(concurrency) == 1
+
+    def test_nested(self, tmp_path: os.PathLike) -> None:
+        """
+        Test that a nested computation whose key is hashed onto the
+        byte-range lock held by the thread runs without releasing it.
+        """
+
+        single_flight = SingleFlight(os.path.join(tmp_path, "colour-dash.lock"), 1)
+
+        nested = threading.Event()
+        times = {}
+
+        def compute_outer() -> bytes:
+            value = single_flight.run("b", lambda: b"b", lambda: None)
+            nested.set()
+            time.sleep(0.05)
+            times["outer"] = time.monotonic()
+
+            return b"a" + value
+
+        def compute_other() -> bytes:
+            times["other"] = time.monotonic()
+
+            return b"c"
+
+        def run_other() -> None:
+            nested.wait()
+            single_flight.run("c", compute_other, lambda: None)
+
+        thread = threading.Thread(target=run_other)
+        thread.start()
+
+        assert single_flight.run("a", compute_outer, lambda: None) == b"ab"
+
+        thread.join()
+
+        assert times["other"] >= times["outer"]
+
+
+class TestCached:
+    """
+    Define :func:`apps.cache.cached_output` and :func:`apps.cache.cached_array`
+    definitions unit tests methods with the default
+    :class:`apps.cache.CacheSharedMemory` class size classes.
+    """
+
+    @pytest.fixture
+    def cache_shared_memory(self, monkeypatch: pytest.MonkeyPatch) -> CacheSharedMemory:
+        """Set the cache to an anonymous shared memory cache."""
+
+        cache_shared_memory = CacheSharedMemory()
+        monkeypatch.setattr(cache, "CACHE", cache_shared_memory)
+
+        return cache_shared_memory
+
+    def test_CCT_sweep(self, cache_shared_memory: CacheSharedMemory) -> None:
+        """
+        Test that the largest correlated colour temperature sweep output is
+        cached.
+        """
+
+        args = (
+            "ITU-R BT.2020",
+            "cct:1000:25000:24,0.05",
+            "CIE 1931 2 Degree Standard Observer",
+            "Bradford",
+            "repr",
+            15,
+        )
+        output = format_chromatically_adapted_primaries(*args)
+
+        assert cache_shared_memory.get(
+            _cache_key("format_chromatically_adapted_primaries", args)
+        ) == output.encode("utf-8")
+        assert format_chromatically_adapted_primaries(*args) == output
+        assert cache_shared_memory.skipped == 0
+
+    def test_matrices_comparison(self, cache_shared_memory: CacheSharedMemory) -> None:
+        """
+        Test that the chromatic adaptation transforms comparison output is
+        cached.
+        """
+
+        args = ("ITU-R BT.2020", "ACEScg", "Bradford", 15)
+        output = format_matrices_RGB_to_RGB_comparison(*args)
+
+        assert cache_shared_memory.get(
+            _cache_key("format_matrices_RGB_to_RGB_comparison", args)
+        ) == output.encode("utf-8")
+        assert format_matrices_RGB_to_RGB_comparison(*args) == output
+        assert cache_shared_memory.skipped == 0
+
+    def test_gamuts_intersection_areas(
+        self, cache_shared_memory: CacheSharedMemory
+    ) -> None:
+        """
+        Test that the gamuts intersection areas of every *RGB* colourspace are
+        cached.
+        """
+
+        args = (
+            "CIE 1931",
+            *[option["value"] for option in OPTIONS_RGB_COLOURSPACE],
+        )
+        areas = compute_gamuts_intersection_areas(*args)
+
+        assert (
+            cache_shared_memory.get(
+                _cache_key("gamuts_intersection_areas_triangle", args)
+            )
+            is not None
+        )
+        np.testing.assert_array_equal(compute_gamuts_intersection_areas(*args), areas)
+        assert cache_shared_memory.skipped == 0
@@ -0,0 +1,313 @@
+"""
+Define the unit tests for the *URL* and App state callbacks of the apps.
+"""
+
+from __future__ import annotations
+
+import typing
+from collections import Counter
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import pytest
+
+import index  # noqa: F401
+from app import APP, SERVER
+from apps import (
+    rgb_colourspace_chromatically_adapted_primaries,
+    rgb_colourspace_transformation_matrix,
+    rgb_colourspaces_chromaticity_diagram,
+)
+
+if typing.TYPE_CHECKING:
+    from types import ModuleType
+
+    from colour.hints import Any, Dict, List, Set, Tuple
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "Renderer",
+    "TestUrlStateCallbacks",
+]
+
+
+class Renderer:
+    """
+    Model the dispatch of the server callbacks of given App by the *Dash*
+    renderer: the callbacks having a changed property as input are called
+    through the */_dash-update-component* endpoint and the properties they
+    return trigger the next callbacks, the *dcc.Location* component updates
+    its *href* property when its *search* property is set.
+
+    Parameters
+    ----------
+    module
+        App module.
+
+    Attributes
+    ----------
+    -   :attr:`~apps.tests.test_callbacks.Renderer.calls`
+    -   :attr:`~apps.tests.test_callbacks.Renderer.prevented`
+    -   :attr:`~apps.tests.test_callbacks.Renderer.properties`
+
+    Methods
+    -------
+    -   :meth:`~apps.tests.test_callbacks.Renderer.__init__`
+    -   :meth:`~apps.tests.test_callbacks.Renderer.load`
+    -   :meth:`~apps.tests.test_callbacks.Renderer.dispatch`
+    """
+
+    def __init__(self, module: ModuleType) -> None:
+        self._client = SERVER.test_client()
+        self._url = module._uid("url")  # noqa: SLF001
+        self._base = f"http://localhost{module.APP_PATH}"
+
+        self._callbacks = {
+            output: callback
+            for output, callback in APP.callback_map.items()
+            if "callback" in callback
+            and all(
+                identifier.endswith(f"-{module.APP_UID}")
+                for identifier, _property in self._outputs(output)
+            )
+        }
+
+        properties = {
+            (item["id"], item["property"])
+            for callback in self._callbacks.values()
+            for item in callback["inputs"] + callback["state"]
+        }
+        components = {
+            component.id: component
+            for component in module.LAYOUT._traverse()  # noqa: SLF001
+            if getattr(component, "id", None) is not None
+        }
+        self.properties: Dict[str, Any] = {
+            f"{identifier}.{property_}": getattr(
+                components[identifier], property_, None
+            )
+            for identifier, property_ in properties
+            if identifier in components
+        }
+        """Current component properties."""
+
+        self.calls: Counter = Counter()
+        """Number of calls of each callback."""
+
+        self.prevented: Counter = Counter()
+        """Number of calls of each callback whose update was prevented."""
+
+    @staticmethod
+    def _outputs(output: str) -> List[Tuple[str, str]]:
+        """Split given callback output into its component properties."""
+
+        outputs = output[2:-2].split("...") if output.startswith("..") else [output]
+
+        return [tuple(output.rsplit(".", 1)) for output in outputs]  # pyright: ignore
+
+    def _set(self, properties: Dict[str, Any]) -> Set[str]:
+        """Set given component properties and return the changed ones."""
+
+        changed = set(properties)
+        self.properties.update(properties)
+
+        search = properties.get(f"{self._url}.search")
+        if search is not None and f"{self._url}.href" not in properties:
+            href = f"{self._base}{search}"
+            if self.properties.get(f"{self._url}.href") != href:
+                self.properties[f"{self._url}.href"] = href
+                changed.add(f"{self._url}.href")
+
+        return changed
+
+    def _call(self, output: str, changed: Set[str]) -> Dict[str, Any]:
+        """Call given callback and return the component properties it sets."""
+
+        callback = self._callbacks[output]
+        name = callback["callback"].__wrapped__.__name__
+        self.calls[name] += 1
+
+        outputs = [
+            {"id": identifier, "property": property_}
+            for identifier, property_ in self._outputs(output)
+        ]
+        inputs, state = (
+            [
+                {
+                    **item,
+                    "value": self.properties.get(f"{item['id']}.{item['property']}"),
+                }
+                for item in callback[key]
+            ]
+            for key in ("inputs", "state")
+        )
+        response = self._client.post(
+            "/_dash-update-component",
+            json={
+                "output": output,
+                "outputs": outputs if output.startswith("..") else outputs[0],
+                "inputs": inputs,
+                "state": state,
+                "changedPropIds": [
+                    f"{item['id']}.{item['property']}"
+                    for item in inputs
+                    if f"{item['id']}.{item['property']}" in changed
+                ],
+            },
+        )
+
+        if response.status_code == 204:
+            self.prevented[name] += 1
+
+            return {}
+
+        assert response.status_code == 200, response.get_data(as_text=True)
+
+        return {
+            f"{identifier}.{property_}": value
+            for identifier, values in response.get_json()["response"].items()
+            for property_, value in values.items()
+        }
+
+    def load(self) -> None:
+        """Load the App without *URL* query and call all its callbacks."""
+
+        self._set({f"{self._url}.href": self._base, f"{self._url}.search": ""})
+        self._propagate(set(self.properties), list(self._callbacks))
+
+        self.calls.clear()
+        self.prevented.clear()
+
+    def dispatch(self, properties: Dict[str, Any]) -> None:
+        """Set given component properties and call the triggered callbacks."""
+
+        self._propagate(self._set(properties))
+
+    def _propagate(self, changed: Set[str], triggered: List[str] | None = None) -> None:
+        """Call the callbacks triggered by the changed properties."""
+
+        while changed:
+            if triggered is None:
+                triggered = [
+                    output
+                    for output, callback in self._callbacks.items()
+                    if any(
+                        f"{item['id']}.{item['property']}" in changed
+                        for item in callback["inputs"]
+                    )
+                ]
+
+            properties = {}
+            for output in triggered:
+                properties.update(self._call(output, changed))
+
+            changed = self._set(properties) if properties else set()
+            triggered = None
+
+
+class TestUrlStateCallbacks:
+    """
+    Define the *URL* and App state callbacks unit tests methods.
+    """
+
+    @pytest.mark.parametrize(
+        ("module", "identifier", "value"),
+        [
+            (rgb_colourspace_transformation_matrix, "input-colourspace", "ACEScg"),
+            (
+                rgb_colourspace_chromatically_adapted_primaries,
+                "colourspace",
+                "ACEScg",
+            ),
+            (
+                rgb_colourspaces_chromaticity_diagram,
+                "chromaticity-diagram",
+                "CIE 1976 UCS",
+            ),
+        ],
+    )
+    def test_user_state_change(
+        self, module: ModuleType, identifier: str, value: Any
+    ) -> None:
+        """
+        Test that an App state change by the user calls its dependent
+        callbacks once and stops the *URL* round-trip after one call.
+        """
+
+        renderer = Renderer(module)
+        renderer.load()
+
+        widget = f"{module._uid(identifier)}.value"  # noqa: SLF001
+        renderer.dispatch({widget: value})
+
+        dependents = {
+            callback["callback"].__wrapped__.__name__
+            for callback in renderer._callbacks.values()  # noqa: SLF001
+            if widget
+            in [f"{item['id']}.{item['property']}" for item in callback["inputs"]]
+        }
+
+        assert renderer.calls == Counter(
+            dict.fromkeys(dependents, 1) | {"update_state_on_url_query_change": 1}
+        )
+        assert renderer.prevented["update_state_on_url_query_change"] == 1
+        assert "update_url_query_on_state_change" in dependents
+
+    @pytest.mark.parametrize(
+        ("module", "identifier", "value"),
+        [
+            (rgb_colourspace_transformation_matrix, "input-colourspace", "ACEScg"),
+            (
+                rgb_colourspace_chromatically_adapted_primaries,
+                "colourspace",
+                "ACEScg",
+            ),
+            (
+                rgb_colourspaces_chromaticity_diagram,
+                "chromaticity-diagram",
+                "CIE 1976 UCS",
+            ),
+        ],
+    )
+    def test_url_state_change(
+        self, module: ModuleType, identifier: str, value: Any
+    ) -> None:
+        """
+        Test that an App state change by the *URL* query, e.g., a permanent
+        link or the browser history, only updates the changed widget and calls
+        its dependent callbacks once.
+        """
+
+        renderer = Renderer(module)
+        renderer.load()
+
+        url = module._uid("url")  # noqa: SLF001
+        query = parse_qs(urlparse(renderer.properties[f"{url}.href"]).query)
+        query[identifier] = [value]
+        search = f"?{urlencode(query, doseq=True)}"
+
+        renderer.dispatch(
+            {
+                f"{url}.href": f"http://localhost{module.APP_PATH}{search}",
+                f"{url}.search": search,
+            }
+        )
+
+        widget = f"{module._uid(identifier)}.value"  # noqa: SLF001
+        dependents = {
+            callback["callback"].__wrapped__.__name__
+            for callback in renderer._callbacks.values()  # noqa: SLF001
+            if widget
+            in [f"{item['id']}.{item['property']}" for item in callback["inputs"]]
+        }
+
+        assert renderer.properties[widget] == value
+        assert renderer.calls == Counter(
+            dict.fromkeys(dependents, 1) | {"update_state_on_url_query_change": 1}
+        )
+        assert renderer.prevented["update_url_query_on_state_change"] == 1
@@ -0,0 +1,425 @@
+"""
+Define the unit tests for the :mod:`apps.common` module.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+from colour import read_LUT
+
+import index  # noqa: F401
+from apps import rgb_colourspace_chromatically_adapted_primaries
+from apps.common import (
+    SCHEMA_STATE_CHROMATICALLY_ADAPTED_PRIMARIES,
+    SCHEMA_STATE_MATRIX_RGB_TO_RGB,
+    STATE_DEFAULT_CHROMATICALLY_ADAPTED_PRIMARIES,
+    STATE_DEFAULT_MATRIX_RGB_TO_RGB,
+    LUT3D_table_RGB_to_RGB,
+    SearchIndex,
+    canonical_custom_RGB_colourspace,
+    canonical_state,
+    format_array,
+    intersection_area_triangles,
+    format_LUT3D_table,
+    reload_catalogue,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestReloadCatalogue",
+    "TestCanonicalCustomRGBColourspace",
+    "TestCanonicalState",
+    "TestSearchIndex",
+    "TestIntersectionAreaTriangles",
+    "TestFormatArray",
+    "TestFormatLUT3DTable",
+]
+
+
+class TestReloadCatalogue:
+    """
+    Define :func:`apps.common.reload_catalogue` definition unit tests methods.
+    """
+
+    def test_hooks(self, tmp_path: os.PathLike) -> None:
+        """
+        Test that the :attr:`apps.common.HOOKS_RELOAD_CATALOGUE` attribute
+        hooks clear the caches keyed by names and regenerate the options of
+        the app layouts.
+        """
+
+        path = os.path.join(tmp_path, "catalogue.json")
+        with open(path, "w") as catalogue_file:
+            json.dump(
+                {"illuminants": {"Stage LED": {"cie_2_1931": [0.3457, 0.3585]}}},
+                catalogue_file,
+            )
+
+        module = rgb_colourspace_chromatically_adapted_primaries
+        dropdown = module.LAYOUT[module._uid("illuminant")]  # noqa: SLF001
+
+        LUT3D_table_RGB_to_RGB("sRGB", "ACEScg", "Bradford", 3)
+
+        try:
+            assert reload_catalogue(path) == ["Stage LED"]
+            assert LUT3D_table_RGB_to_RGB.cache_info().currsize == 0
+            assert "Stage LED" in [option["value"] for option in dropdown.options]
+        finally:
+            reload_catalogue()
+
+        assert "Stage LED" not in [option["value"] for option in dropdown.options]
+
+
+class TestCanonicalCustomRGBColourspace:
+    """
+    Define :func:`apps.common.canonical_custom_RGB_colourspace` definition
+    unit tests methods.
+    """
+
+    def test_canonical_custom_RGB_colourspace(self) -> None:
+        """
+        Test that :func:`apps.common.canonical_custom_RGB_colourspace`
+        definition quantises the equivalent definitions to the same canonical
+        definition and thus to the same cache keys.
+        """
+
+        canonical = "custom:0.64,0.33,0.3,0.6,0.15,0.06,0.3127,0.329"
+
+        for definition in [
+            "CUSTOM: 0.640, 0.330; 0.300 0.600,0.150,0.060,0.3127,0.3290",
+            "Custom:0.6400000001,0.33,0.3,0.6,0.15,0.06,0.31270000004,0.329",
+        ]:
+            assert canonical_custom_RGB_colourspace(definition) == canonical
+
+            state = canonical_state(
+                {"input_colourspace": definition},
+                SCHEMA_STATE_MATRIX_RGB_TO_RGB,
+                STATE_DEFAULT_MATRIX_RGB_TO_RGB,
+            )
+
+            assert state["input_colourspace"] == canonical
+
+        assert (
+            canonical_custom_RGB_colourspace("0.64 0.33 0.3 0.6 0.15 0.06 0.3127 0.329")
+            == canonical
+        )
+        assert (
+            canonical_custom_RGB_colourspace(
+                "custom:0.64,0.33,0.3,0.6,0.15,-0.000000001,0.3127,0.329"
+            )
+            == "custom:0.64,0.33,0.3,0.6,0.15,0,0.3127,0.329"
+        )
+        assert (
+            canonical_custom_RGB_colourspace(
+                "custom:0.64000001,0.33,0.3,0.6,0.15,0.06,0.3127,0.329"
+            )
+            == "custom:0.64000001,0.33,0.3,0.6,0.15,0.06,0.3127,0.329"
+        )
+
+    @pytest.mark.parametrize(
+        "definition",
+        [
+            "custom:0.64,0.33,0.3,0.6,0.15,0.06,0.3127",
+            "custom:0.64,0.33,0.3,0.6,0.15,0.06,0.3127,0",
+            "custom:0.64,0.33,0.3,0.6,0.15,0.06,0.3127,nan",
+            "custom:0.64,0.33,0.64,0.33,0.64,0.33,0.3127,0.329",
+        ],
+    )
+    def test_raise_exception_canonical_custom_RGB_colourspace(
+        self, definition: str
+    ) -> None:
+        """
+        Test :func:`apps.common.canonical_custom_RGB_colourspace` definition
+        raised exception.
+        """
+
+        with pytest.raises(ValueError):
+            canonical_custom_RGB_colourspace(definition)
+
+
+class TestCanonicalState:
+    """
+    Define :func:`apps.common.canonical_state` definition unit tests methods.
+    """
+
+    def test_canonical_state(self) -> None:
+        """
+        Test that :func:`apps.common.canonical_state` definition resolves the
+        aliases, the key and value cases and the decimals of the states.
+        """
+
+        state = canonical_state(
+            {
+                "Decimals": ["42"],
+                "formatter": "Repr",
+                "CHROMATIC-ADAPTATION-TRANSFORM": "bradford",
+                "output_colourspace": "aces cg",
+                "Input-Colourspace": ["srgb"],
+                "unknown": "value",
+            },
+            SCHEMA_STATE_MATRIX_RGB_TO_RGB,
+            STATE_DEFAULT_MATRIX_RGB_TO_RGB,
+        )
+
+        assert list(state.items()) == [
+            ("input_colourspace", "sRGB"),
+            ("output_colourspace", "ACEScg"),
+            ("chromatic_adaptation_transform", "Bradford"),
+            ("formatter", "repr"),
+            ("decimals", 15),
+        ]
+
+        state = canonical_state(
+            {"illuminant": "d65", "observer": "cie_2_1931", "decimals": -3},
+            SCHEMA_STATE_CHROMATICALLY_ADAPTED_PRIMARIES,
+            STATE_DEFAULT_CHROMATICALLY_ADAPTED_PRIMARIES,
+        )
+
+        assert state == {
+            **STATE_DEFAULT_CHROMATICALLY_ADAPTED_PRIMARIES,
+            "illuminant": "D65",
+            "observer": "CIE 1931 2 Degree Standard Observer",
+            "decimals": 1,
+        }
+
+    @pytest.mark.parametrize(
+        "state",
+        [
+            {"decimals": "ten"},
+            {"input-colourspace": "Undefined"},
+            {"formatter": "Undefined"},
+        ],
+    )
+    def test_raise_exception_canonical_state(self, state: dict) -> None:
+        """
+        Test :func:`apps.common.canonical_state` definition raised exception.
+        """
+
+        with pytest.raises(ValueError):
+            canonical_state(
+                state, SCHEMA_STATE_MATRIX_RGB_TO_RGB, STATE_DEFAULT_MATRIX_RGB_TO_RGB
+            )
+
+
+class TestSearchIndex:
+    """
+    Define :class:`apps.common.SearchIndex` class unit tests methods.
+    """
+
+    def setup_method(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self._index = SearchIndex(
+            {
+                "Alpha": "Alpha",
+                "alpha-x": "Alpha",
+                "Alphabet": "Alphabet",
+                "Beta Alpha": "Beta",
+                "Gamma": "Gamma",
+                "Zeta": "Zeta",
+            },
+            ["Gamma", "Beta", "Alphabet", "Alpha"],
+        )
+
+    def test_search(self) -> None:
+        """
+        Test :meth:`apps.common.SearchIndex.search` method ranking, i.e., the
+        exact matches, then the prefix matches and then the trigram matches
+        by decreasing similarity, the ties being broken by the given order.
+        """
+
+        assert self._index.search(None) == [
+            "Gamma",
+            "Beta",
+            "Alphabet",
+            "Alpha",
+            "Zeta",
+        ]
+        assert self._index.search("ALPHA") == ["Alpha", "Alphabet", "Beta"]
+        assert self._index.search("ALPHA", 2) == ["Alpha", "Alphabet"]
+        assert self._index.search("lpha") == ["Beta", "Alphabet", "Alpha"]
+        assert self._index.search("alpah") == ["Alphabet", "Alpha"]
+        assert self._index.search("zeta") == ["Zeta"]
+        assert self._index.search("xyz") == []
+
+
+def _intersection_area_triangles_scalar(a: list, b: list) -> float:
+    """
+    Compute the area of the intersection of given triangles with a scalar
+    *Sutherland-Hodgman* clipper and the shoelace formula.
+    """
+
+    def area(polygon: list) -> float:
+        """Return the signed area of given polygon."""
+
+        return (
+            sum(
+                x_0 * y_1 - x_1 * y_0
+                for (x_0, y_0), (x_1, y_1) in zip(
+                    polygon, polygon[1:] + polygon[:1], strict=True
+                )
+            )
+            / 2
+        )
+
+    def side(start: tuple, end: tuple, point: tuple) -> float:
+        """Return on which side of given edge the point is."""
+
+        return (end[0] - start[0]) * (point[1] - start[1]) - (end[1] - start[1]) * (
+            point[0] - start[0]
+        )
+
+    if area(b) < 0:
+        b = [b[0], b[2], b[1]]
+
+    polygon = list(a)
+    for start, end in zip(b, b[1:] + b[:1], strict=True):
+        clipped = []
+        for previous, current in zip(polygon[-1:] + polygon[:-1], polygon, strict=True):
+            side_previous = side(start, end, previous)
+            side_current = side(start, end, current)
+
+            if side_previous * side_current < 0:
+                t = side_previous / (side_previous - side_current)
+                clipped.append(
+                    (
+                        previous[0] + t * (current[0] - previous[0]),
+                        previous[1] + t * (current[1] - previous[1]),
+                    )
+                )
+
+            if side_current >= 0:
+                clipped.append(current)
+
+        polygon = clipped
+
+    return abs(area(polygon)) if polygon else 0
+
+
+class TestIntersectionAreaTriangles:
+    """
+    Define :func:`apps.common.intersection_area_triangles` definition unit
+    tests methods.
+    """
+
+    def test_intersection_area_triangles(self) -> None:
+        """
+        Test :func:`apps.common.intersection_area_triangles` definition
+        against a scalar clipper, including the contained, disjoint, shared
+        edge and clockwise triangles.
+        """
+
+        a = np.random.default_rng(4).uniform(size=(256, 2, 3, 2))
+        a[0] = [[[0, 0], [1, 0], [0, 1]], [[0.1, 0.1], [0.5, 0.1], [0.1, 0.5]]]
+        a[1] = [[[0, 0], [1, 0], [0, 1]], [[2, 2], [3, 2], [2, 3]]]
+        a[2] = [[[0, 0], [1, 0], [0, 1]], [[0, 0], [1, 0], [1, 1]]]
+        a[3] = [[[0, 0], [0, 1], [1, 0]], [[1, 1], [0, 1], [1, 0]]]
+
+        np.testing.assert_allclose(
+            intersection_area_triangles(a[:, 0], a[:, 1]),
+            [
+                _intersection_area_triangles_scalar(
+                    [tuple(vertex) for vertex in triangles[0]],
+                    [tuple(vertex) for vertex in triangles[1]],
+                )
+                for triangles in a.tolist()
+            ],
+            atol=1e-12,
+        )
+
+        np.testing.assert_allclose(
+            intersection_area_triangles(a[:4, 0], a[:4, 1]),
+            [0.08, 0, 0.25, 0],
+            atol=1e-12,
+        )
+
+    def test_degenerate_triangles(self) -> None:
+        """
+        Test that :func:`apps.common.intersection_area_triangles` definition
+        returns a zero area for the degenerate triangles.
+        """
+
+        triangle = [[0, 0], [1, 0], [0, 1]]
+
+        np.testing.assert_array_equal(
+            intersection_area_triangles(
+                [triangle, [[0, 0], [1, 1], [2, 2]]],
+                [[[0, 0], [1, 1], [2, 2]], triangle],
+            ),
+            [0, 0],
+        )
+
+
+class TestFormatArray:
+    """
+    Define :func:`apps.common.format_array` definition unit tests methods.
+    """
+
+    @pytest.mark.parametrize("shape", [(3,), (12,), (1, 3), (3, 3), (2, 9), (3, 3, 3)])
+    @pytest.mark.parametrize("decimals", [0, 4, 10])
+    def test_format_array(self, shape: tuple, decimals: int) -> None:
+        """
+        Test that :func:`apps.common.format_array` definition formats the
+        arrays as :func:`str` and :func:`repr` would with the equivalent
+        *NumPy* print options, including the arrays wrapped by *NumPy*.
+        """
+
+        a = np.random.default_rng(4).normal(size=shape) * 10
+
+        with np.printoptions(
+            formatter={"float": f"{{: 0.{decimals}f}}".format},
+            threshold=sys.maxsize,
+        ):
+            assert format_array(a, decimals, "str") == str(a)
+            assert format_array(a, decimals, "repr") == repr(a)
+
+
+class TestFormatLUT3DTable:
+    """
+    Define :func:`apps.common.format_LUT3D_table` definition unit tests
+    methods.
+    """
+
+    @pytest.mark.parametrize(
+        ("method", "extension"), [("cube", ".cube"), ("spi3d", ".spi3d")]
+    )
+    def test_format_LUT3D_table(
+        self, tmp_path: os.PathLike, method: str, extension: str
+    ) -> None:
+        """
+        Test that the *LUTs* formatted by
+        :func:`apps.common.format_LUT3D_table` definition are read back by
+        :func:`colour.read_LUT` definition with the same table, whatever the
+        chunk size.
+        """
+
+        table = LUT3D_table_RGB_to_RGB("sRGB", "ACEScg", "Bradford", 5)
+
+        path = os.path.join(tmp_path, f"LUT{extension}")
+        with open(path, "w") as LUT_file:
+            LUT_file.write("".join(format_LUT3D_table(table, method, "LUT", 10, 7)))
+
+        LUT = read_LUT(path)
+
+        assert LUT.size == 5
+        np.testing.assert_allclose(LUT.table, table, atol=1e-9)
+
+    def test_raise_exception_format_LUT3D_table(self) -> None:
+        """
+        Test :func:`apps.common.format_LUT3D_table` definition raised
+        exception.
+        """
+
+        with pytest.raises(ValueError):
+            list(format_LUT3D_table(np.zeros((2, 2, 2, 3)), "csp"))
@@ -0,0 +1,115 @@
+"""
+Define the unit tests for the :mod:`apps.export` module.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from apps.common import OBSERVERS, compute_chromatically_adapted_primaries
+from apps.export import export_table, table_chromatically_adapted_primaries
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestTableChromaticallyAdaptedPrimaries",
+    "TestExportTable",
+]
+
+
+class TestTableChromaticallyAdaptedPrimaries:
+    """
+    Define :func:`apps.export.table_chromatically_adapted_primaries`
+    definition unit tests methods.
+    """
+
+    @pytest.mark.parametrize(
+        ("illuminant", "observer"),
+        [
+            ("D50", OBSERVERS[0]),
+            ("D50", OBSERVERS[1]),
+            ("D65", OBSERVERS[2]),
+            ("A", OBSERVERS[3]),
+        ],
+    )
+    def test_table_chromatically_adapted_primaries(
+        self, illuminant: str, observer: str
+    ) -> None:
+        """
+        Test :func:`apps.export.table_chromatically_adapted_primaries`
+        definition against the *primaries* computed by the App for every
+        standard observer.
+        """
+
+        axes, table = table_chromatically_adapted_primaries()
+
+        assert axes[2] == list(OBSERVERS)
+
+        index = (
+            axes[0].index("sRGB"),
+            axes[1].index(illuminant),
+            axes[2].index(observer),
+            axes[3].index("Bradford"),
+        )
+
+        np.testing.assert_allclose(
+            table[index],
+            compute_chromatically_adapted_primaries(
+                "sRGB", illuminant, observer, "Bradford"
+            ),
+            atol=1e-12,
+        )
+
+    def test_undefined_illuminant(self) -> None:
+        """
+        Test that the *primaries* of an illuminant undefined for a standard
+        observer are *NaN*.
+        """
+
+        axes, table = table_chromatically_adapted_primaries()
+
+        i = axes[1].index("PLASA ANSI E1.54")
+
+        with pytest.raises(ValueError):
+            compute_chromatically_adapted_primaries(
+                "sRGB", "PLASA ANSI E1.54", OBSERVERS[3], "Bradford"
+            )
+
+        assert np.isnan(table[:, i, 3]).all()
+        assert not np.isnan(table[:, i, 0]).any()
+
+
+class TestExportTable:
+    """
+    Define :func:`apps.export.export_table` definition unit tests methods.
+    """
+
+    def test_export_table(self, tmp_path: os.PathLike) -> None:
+        """
+        Test that :func:`apps.export.export_table` definition omits the
+        undefined values from the *JSON* shards.
+        """
+
+        table = np.arange(8, dtype=np.float64).reshape([1, 2, 2, 2])
+        table[0, 1, 0] = np.nan
+
+        manifest = export_table(
+            str(tmp_path), "table", [["a"], ["b", "c"], ["d", "e"]], "xyz", table
+        )
+
+        with open(os.path.join(tmp_path, manifest["shards"]["a"])) as shard_file:
+            shard = json.load(shard_file)
+
+        assert shard == {
+            "b": {"d": {"values": [0, 1]}, "e": {"values": [2, 3]}},
+            "c": {"e": {"values": [6, 7]}},
+        }
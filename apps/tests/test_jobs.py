@@ -0,0 +1,216 @@
+"""
+Define the unit tests for the :mod:`apps.jobs` module.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+from dash.exceptions import PreventUpdate
+
+import index
+from apps import jobs
+from apps.jobs import JobQueue, JobStore
+from apps.rgb_colourspace_transformation_matrix import set_LUT_job_progress
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "JOB_ID",
+    "TestJobStore",
+    "TestJobQueue",
+    "TestJobsEndpoint",
+    "TestSetLUTJobProgress",
+]
+
+JOB_ID: str = "0123456789abcdef0123"
+"""
+Job id used by the unit tests.
+"""
+
+
+class TestJobStore:
+    """
+    Define :class:`apps.jobs.JobStore` class unit tests methods.
+    """
+
+    def test_create(self, tmp_path: os.PathLike) -> None:
+        """
+        Test :meth:`apps.jobs.JobStore.create` method.
+        """
+
+        store = JobStore(str(tmp_path))
+
+        assert store.create(JOB_ID, "export", {"method": "binary"})
+        assert not store.create(JOB_ID, "export", {"method": "binary"})
+
+        state = store.state(JOB_ID)
+        assert state is not None
+        assert state["status"] == "pending"
+        assert state["pid"] == os.getpid()
+
+        store.update(JOB_ID, status="failed")
+
+        assert store.create(JOB_ID, "export", {"method": "binary"})
+
+    def test_create_stale_pending(self, tmp_path: os.PathLike) -> None:
+        """
+        Test that :meth:`apps.jobs.JobStore.create` method replaces a pending
+        job whose owner process has exited.
+        """
+
+        store = JobStore(str(tmp_path))
+        store.create(JOB_ID, "export", {"method": "binary"})
+
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        store.update(JOB_ID, pid=process.pid)
+
+        state = store.state(JOB_ID)
+        assert state is not None
+        assert state["status"] == "failed"
+
+        assert store.create(JOB_ID, "export", {"method": "binary"})
+        assert store.state(JOB_ID)["pid"] == os.getpid()  # pyright: ignore
+
+    def test_create_stale_running(self, tmp_path: os.PathLike) -> None:
+        """
+        Test that :meth:`apps.jobs.JobStore.create` method replaces a running
+        job whose heartbeat has stopped.
+        """
+
+        store = JobStore(str(tmp_path))
+        store.create(JOB_ID, "export", {"method": "binary"})
+        store.update(JOB_ID, status="running")
+
+        assert not store.create(JOB_ID, "export", {"method": "binary"})
+
+        updated = time.time() - jobs._TIMEOUT_HEARTBEAT - 1  # noqa: SLF001
+        state = store.update(JOB_ID)
+        store._write(JOB_ID, {**state, "updated": updated})  # noqa: SLF001
+
+        assert store.state(JOB_ID)["status"] == "failed"  # pyright: ignore
+        assert store.create(JOB_ID, "export", {"method": "binary"})
+        assert store.state(JOB_ID)["status"] == "pending"  # pyright: ignore
+
+    def test_active(self, tmp_path: os.PathLike) -> None:
+        """
+        Test :meth:`apps.jobs.JobStore.active` method.
+        """
+
+        store = JobStore(str(tmp_path))
+        store.create(JOB_ID, "export", {"method": "binary"})
+        store.create(JOB_ID[::-1], "export", {"method": "json"})
+
+        assert store.active("export") == 2
+        assert store.active("LUT3D") == 0
+
+        store.update(JOB_ID, status="done")
+
+        assert store.active("export") == 1
+
+
+class TestJobQueue:
+    """
+    Define :class:`apps.jobs.JobQueue` class unit tests methods.
+    """
+
+    def test_pending_maximum(self, tmp_path: os.PathLike) -> None:
+        """
+        Test that :meth:`apps.jobs.JobQueue.submit` method rejects a new job
+        once the maximum number of pending jobs of its kind is reached but
+        still reuses an identical job.
+        """
+
+        queue = JobQueue(str(tmp_path), pending_maximum=0)
+
+        with pytest.raises(RuntimeError):
+            queue.submit("export", {"method": "binary"})
+
+        with pytest.raises(ValueError):
+            queue.submit("image", {})
+
+        job_id = queue._job_id("export", {"method": "binary"})  # noqa: SLF001
+        queue.store.create(job_id, "export", {"method": "binary"})
+        queue.store.update(job_id, status="done")
+
+        assert queue.submit("export", {"method": "binary"}) == job_id
+
+
+class TestJobsEndpoint:
+    """
+    Define the *index.submit_job* endpoint unit tests methods.
+    """
+
+    def test_submit_job(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that the *index.submit_job* endpoint requires the administration
+        token.
+        """
+
+        client = index.SERVER.test_client()
+
+        monkeypatch.setattr(index, "ADMIN_TOKEN", None)
+
+        assert client.post("/jobs?kind=export").status_code == 404
+
+        monkeypatch.setattr(index, "ADMIN_TOKEN", "token")
+
+        assert client.post("/jobs?kind=export").status_code == 401
+        assert (
+            client.post(
+                "/jobs?kind=unknown", headers={"Authorization": "Bearer token"}
+            ).status_code
+            == 400
+        )
+
+
+class TestSetLUTJobProgress:
+    """
+    Define :func:`apps.rgb_colourspace_transformation_matrix.\
+set_LUT_job_progress` definition unit tests methods.
+    """
+
+    def test_set_LUT_job_progress(
+        self, tmp_path: os.PathLike, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test :func:`apps.rgb_colourspace_transformation_matrix.\
+set_LUT_job_progress` definition.
+        """
+
+        queue = JobQueue(str(tmp_path))
+        monkeypatch.setattr(jobs, "JOB_QUEUE", queue)
+        monkeypatch.setattr(
+            "apps.rgb_colourspace_transformation_matrix.JOB_QUEUE", queue
+        )
+
+        with pytest.raises(PreventUpdate):
+            set_LUT_job_progress(None, 0)
+
+        job = {"id": JOB_ID, "result": f"/jobs/{JOB_ID}/result"}
+
+        assert set_LUT_job_progress(job, 1)[0] == "The job has expired!"
+
+        queue.store.create(JOB_ID, "LUT3D", {})
+        queue.store.update(JOB_ID, status="running", progress=0.5)
+
+        progress, _href, style, disabled = set_LUT_job_progress(job, 2)
+        assert progress == "Rendering... 50%"
+        assert style == {"display": "none"}
+        assert not disabled
+
+        queue.store.update(JOB_ID, status="done", progress=1)
+
+        assert set_LUT_job_progress(job, 3) == ("Rendered.", job["result"], {}, True)
+
+        assert set_LUT_job_progress({"error": "Busy!"}, 0)[::3] == ("Busy!", True)
@@ -0,0 +1,77 @@
+"""
+Define the unit tests for the :mod:`apps.rgb_colourspace_image_conversion`
+module.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import index  # noqa: F401
+from app import SERVER
+from apps.rgb_colourspace_image_conversion import (
+    APP_PATH,
+    image_pixels,
+    read_image,
+    write_image,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestReadImage",
+    "TestConvertImageEndpoint",
+]
+
+
+class TestReadImage:
+    """
+    Define :func:`apps.rgb_colourspace_image_conversion.read_image` definition
+    unit tests methods.
+    """
+
+    @pytest.mark.parametrize(
+        ("extension", "dtype"),
+        [(".exr", np.float32), (".tiff", np.float32), (".png", np.uint8)],
+    )
+    def test_read_image(self, extension: str, dtype: type) -> None:
+        """
+        Test :func:`apps.rgb_colourspace_image_conversion.read_image`
+        definition and that the number of pixels is checked before decoding.
+        """
+
+        data = write_image(np.zeros((20, 30, 3), dtype), extension)
+
+        assert image_pixels(data, extension) == 600
+        assert read_image(data, extension).shape == (20, 30, 3)
+
+        with pytest.raises(ValueError, match="maximum"):
+            read_image(data, extension, 599)
+
+
+class TestConvertImageEndpoint:
+    """
+    Define the *convert_image_endpoint* endpoint unit tests methods.
+    """
+
+    def test_convert_image_endpoint(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that the *convert_image_endpoint* endpoint rejects the request
+        bodies larger than the maximum content length.
+        """
+
+        client = SERVER.test_client()
+        data = write_image(np.zeros((20, 30, 3), np.float32), ".exr")
+        url = f"{APP_PATH}/convert?output-colourspace=ACEScg"
+
+        assert client.post(url, data=data).status_code == 200
+
+        monkeypatch.setitem(SERVER.config, "MAX_CONTENT_LENGTH", len(data) - 1)
+
+        assert client.post(url, data=data).status_code == 413
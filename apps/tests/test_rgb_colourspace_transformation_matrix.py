@@ -0,0 +1,110 @@
+"""
+Define the unit tests for the :mod:`apps.rgb_colourspace_transformation_matrix`
+module.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+from colour import RGB_COLOURSPACES, matrix_RGB_to_RGB
+
+import index  # noqa: F401
+from app import APP
+from apps.rgb_colourspace_transformation_matrix import set_RGB_converter_matrix
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestSetRGBConverterMatrix",
+    "TestRGBConverter",
+]
+
+
+class TestSetRGBConverterMatrix:
+    """
+    Define :func:`apps.rgb_colourspace_transformation_matrix.\
+set_RGB_converter_matrix` definition unit tests methods.
+    """
+
+    def test_set_RGB_converter_matrix(self) -> None:
+        """
+        Test :func:`apps.rgb_colourspace_transformation_matrix.\
+set_RGB_converter_matrix` definition.
+        """
+
+        np.testing.assert_allclose(
+            set_RGB_converter_matrix("srgb", "acescg", "bradford")["matrix"],
+            matrix_RGB_to_RGB(
+                RGB_COLOURSPACES["sRGB"], RGB_COLOURSPACES["ACEScg"], "Bradford"
+            ),
+            atol=1e-12,
+        )
+
+        np.testing.assert_allclose(
+            set_RGB_converter_matrix("sRGB", "ACEScg", "None")["matrix"],
+            matrix_RGB_to_RGB(
+                RGB_COLOURSPACES["sRGB"], RGB_COLOURSPACES["ACEScg"], None
+            ),
+            atol=1e-12,
+        )
+
+        assert set_RGB_converter_matrix("Undefined", "ACEScg", "Bradford") is None
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js is not available!")
+class TestRGBConverter:
+    """
+    Define the *RGB* converter clientside callback unit tests methods.
+    """
+
+    def test_RGB_converter(self) -> None:
+        """
+        Test that the *RGB* converter clientside callback converts the *RGB*
+        triplet and swatches with the matrix sent by
+        :func:`apps.rgb_colourspace_transformation_matrix.\
+set_RGB_converter_matrix` definition.
+        """
+
+        (script,) = [
+            script
+            for script in APP._inline_scripts  # noqa: SLF001
+            if "converter.matrix" in script
+        ]
+        converter = set_RGB_converter_matrix("sRGB", "ACEScg", "Bradford")
+        arguments = [converter, 0.18, 0.5, 1, "1 0 0\n\n0.2, 0.3; 0.4\nRed", 6]
+
+        output = subprocess.run(  # noqa: S603
+            [shutil.which("node")],
+            input=(
+                f"var window = {{}};\n{script}\n"
+                f"var convert = Object.values("
+                f"window.dash_clientside._dashprivate_clientside_funcs)[0];\n"
+                f"console.log(JSON.stringify(convert(...{json.dumps(arguments)})));"
+            ),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        def format_RGB(RGB: np.ndarray) -> str:
+            """Format given *RGB* triplet as the *RGB* converter."""
+
+            return ", ".join(f"{value:.6f}" for value in RGB)
+
+        M = np.array(converter["matrix"])
+        lines = [
+            f"[{format_RGB(RGB)}] -> [{format_RGB(np.dot(M, RGB))}]"
+            for RGB in np.array([[0.18, 0.5, 1], [1, 0, 0], [0.2, 0.3, 0.4]])
+        ]
+
+        assert json.loads(output).split("\n") == [*lines, "Invalid RGB triplet: Red"]
@@ -0,0 +1,131 @@
+"""
+Define the unit tests for the :mod:`apps.rgb_colourspaces_transfer_functions`
+module.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+import index  # noqa: F401
+from apps.common import reload_catalogue
+from apps.rgb_colourspaces_transfer_functions import (
+    curve,
+    curve_traces,
+    figure_template,
+    visible_range,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestFigureTemplate",
+    "TestCurve",
+    "TestVisibleRange",
+]
+
+
+class TestFigureTemplate:
+    """
+    Define :func:`apps.rgb_colourspaces_transfer_functions.figure_template`
+    definition unit tests methods.
+    """
+
+    def test_figure_template(self) -> None:
+        """
+        Test :func:`apps.rgb_colourspaces_transfer_functions.figure_template`
+        definition.
+        """
+
+        assert figure_template("Decoding", "Log")["layout"]["xaxis"]["type"] == "log"
+
+        with pytest.raises(ValueError):
+            figure_template("Encoding", "Exponential")
+
+        with pytest.raises(ValueError):
+            figure_template("Inverse", "Linear")
+
+        assert figure_template.cache_info().maxsize == 4
+
+
+class TestCurve:
+    """
+    Define :func:`apps.rgb_colourspaces_transfer_functions.curve` definition
+    unit tests methods.
+    """
+
+    def test_reload_catalogue(self, tmp_path: os.PathLike) -> None:
+        """
+        Test that the curves cache is cleared when the catalogue is reloaded.
+        """
+
+        path = os.path.join(tmp_path, "catalogue.json")
+        with open(path, "w") as catalogue_file:
+            json.dump(
+                {"illuminants": {"Stage LED": {"cie_2_1931": [0.3457, 0.3585]}}},
+                catalogue_file,
+            )
+
+        curve("sRGB", "Encoding", "Linear")
+
+        assert curve.cache_info().currsize > 0
+
+        try:
+            reload_catalogue(path)
+
+            assert curve.cache_info().currsize == 0
+        finally:
+            reload_catalogue()
+
+
+class TestVisibleRange:
+    """
+    Define :func:`apps.rgb_colourspaces_transfer_functions.visible_range`
+    definition unit tests methods.
+    """
+
+    def test_visible_range(self) -> None:
+        """
+        Test :func:`apps.rgb_colourspaces_transfer_functions.visible_range`
+        definition.
+        """
+
+        assert visible_range(None, "Log") is None
+        assert visible_range({"xaxis.range": [0, -1]}, "Log") == (0.1, 1)
+        assert visible_range(
+            {"xaxis.range[0]": 0.25, "xaxis.range[1]": 0.5}, "Linear"
+        ) == (0.25, 0.5)
+
+    @pytest.mark.parametrize(
+        "x_range", [[400, 500], [-500, -400], [-1e9, 1e9], [-1e300, 0]]
+    )
+    def test_visible_range_clamped(self, x_range: list) -> None:
+        """
+        Test that :func:`apps.rgb_colourspaces_transfer_functions.visible_range`
+        definition clamps the logarithmic axes decades so that the traces can
+        be computed.
+        """
+
+        start, end = visible_range({"xaxis.range": x_range}, "Log")  # pyright: ignore
+
+        assert 0 < start <= end < float("inf")
+        assert len(curve_traces(["sRGB"], "Encoding", "Log", (start, end))) == 1
+
+    @pytest.mark.parametrize(
+        "x_range", [["a", 1], [None, 1], [float("nan"), 1], [1, "inf"], 1]
+    )
+    def test_visible_range_invalid(self, x_range: object) -> None:
+        """
+        Test that :func:`apps.rgb_colourspaces_transfer_functions.visible_range`
+        definition ignores the invalid relayout data ranges.
+        """
+
+        assert visible_range({"xaxis.range": x_range}, "Log") is None
@@ -0,0 +1,595 @@
+"""
+Tracing
+=======
+
+Defines the optional tracing of the requests as nested spans, e.g., across the
+*Dash* dispatch, the callbacks, the computations and the formatting:
+
+-   :class:`apps.tracing.AbstractExporter`
+-   :class:`apps.tracing.ExporterConsole`
+-   :class:`apps.tracing.ExporterFile`
+-   :class:`apps.tracing.Span`
+-   :class:`apps.tracing.Tracer`
+
+The tracing is enabled with the *COLOUR_DASH_TRACING* environment variable,
+e.g., *console://* or *file:///var/log/colour-dash/traces.jsonl?sampling=0.01*.
+The traces are exported as *OpenTelemetry Protocol* (OTLP) *JSON* lines, the
+format of the *OpenTelemetry Collector* file exporter.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import typing
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from urllib.parse import parse_qs, urlparse
+
+if typing.TYPE_CHECKING:
+    from types import TracebackType
+
+    from colour.hints import Any, Callable, Dict, List
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "SPAN_KIND_INTERNAL",
+    "SPAN_KIND_SERVER",
+    "AbstractExporter",
+    "ExporterConsole",
+    "ExporterFile",
+    "Span",
+    "SPAN_NULL",
+    "Tracer",
+    "tracer_from_url",
+    "TRACING_URL",
+    "TRACER",
+    "span",
+    "traced",
+]
+
+SPAN_KIND_INTERNAL: int = 1
+"""
+*OpenTelemetry* internal span kind.
+"""
+
+SPAN_KIND_SERVER: int = 2
+"""
+*OpenTelemetry* server span kind.
+"""
+
+_PATTERN_TRACEPARENT: re.Pattern = re.compile(
+    r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$"
+)
+"""
+*W3C Trace Context* *traceparent* header pattern.
+"""
+
+_SPAN_CURRENT: ContextVar[Span | None] = ContextVar("span", default=None)
+"""
+Current span of the context.
+"""
+
+
+class AbstractExporter(ABC):
+    """
+    Define the base class for the exporters of the traces.
+
+    Methods
+    -------
+    -   :meth:`~apps.tracing.AbstractExporter.export`
+    """
+
+    @abstractmethod
+    def export(self, line: str) -> None:
+        """
+        Export given trace.
+
+        Parameters
+        ----------
+        line
+            Trace as an *OTLP* *JSON* line.
+        """
+
+
+class ExporterConsole(AbstractExporter):
+    """
+    Define an exporter writing the traces to the standard error.
+
+    Methods
+    -------
+    -   :meth:`~apps.tracing.ExporterConsole.export`
+    """
+
+    def export(self, line: str) -> None:
+        """
+        Export given trace.
+
+        Parameters
+        ----------
+        line
+            Trace as an *OTLP* *JSON* line.
+        """
+
+        sys.stderr.write(f"{line}\n")
+
+
+class ExporterFile(AbstractExporter):
+    """
+    Define an exporter appending the traces to a file, each trace is written
+    at once so that the file can be shared by multiple processes.
+
+    Parameters
+    ----------
+    path
+        Path of the traces file.
+
+    Methods
+    -------
+    -   :meth:`~apps.tracing.ExporterFile.export`
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def export(self, line: str) -> None:
+        """
+        Export given trace.
+
+        Parameters
+        ----------
+        line
+            Trace as an *OTLP* *JSON* line.
+        """
+
+        try:
+            file_descriptor = os.open(
+                self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        except OSError:
+            return
+
+        try:
+            os.write(file_descriptor, f"{line}\n".encode())
+        finally:
+            os.close(file_descriptor)
+
+
+def _attribute(key: str, value: Any) -> Dict:
+    """
+    Return given attribute as an *OTLP* key value.
+    """
+
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class Span:
+    """
+    Define a span, i.e., a timed operation of a trace, used as a context
+    manager, the spans entered within it are its children.
+
+    Parameters
+    ----------
+    tracer
+        Tracer exporting the trace once its root span ends.
+    name
+        Span name.
+    trace_id
+        Trace id.
+    parent
+        Parent span, *None* for a root span.
+    parent_id
+        Parent span id, e.g., of a remote parent span.
+    kind
+        *OpenTelemetry* span kind.
+    attributes
+        Span attributes.
+
+    Attributes
+    ----------
+    -   :attr:`~apps.tracing.Span.trace_id`
+
+    Methods
+    -------
+    -   :meth:`~apps.tracing.Span.set_attribute`
+    """
+
+    __slots__ = (
+        "_attributes",
+        "_end",
+        "_error",
+        "_kind",
+        "_name",
+        "_parent",
+        "_parent_id",
+        "_span_id",
+        "_spans",
+        "_start",
+        "_token",
+        "_trace_id",
+        "_tracer",
+    )
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        name: str,
+        trace_id: str,
+        parent: Span | None = None,
+        parent_id: str = "",
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Dict | None = None,
+    ) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._trace_id = trace_id
+        self._parent = parent
+        self._parent_id = parent._span_id if parent is not None else parent_id
+        self._span_id = f"{random.getrandbits(64):016x}"
+        self._kind = kind
+        self._attributes = attributes or {}
+        self._spans: List[Dict] = parent._spans if parent is not None else []
+        self._start = self._end = 0
+        self._error: BaseException | None = None
+        self._token = None
+
+    @property
+    def trace_id(self) -> str:
+        """
+        Getter property for the trace id.
+
+        Returns
+        -------
+        :class:`str`
+            Trace id.
+        """
+
+        return self._trace_id
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set given attribute of the span.
+
+        Parameters
+        ----------
+        key
+            Attribute key.
+        value
+            Attribute value.
+        """
+
+        self._attributes[key] = value
+
+    def __enter__(self) -> Span:
+        """
+        Start the span and make it the current span.
+        """
+
+        self._token = _SPAN_CURRENT.set(self)
+        self._start = time.time_ns()
+
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        End the span, restore its parent as the current span and export the
+        trace if the span is a root span.
+        """
+
+        self._end = time.time_ns()
+        self._error = exception
+
+        try:
+            _SPAN_CURRENT.reset(self._token)  # pyright: ignore
+        except ValueError:
+            _SPAN_CURRENT.set(self._parent)
+
+        self._spans.append(self._to_dict())
+
+        if self._parent is None:
+            self._tracer.export(self._spans)
+
+    def _to_dict(self) -> Dict:
+        """
+        Return the span as an *OTLP* *JSON* span.
+        """
+
+        span = {
+            "traceId": self._trace_id,
+            "spanId": self._span_id,
+            "parentSpanId": self._parent_id,
+            "name": self._name,
+            "kind": self._kind,
+            "startTimeUnixNano": str(self._start),
+            "endTimeUnixNano": str(self._end),
+            "attributes": [
+                _attribute(key, value) for key, value in self._attributes.items()
+            ],
+            "status": {},
+        }
+
+        if self._error is not None:
+            span["status"] = {"code": 2, "message": str(self._error)}
+
+        return span
+
+
+class _SpanNull:
+    """
+    Define a null span for the operations that are not traced.
+    """
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Discard given attribute."""
+
+    def __enter__(self) -> _SpanNull:
+        """Do nothing."""
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Do nothing."""
+
+
+SPAN_NULL: _SpanNull = _SpanNull()
+"""
+Null span returned for the operations that are not traced.
+"""
+
+
+class Tracer:
+    """
+    Define a tracer starting the spans and exporting the traces.
+
+    The sampling decision is made once per trace when starting its root span,
+    the spans started outside of a sampled trace are null spans so that the
+    overhead of the operations that are not traced is negligible.
+
+    Parameters
+    ----------
+    exporter
+        Exporter of the traces.
+    sampling
+        Sampling rate of the traces in domain [0, 1].
+    service
+        Service name of the traces.
+
+    Methods
+    -------
+    -   :meth:`~apps.tracing.Tracer.span`
+    -   :meth:`~apps.tracing.Tracer.export`
+    """
+
+    def __init__(
+        self,
+        exporter: AbstractExporter,
+        sampling: float = 1,
+        service: str = "colour-dash",
+    ) -> None:
+        self._exporter = exporter
+        self._sampling = sampling
+        self._resource = {"attributes": [_attribute("service.name", service)]}
+        self._lock = threading.Lock()
+
+    def span(
+        self,
+        name: str,
+        root: bool = False,
+        traceparent: str | None = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        **attributes: Any,
+    ) -> Span | _SpanNull:
+        """
+        Return a span with given name, child of the current span.
+
+        Parameters
+        ----------
+        name
+            Span name.
+        root
+            Whether to start a new trace if there is no current span, it is
+            sampled according to the sampling rate, the operations outside of
+            a trace being not traced otherwise.
+        traceparent
+            *W3C Trace Context* *traceparent* header whose sampling decision
+            is honoured when starting a new trace.
+        kind
+            *OpenTelemetry* span kind.
+
+        Other Parameters
+        ----------------
+        attributes
+            Span attributes.
+
+        Returns
+        -------
+        :class:`apps.tracing.Span`
+            Span or null span if the operation is not traced.
+        """
+
+        parent = _SPAN_CURRENT.get()
+
+        if parent is not None:
+            return Span(self, name, parent.trace_id, parent, "", kind, attributes)
+
+        if not root:
+            return SPAN_NULL
+
+        match = _PATTERN_TRACEPARENT.match(traceparent or "")
+        if match is not None:
+            trace_id, parent_id, flags = match.groups()
+
+            if not int(flags, 16) & 1:
+                return SPAN_NULL
+        elif random.random() < self._sampling:  # noqa: S311
+            trace_id, parent_id = f"{random.getrandbits(128):032x}", ""
+        else:
+            return SPAN_NULL
+
+        return Span(self, name, trace_id, None, parent_id, kind, attributes)
+
+    def export(self, spans: List[Dict]) -> None:
+        """
+        Export given spans of a trace.
+
+        Parameters
+        ----------
+        spans
+            *OTLP* *JSON* spans.
+        """
+
+        line = json.dumps(
+            {
+                "resourceSpans": [
+                    {
+                        "resource": self._resource,
+                        "scopeSpans": [
+                            {"scope": {"name": __name__}, "spans": spans}
+                        ],
+                    }
+                ]
+            },
+            separators=(",", ":"),
+        )
+
+        with self._lock:
+            self._exporter.export(line)
+
+
+def tracer_from_url(url: str | None) -> Tracer | None:
+    """
+    Return the tracer for given url.
+
+    Parameters
+    ----------
+    url
+        Tracing url, e.g., *console://* or
+        *file:///var/log/colour-dash/traces.jsonl*, with the sampling rate
+        given in the query, e.g., *console://?sampling=0.01*.
+
+    Returns
+    -------
+    :class:`apps.tracing.Tracer` or :py:data:`None`
+        Tracer or *None* if the tracing is disabled.
+    """
+
+    if not url:
+        return None
+
+    parse_result = urlparse(url)
+    query = {key: value[0] for key, value in parse_qs(parse_result.query).items()}
+    sampling = min(max(float(query.get("sampling", 1)), 0), 1)
+
+    if parse_result.scheme == "console":
+        return Tracer(ExporterConsole(), sampling)
+
+    if parse_result.scheme == "file":
+        return Tracer(ExporterFile(parse_result.path), sampling)
+
+    error = f'"{url}" tracing url is not supported!'
+
+    raise ValueError(error)
+
+
+TRACING_URL: str | None = os.environ.get("COLOUR_DASH_TRACING")
+"""
+Tracing url used to select the exporter and the sampling rate.
+"""
+
+TRACER: Tracer | None = tracer_from_url(TRACING_URL)
+"""
+Tracer of the apps or *None* if the tracing is disabled.
+"""
+
+
+def span(name: str, **attributes: Any) -> Span | _SpanNull:
+    """
+    Return a span with given name, child of the current span, using the
+    :attr:`apps.tracing.TRACER` attribute.
+
+    Parameters
+    ----------
+    name
+        Span name.
+
+    Other Parameters
+    ----------------
+    attributes
+        Span attributes.
+
+    Returns
+    -------
+    :class:`apps.tracing.Span`
+        Span or null span if the operation is not traced.
+    """
+
+    if TRACER is None:
+        return SPAN_NULL
+
+    return TRACER.span(name, **attributes)
+
+
+def traced(name: str | None = None) -> Callable:
+    """
+    Decorate given function so that its calls are traced as spans, the
+    function is returned unchanged if the tracing is disabled.
+
+    Parameters
+    ----------
+    name
+        Span name, the function name is used if *None*.
+
+    Returns
+    -------
+    Callable
+        Decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        """Decorate given function."""
+
+        if TRACER is None:
+            return function
+
+        span_name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Wrap given function."""
+
+            with TRACER.span(span_name):  # pyright: ignore
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,112 @@
+"""
+Gunicorn - Configuration
+========================
+
+Creates the shared memory cache used by the workers and bundles the configured
+stylesheets and scripts from the *gunicorn* master process.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import typing
+from urllib.parse import urlparse
+
+if typing.TYPE_CHECKING:
+    from gunicorn.arbiter import Arbiter
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2018 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "on_starting",
+    "on_exit",
+]
+
+_PATH_CACHE: str | None = None
+"""
+Path of the memory mapped cache file created by the *gunicorn* master
+process.
+"""
+
+
+def _bundle_assets(server: Arbiter) -> None:
+    """
+    Bundle the stylesheets and scripts given by the *COLOUR_DASH_CSS* and
+    *COLOUR_DASH_JS* environment variables so that the workers serve them
+    locally.
+    """
+
+    from apps.assets import ASSETS_BUNDLE, ASSETS_PATH, bundle_assets, split_assets
+
+    urls = split_assets(os.environ.get("COLOUR_DASH_CSS")) + split_assets(
+        os.environ.get("COLOUR_DASH_JS")
+    )
+    if not ASSETS_BUNDLE or not urls:
+        return
+
+    manifest = bundle_assets(urls, ASSETS_PATH)
+    server.log.info(
+        'Bundled %s of %s assets into "%s".',
+        len(set(urls) & manifest.keys()),
+        len(urls),
+        ASSETS_PATH,
+    )
+
+
+def on_starting(server: Arbiter) -> None:
+    """
+    Bundle the configured assets and create the memory mapped cache file
+    before the workers are forked and expose its path through the
+    *COLOUR_DASH_CACHE_PATH* environment variable, unless it is already defined
+    or another cache backend is selected with the *COLOUR_DASH_CACHE*
+    environment variable.
+
+    Parameters
+    ----------
+    server
+        *Gunicorn* arbiter.
+    """
+
+    global _PATH_CACHE
+
+    _bundle_assets(server)
+
+    parse_result = urlparse(os.environ.get("COLOUR_DASH_CACHE", "shared-memory://"))
+    if parse_result.scheme != "shared-memory" or parse_result.path:
+        return
+
+    if "COLOUR_DASH_CACHE_PATH" not in os.environ:
+        directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        file_descriptor, _PATH_CACHE = tempfile.mkstemp(
+            prefix="colour-dash-", suffix=".cache", dir=directory
+        )
+        os.close(file_descriptor)
+
+        os.environ["COLOUR_DASH_CACHE_PATH"] = _PATH_CACHE
+
+    # The cache is created when the module is imported, the workers then
+    # inherit its memory map.
+    from apps.cache import CACHE
+
+    server.log.info('Using "%s" shared cache.', CACHE.path)
+
+
+def on_exit(server: Arbiter) -> None:  # noqa: ARG001
+    """
+    Remove the memory mapped cache file if it was created by the *gunicorn*
+    master process.
+
+    Parameters
+    ----------
+    server
+        *Gunicorn* arbiter.
+    """
+
+    if _PATH_CACHE is not None and os.path.exists(_PATH_CACHE):
+        os.remove(_PATH_CACHE)
@@ -5,18 +5,42 @@ Index
 
 from __future__ import annotations
 
+import hmac
+import json
+import os
+import signal
 import typing
+from contextlib import suppress
 
 if typing.TYPE_CHECKING:
     import dash
+    from colour.hints import Dict, Mapping
 
 from dash.dcc import Link, Location, Markdown
 from dash.dependencies import Input, Output
 from dash.html import H3, A, Div, P
+from flask import Response, abort, jsonify, request, send_file
 
 import apps.rgb_colourspace_chromatically_adapted_primaries as app_2
+import apps.rgb_colourspace_image_conversion as app_4
 import apps.rgb_colourspace_transformation_matrix as app_1
-from app import APP, SERVER  # noqa: F401
+import apps.rgb_colourspaces_chromaticity_diagram as app_3
+import apps.rgb_colourspaces_gamut_coverage as app_6
+import apps.rgb_colourspaces_transfer_functions as app_5
+from app import APP, SERVER
+from apps.analytics import ANALYTICS
+from apps.assets import ASSETS_URL_PATH, serve_asset
+from apps.cache import CACHE
+from apps.common import (
+    CATALOGUE_PATH,
+    canonical_decimals,
+    catalogue_state,
+    refresh_catalogue,
+    reload_catalogue,
+    request_reload_catalogue,
+)
+from apps.export import METHODS_EXPORT
+from apps.jobs import JOB_QUEUE
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2018 Colour Developers"
@@ -25,7 +49,23 @@ __maintainer__ = "Colour Developers"
 __email__ = "colour-developers@colour-science.org"
 __status__ = "Production"
 
-__all__ = ["load_app"]
+__all__ = [
+    "ADMIN_TOKEN",
+    "load_app",
+    "asset",
+    "submit_job",
+    "job_state",
+    "job_result",
+    "analytics",
+    "catalogue",
+    "reload_catalogue_endpoint",
+    "cache",
+]
+
+ADMIN_TOKEN: str | None = os.environ.get("COLOUR_DASH_ADMIN_TOKEN")
+"""
+Bearer token of the administration endpoints, they are disabled if *None*.
+"""
 
 APP.layout = Div([Location(id="url", refresh=False), Div(id="apps")])
 
@@ -52,6 +92,18 @@ def load_app(app: dash.Dash) -> Div:
     if app == app_2.APP_PATH:
         return app_2.LAYOUT
 
+    if app == app_3.APP_PATH:
+        return app_3.LAYOUT
+
+    if app == app_4.APP_PATH:
+        return app_4.LAYOUT
+
+    if app == app_5.APP_PATH:
+        return app_5.LAYOUT
+
+    if app == app_6.APP_PATH:
+        return app_6.LAYOUT
+
     return Div(
         [
             P(
@@ -91,9 +143,320 @@ def load_app(app: dash.Dash) -> Div:
                 ]
             ),
             Markdown(app_2.APP_DESCRIPTION.replace("This app c", "C")),
+            H3(
+                [
+                    Link(
+                        app_3.APP_NAME,
+                        href=app_3.APP_PATH,
+                        className="app-link",
+                    )
+                ]
+            ),
+            Markdown(app_3.APP_DESCRIPTION.replace("This app p", "P")),
+            H3(
+                [
+                    Link(
+                        app_4.APP_NAME,
+                        href=app_4.APP_PATH,
+                        className="app-link",
+                    )
+                ]
+            ),
+            Markdown(app_4.APP_DESCRIPTION.replace("This app c", "C")),
+            H3(
+                [
+                    Link(
+                        app_5.APP_NAME,
+                        href=app_5.APP_PATH,
+                        className="app-link",
+                    )
+                ]
+            ),
+            Markdown(app_5.APP_DESCRIPTION.replace("This app p", "P")),
+            H3(
+                [
+                    Link(
+                        app_6.APP_NAME,
+                        href=app_6.APP_PATH,
+                        className="app-link",
+                    )
+                ]
+            ),
+            Markdown(app_6.APP_DESCRIPTION.replace("This app c", "C")),
         ]
     )
 
 
+@SERVER.route(f"{ASSETS_URL_PATH}<filename>")
+def asset(filename: str) -> Response:
+    """
+    Serve given bundled stylesheet or script.
+
+    Parameters
+    ----------
+    filename
+        Fingerprinted filename of the asset.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Asset response.
+    """
+
+    return serve_asset(filename)
+
+
+def _canonical_job_parameters(kind: str, query: Mapping[str, str]) -> Dict:
+    """
+    Return the canonical parameters of given job kind from given URL query.
+    """
+
+    if kind == "LUT3D":
+        return app_1.canonical_LUT_state(query, app_1.LUT_SIZE_MAXIMUM_JOB)
+
+    if kind == "export":
+        method = query.get("method", "json")
+        if method not in METHODS_EXPORT:
+            error = f'"{method}" export method is not supported!'
+
+            raise ValueError(error)
+
+        formatted = query.get("formatted", "false").lower() == "true"
+        if formatted and method != "json":
+            error = "Formatted outputs can only be exported with JSON method!"
+
+            raise ValueError(error)
+
+        return {
+            "method": method,
+            "formatted": formatted,
+            "decimals": canonical_decimals(query.get("decimals", 10)),
+        }
+
+    error = f'"{kind}" job kind is not supported!'
+
+    raise ValueError(error)
+
+
+@SERVER.route("/jobs", methods=["POST"])
+def submit_job() -> Response:
+    """
+    Submit a background job whose kind and parameters are given in the URL
+    query, e.g., ``/jobs?kind=LUT3D&input-colourspace=sRGB&LUT-size=129`` or
+    ``/jobs?kind=export&method=binary``.
+
+    The endpoint is an administration endpoint as the jobs are expensive, the
+    apps submit their own jobs.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Job id, state and result urls.
+    """
+
+    _authorise_admin()
+
+    query = request.args.to_dict()
+    kind = query.pop("kind", "")
+
+    try:
+        job_id = JOB_QUEUE.submit(kind, _canonical_job_parameters(kind, query))
+    except ValueError as error:
+        abort(400, str(error))
+    except RuntimeError as error:
+        abort(503, str(error))
+
+    return (
+        jsonify(
+            {
+                "id": job_id,
+                "state": f"/jobs/{job_id}",
+                "result": f"/jobs/{job_id}/result",
+            }
+        ),
+        202,
+    )
+
+
+@SERVER.route("/jobs/<job_id>")
+def job_state(job_id: str) -> Response:
+    """
+    Return the state of given background job.
+
+    Parameters
+    ----------
+    job_id
+        Job id.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Job state.
+    """
+
+    state = JOB_QUEUE.store.state(job_id)
+    if state is None:
+        abort(404)
+
+    return jsonify(state)
+
+
+@SERVER.route("/jobs/<job_id>/result")
+def job_result(job_id: str) -> Response:
+    """
+    Send the result of given background job.
+
+    Parameters
+    ----------
+    job_id
+        Job id.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Job result.
+    """
+
+    state = JOB_QUEUE.store.state(job_id)
+    if state is None:
+        abort(404)
+
+    if state["status"] != "done":
+        abort(409, f'"{job_id}" job is {state["status"]}!')
+
+    return send_file(
+        JOB_QUEUE.store.result_path(job_id),
+        mimetype=state["mimetype"],
+        as_attachment=True,
+        download_name=state["filename"],
+    )
+
+
+@SERVER.route("/analytics")
+def analytics() -> Response:
+    """
+    Return the most frequently requested states of the apps, their number is
+    given in the URL query, e.g., ``/analytics?top=100``.
+
+    The states can be written as *JSONL* records to precompute their outputs
+    with the :mod:`apps.batch` module. The endpoint is an administration
+    endpoint as the states may disclose the in-house colourspaces.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Total number of requests, estimated request counts and maximum
+        overestimations of the counts of the most frequent states per app.
+    """
+
+    _authorise_admin()
+
+    try:
+        top = max(int(request.args.get("top", 100)), 0)
+    except ValueError:
+        abort(400, '"top" must be an integer!')
+
+    return jsonify(
+        {
+            app: {
+                "total": sketch.total,
+                "states": [
+                    {"state": json.loads(key), "count": count, "error": error}
+                    for key, count, error in sketch.top(top)
+                ],
+            }
+            for app, sketch in ANALYTICS.sketches().items()
+        }
+    )
+
+
+if CATALOGUE_PATH is not None:
+
+    @SERVER.before_request
+    def _refresh_catalogue() -> None:
+        """
+        Reload the catalogue if it was modified or if its reload was requested.
+        """
+
+        refresh_catalogue()
+
+    # The signal only requests the reload which happens before the next
+    # request, it cannot be installed outside of the main thread.
+    with suppress(ValueError):
+        signal.signal(signal.SIGUSR2, lambda *_args: request_reload_catalogue())
+
+
+def _authorise_admin() -> None:
+    """
+    Abort the request if the administration endpoints are disabled or if the
+    request bearer token is not valid.
+    """
+
+    if ADMIN_TOKEN is None:
+        abort(404)
+
+    authorization = request.headers.get("Authorization", "")
+    if not hmac.compare_digest(authorization, f"Bearer {ADMIN_TOKEN}"):
+        abort(401)
+
+
+@SERVER.route("/catalogue")
+def catalogue() -> Response:
+    """
+    Return the state of the catalogue of the in-house *RGB* colourspaces and
+    illuminants.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Catalogue state.
+    """
+
+    _authorise_admin()
+
+    return jsonify(catalogue_state())
+
+
+@SERVER.route("/catalogue/reload", methods=["POST"])
+def reload_catalogue_endpoint() -> Response:
+    """
+    Reload the catalogue of the in-house *RGB* colourspaces and illuminants,
+    the other processes reload it once they notice the catalogue file
+    modification.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        In-house *RGB* colourspaces and illuminants that were added, redefined
+        or removed and catalogue state.
+    """
+
+    _authorise_admin()
+
+    try:
+        changed = reload_catalogue()
+    except ValueError as error:
+        abort(400, str(error))
+
+    return jsonify({"changed": changed, **catalogue_state()})
+
+
+@SERVER.route("/cache")
+def cache() -> Response:
+    """
+    Return the statistics of the cache shared by the apps, e.g., the number of
+    values too large to be cached by the shared memory cache.
+
+    Returns
+    -------
+    :class:`flask.Response`
+        Cache statistics.
+    """
+
+    _authorise_admin()
+
+    return jsonify(CACHE.statistics())
+
+
 if __name__ == "__main__":
     APP.run_server(debug=True)